@@ -0,0 +1,478 @@
+"""
+PublicDataVerification与PublicDataVerificationAsync全部方法的吞吐量基准测试
+
+使用固定随机种子生成合法与不合法各半的输入，在多个数据量下统计每秒处理值数量与单次调用延迟分位数。
+
+运行基准测试并输出结果：
+    python benchmarks/public_benchmark.py --sizes 1000 10000 --output result.json
+与基线对比，吞吐量下降超过阈值的方法视为性能回退，存在回退时以状态码1退出；基线中没有的结果会列出，
+没有任何结果可以对比时（如数据量与基线不同）以状态码2退出：
+    python benchmarks/public_benchmark.py --compare benchmarks/public_baseline.json --threshold 0.3
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import hashlib
+import inspect
+import argparse
+import platform
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_verification import PublicDataVerification, PublicDataVerificationAsync  # noqa: E402
+
+ID_FACTORS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+USCC_WEIGHTS = (31, 29, 23, 19, 17, 13, 11, 7, 5, 3, 31, 29, 23, 19, 17, 13, 11)
+USCC_CHARS = '0123456789ABCDEFGHJKLMNPQRTUWXY'
+DEFAULT_SIZES = (1000, 10000)
+# 正式计时前的预热调用次数
+WARMUP_CALLS = 100
+
+
+def _digits(rng, n):
+    return ''.join(rng.choice('0123456789') for _ in range(n))
+
+
+def gen_id_number(rng, valid):
+    body = _digits(rng, 17)
+    check = '10X98765432'[sum(int(c) * f for c, f in zip(body, ID_FACTORS)) % 11]
+    if not valid:
+        check = rng.choice([c for c in '0123456789X' if c != check])
+    return body + check,
+
+
+def gen_uscc(rng, valid):
+    while True:
+        body = ''.join(rng.choice(USCC_CHARS) for _ in range(17))
+        total = sum((ord(c) - 55 if 'A' <= c <= 'Z' else int(c)) * w for c, w in zip(body, USCC_WEIGHTS)) % 31
+        # 默认校验码映射表只有27位，取模超出范围时重新生成
+        if total < 27:
+            break
+    check = '0ABCDEFGHIJKLMNOPQRSTUVWXYZ'[total]
+    return body + (check if valid else rng.choice([c for c in 'ABCDEFG' if c != check])),
+
+
+def gen_organization_code(rng, valid):
+    body = _digits(rng, 8)
+    mod = sum(int(c) * w for c, w in zip(body, (3, 7, 9, 10, 5, 8, 4, 2))) % 11
+    check = 'X' if mod == 10 else str(mod)
+    return body + (check if valid else rng.choice([c for c in '0123456789X' if c != check])),
+
+
+def gen_email(rng, valid):
+    name = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789._') for _ in range(rng.randint(3, 12)))
+    return (f'{name}@example.com' if valid else f'{name}example.com'),
+
+
+def gen_ipv4(rng, valid):
+    high = 255 if valid else 400
+    return '.'.join(str(rng.randint(0, high)) for _ in range(4 if valid else rng.choice([3, 4]))),
+
+
+def gen_ipv6(rng, valid):
+    parts = [format(rng.randint(0, 0xffff), 'x') for _ in range(8)]
+    if not valid:
+        parts[rng.randrange(8)] = 'g' + parts[0]
+    return ':'.join(parts),
+
+
+def gen_ip_address(rng, valid):
+    return (gen_ipv4 if rng.random() < 0.5 else gen_ipv6)(rng, valid)
+
+
+def gen_mac_address(rng, valid):
+    parts = [format(rng.randint(0, 255), '02X') for _ in range(6 if valid else 5)]
+    return ':'.join(parts),
+
+
+def gen_mobile_number(rng, valid):
+    return (('1' + rng.choice('3456789') + _digits(rng, 9)) if valid else ('1' + rng.choice('012') + _digits(rng, 9))),
+
+
+def gen_fixed_line_number(rng, valid):
+    return (('0' + _digits(rng, 2) + '-' + _digits(rng, 8)) if valid else _digits(rng, rng.choice([3, 5, 13]))),
+
+
+def gen_phone_number(rng, valid):
+    return (gen_mobile_number if rng.random() < 0.5 else gen_fixed_line_number)(rng, valid)
+
+
+def gen_postal_code(rng, valid):
+    return (_digits(rng, 6) if valid else _digits(rng, 5)), 'CN'
+
+
+def gen_division(rng, valid):
+    return (str(rng.randint(11, 65)) + _digits(rng, 4)) if valid else (str(rng.randint(70, 99)) + _digits(rng, 4)),
+
+
+def gen_date(rng, valid):
+    day = datetime(2000, 1, 1) + timedelta(days=rng.randint(0, 10000))
+    return (day.strftime('%Y-%m-%d') if valid else day.strftime('%Y-%m-') + '32'),
+
+
+def gen_datetime(rng, valid):
+    moment = datetime(2000, 1, 1) + timedelta(minutes=rng.randint(0, 10000000))
+    if not valid:
+        moment += timedelta(days=36500)
+    return moment.strftime('%Y-%m-%d %H:%M'), '2000-01-01 00:00', '2020-12-31 23:59', '%Y-%m-%d %H:%M'
+
+
+def gen_time_range(rng, valid):
+    return gen_datetime(rng, valid) + (0,)
+
+
+def gen_timestamp_range(rng, valid):
+    return rng.randint(0, 10 ** 9) if valid else rng.randint(2 * 10 ** 9, 3 * 10 ** 9), 0, 10 ** 9
+
+
+def gen_timestamp(rng, valid):
+    return (str(rng.randint(0, 2 * 10 ** 9)) if valid else 'ts' + _digits(rng, 5)),
+
+
+def gen_timeliness(rng, valid):
+    moment = datetime.now() - timedelta(minutes=rng.randint(0, 30) if valid else rng.randint(120, 1000))
+    return moment.strftime('%Y-%m-%d %H:%M:%S'),
+
+
+def gen_number_range(rng, valid):
+    return (rng.uniform(0, 100) if valid else rng.uniform(101, 200)), 0, 100
+
+
+def gen_precision(rng, valid):
+    return round(rng.uniform(0, 100), 2 if valid else 5),
+
+
+def gen_latitude(rng, valid):
+    return (rng.uniform(-90, 90) if valid else rng.uniform(91, 180)),
+
+
+def gen_longitude(rng, valid):
+    return (rng.uniform(-180, 180) if valid else rng.uniform(181, 360)),
+
+
+def gen_china_latitude(rng, valid):
+    return (rng.uniform(4, 53) if valid else rng.uniform(54, 90)),
+
+
+def gen_china_longitude(rng, valid):
+    return (rng.uniform(73, 135) if valid else rng.uniform(136, 180)),
+
+
+def gen_regex(rng, valid):
+    return (_digits(rng, 6) if valid else 'a' + _digits(rng, 5)), r'^\d{6}$'
+
+
+def gen_compare(rng, valid):
+    a = rng.randint(0, 100)
+    return a, (a + 1 if valid else a - 1), 0
+
+
+def gen_length(rng, valid):
+    return 'x' * rng.randint(0, 20), 10, 0 if valid else 1
+
+
+def gen_hash(rng, valid):
+    data = _digits(rng, 32)
+    digest = hashlib.sha256(data.encode()).hexdigest()
+    return data, (digest if valid else digest[::-1])
+
+
+def gen_decode(rng, valid):
+    return (_digits(rng, 16).encode() if valid else b'\xff\xfe' + _digits(rng, 8).encode()), 'utf-8'
+
+
+def gen_list(rng, valid):
+    items = [_digits(rng, 4) for _ in range(10)]
+    if not valid:
+        items[rng.randrange(10)] = ''
+    return items,
+
+
+def gen_unique(rng, valid):
+    items = [str(i) for i in rng.sample(range(1000), 10)]
+    if not valid:
+        items[0] = items[1]
+    return items,
+
+
+def gen_any(rng, valid):
+    return rng.choice([b'bytes', True, 'text', 1.5, 7, None, ''] if valid else [0, '', None, [], 0.0]),
+
+
+# 单值方法：方法名 -> 参数生成函数，生成函数接收(随机数生成器, 是否合法)并返回参数元组
+SCALAR_CASES = {
+    'verify_id_number': gen_id_number,
+    'verify_uscc': gen_uscc,
+    'verify_cscc': gen_uscc,
+    'verify_organization_code': gen_organization_code,
+    'verify_email_format': gen_email,
+    'verify_ipv4': gen_ipv4,
+    'verify_ipv6': gen_ipv6,
+    'verify_ip_address': gen_ip_address,
+    'verify_mac_address': gen_mac_address,
+    'verify_mobile_number': gen_mobile_number,
+    'verify_fixed_line_number': gen_fixed_line_number,
+    'verify_phone_number': gen_phone_number,
+    'postal_code': gen_postal_code,
+    'province_division_2007': gen_division,
+    'city_division_2007': gen_division,
+    'county_division_2007': gen_division,
+    'division_2007': gen_division,
+    'verify_date': gen_date,
+    'datetime_range': gen_datetime,
+    'time_range': gen_time_range,
+    'timestamp_range': gen_timestamp_range,
+    'verify_timestamp': gen_timestamp,
+    'check_timeliness': gen_timeliness,
+    'number_range': gen_number_range,
+    'check_precision': gen_precision,
+    'verify_latitude': lambda rng, valid: gen_latitude(rng, valid) + (-90, 90),
+    'verify_longitude': lambda rng, valid: gen_longitude(rng, valid) + (-180, 180),
+    'verify_coordinates': lambda rng, valid: (gen_latitude(rng, valid) + (-90, 90) +
+                                              gen_longitude(rng, valid) + (-180, 180)),
+    'verify_china_latitude': gen_china_latitude,
+    'verify_china_longitude': gen_china_longitude,
+    'verify_china_coordinates': lambda rng, valid: gen_china_latitude(rng, valid) + gen_china_longitude(rng, valid),
+    'verify_global_latitude': gen_latitude,
+    'verify_global_longitude': gen_longitude,
+    'verify_global_coordinates': lambda rng, valid: gen_latitude(rng, valid) + gen_longitude(rng, valid),
+    'regex': gen_regex,
+    'verify_compare': gen_compare,
+    'verify_length': gen_length,
+    'compare_hashes': gen_hash,
+    'decode': gen_decode,
+    'empty_in': gen_list,
+    'empty_not_in': gen_list,
+    'is_unique': gen_unique,
+    'is_empty': gen_any,
+    'is_not_empty': gen_any,
+    'is_bytes': gen_any,
+    'is_bool': gen_any,
+    'is_str': gen_any,
+    'is_float': gen_any,
+    'is_int': gen_any,
+}
+# 批量方法：方法名 -> 生成单值输入的方法名，批量方法的第一个参数为单值输入第一个参数组成的列表，其余参数沿用单值输入
+BATCH_CASES = {
+    'verify_id_number_batch': 'verify_id_number',
+    'verify_uscc_batch': 'verify_uscc',
+    'verify_cscc_batch': 'verify_cscc',
+    'verify_organization_code_batch': 'verify_organization_code',
+    'verify_email_format_batch': 'verify_email_format',
+    'postal_code_batch': 'postal_code',
+    'regex_batch': 'regex',
+    'number_range_batch': 'number_range',
+    'verify_date_batch': 'verify_date',
+    'datetime_range_batch': 'datetime_range',
+}
+# 异步批量调度方法，使用verify_id_number作为被调度的检验方法
+DISPATCH_CASES = {'run_batch': 'verify_id_number', 'iter_batch': 'verify_id_number'}
+
+
+def make_inputs(case: str, size: int, seed: int) -> list:
+    """
+    生成合法与不合法各半的参数列表
+    :param case: SCALAR_CASES中的方法名
+    :param size: 参数数量
+    :param seed: 随机种子
+    :return:
+    """
+    rng = random.Random(f'{seed}:{case}:{size}')
+    generator = SCALAR_CASES[case]
+    return [generator(rng, i % 2 == 0) for i in range(size)]
+
+
+def summarize(latencies_ns: list, values_per_call: int) -> dict:
+    """
+    统计吞吐量与延迟分位数，吞吐量按调用耗时中位数计算，减少偶发抖动对对比结果的影响
+    :param latencies_ns: 每次调用耗时（纳秒）
+    :param values_per_call: 每次调用处理的值数量
+    :return:
+    """
+    latencies = np.asarray(latencies_ns, dtype=np.float64)
+    median = float(np.percentile(latencies, 50))
+    return {
+        'values': int(values_per_call * latencies.shape[0]),
+        'calls': int(latencies.shape[0]),
+        'seconds': float(latencies.sum() / 1e9),
+        'values_per_sec': values_per_call * 1e9 / median if median else float('inf'),
+        'p50_us': median / 1e3,
+        'p90_us': float(np.percentile(latencies, 90) / 1e3),
+        'p99_us': float(np.percentile(latencies, 99) / 1e3),
+    }
+
+
+def bench_sync(method: str, size: int, seed: int, repeat: int) -> dict:
+    """对同步方法执行基准测试"""
+    func = getattr(PublicDataVerification, method)
+    perf_counter_ns = time.perf_counter_ns
+    latencies = []
+    if method in BATCH_CASES:
+        inputs = make_inputs(BATCH_CASES[method], size, seed)
+        args = ([item[0] for item in inputs],) + inputs[0][1:]
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            func(*args)
+            latencies.append(perf_counter_ns() - start)
+        return summarize(latencies, size)
+    inputs = make_inputs(method, size, seed)
+    for args in inputs[:WARMUP_CALLS]:
+        func(*args)
+    for args in inputs:
+        start = perf_counter_ns()
+        func(*args)
+        latencies.append(perf_counter_ns() - start)
+    return summarize(latencies, 1)
+
+
+async def bench_async(method: str, size: int, seed: int, repeat: int) -> dict:
+    """对异步方法执行基准测试"""
+    perf_counter_ns = time.perf_counter_ns
+    latencies = []
+    if method in DISPATCH_CASES:
+        verifier = PublicDataVerificationAsync()
+        inputs = make_inputs(DISPATCH_CASES[method], size, seed)
+        values = [item[0] for item in inputs]
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            if method == 'iter_batch':
+                async for _chunk in verifier.iter_batch(DISPATCH_CASES[method], values):
+                    pass
+            else:
+                await verifier.run_batch(DISPATCH_CASES[method], values)
+            latencies.append(perf_counter_ns() - start)
+        return summarize(latencies, size)
+    func = getattr(PublicDataVerificationAsync, method)
+    if method in BATCH_CASES:
+        inputs = make_inputs(BATCH_CASES[method], size, seed)
+        args = ([item[0] for item in inputs],) + inputs[0][1:]
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            await func(*args)
+            latencies.append(perf_counter_ns() - start)
+        return summarize(latencies, size)
+    inputs = make_inputs(method, size, seed)
+    for args in inputs[:WARMUP_CALLS]:
+        await func(*args)
+    for args in inputs:
+        start = perf_counter_ns()
+        await func(*args)
+        latencies.append(perf_counter_ns() - start)
+    return summarize(latencies, 1)
+
+
+def public_methods(cls) -> list:
+    """类的全部公开方法"""
+    return sorted(name for name in dir(cls) if not name.startswith('_') and callable(getattr(cls, name)))
+
+
+def async_methods() -> list:
+    """PublicDataVerificationAsync中的全部协程方法与异步生成器方法"""
+    return [name for name in public_methods(PublicDataVerificationAsync)
+            if inspect.iscoroutinefunction(getattr(PublicDataVerificationAsync, name))
+            or inspect.isasyncgenfunction(getattr(PublicDataVerificationAsync, name))]
+
+
+def check_coverage() -> list:
+    """返回没有基准测试输入的方法，新增方法时需要补充对应输入"""
+    known = set(SCALAR_CASES) | set(BATCH_CASES) | set(DISPATCH_CASES)
+    missing = [f'sync:{name}' for name in public_methods(PublicDataVerification) if name not in known]
+    missing += [f'async:{name}' for name in async_methods() if name not in known]
+    return missing
+
+
+def run(sizes, seed: int = 0, repeat: int = 5, methods=None) -> dict:
+    """
+    执行全部基准测试
+    :param sizes: 数据量列表
+    :param seed: 随机种子
+    :param repeat: 批量方法的重复次数
+    :param methods: 只测试这些方法，默认为全部
+    :return: 以 '模式:方法名:数据量' 为键的结果字典
+    """
+    results = {}
+    sync_methods = [m for m in public_methods(PublicDataVerification) if methods is None or m in methods]
+    coroutine_methods = [m for m in async_methods() if methods is None or m in methods]
+    # 同步调用的输出会干扰计时，基准测试期间屏蔽标准输出
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        for size in sizes:
+            for method in sync_methods:
+                results[f'sync:{method}:{size}'] = bench_sync(method, size, seed, repeat)
+            for method in coroutine_methods:
+                results[f'async:{method}:{size}'] = asyncio.run(bench_async(method, size, seed, repeat))
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    与基线对比吞吐量
+    :param results: 本次结果
+    :param baseline: 基线结果
+    :param threshold: 允许的吞吐量下降比例
+    :return: (性能回退列表，每项为(键, 基线吞吐量, 本次吞吐量, 变化比例), 基线中没有的结果键列表)
+    """
+    regressions, missing = [], []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            missing.append(key)
+            continue
+        change = current['values_per_sec'] / previous['values_per_sec'] - 1
+        if change < -threshold:
+            regressions.append((key, previous['values_per_sec'], current['values_per_sec'], change))
+    return regressions, missing
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='PublicDataVerification throughput benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='数据量列表')
+    parser.add_argument('--seed', type=int, default=0, help='随机种子')
+    parser.add_argument('--repeat', type=int, default=5, help='批量方法的重复次数')
+    parser.add_argument('--methods', nargs='+', help='只测试这些方法')
+    parser.add_argument('--output', help='结果JSON文件路径，可作为新的基线')
+    parser.add_argument('--compare', help='基线JSON文件路径')
+    parser.add_argument('--threshold', type=float, default=0.3, help='视为性能回退的吞吐量下降比例，默认0.3')
+    args = parser.parse_args(argv)
+
+    missing = check_coverage()
+    if missing:
+        print(f'Methods without benchmark inputs: {", ".join(missing)}')
+        return 2
+    results = run(args.sizes, args.seed, args.repeat, args.methods)
+    for key, item in results.items():
+        print(f'{key:<50} {item["values_per_sec"]:>14,.0f} values/s  p50 {item["p50_us"]:>10.2f}us  '
+              f'p90 {item["p90_us"]:>10.2f}us  p99 {item["p99_us"]:>10.2f}us')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': {'python': platform.python_version(), 'machine': platform.machine(),
+                                'seed': args.seed, 'sizes': args.sizes, 'repeat': args.repeat},
+                       'results': results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions, missing = compare(results, baseline, args.threshold)
+        for key in missing:
+            print(f'NOT IN BASELINE {key}')
+        for key, previous, current, change in regressions:
+            print(f'REGRESSION {key}: {previous:,.0f} -> {current:,.0f} values/s ({change:+.1%})')
+        if regressions:
+            return 1
+        if len(missing) == len(results):
+            print(f'No results could be compared against {args.compare}, check --sizes and --methods')
+            return 2
+        print(f'No regressions beyond {args.threshold:.0%} against {args.compare}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
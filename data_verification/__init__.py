@@ -1,2 +1,3 @@
 from data_verification.gather import PublicDataVerification, PublicDataVerificationAsync
-from data_verification.gather import GeoDataValidator, GeoDataValidatorAsync
+from data_verification.gather import Schema, StreamValidator, ParallelExecutor
+from data_verification.gather import GeoDataValidator, GeoDataValidatorAsync, GeoParallelExecutor
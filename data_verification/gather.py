@@ -12,7 +12,7 @@ class PublicDataVerification(Regex, SCC, Number, Email, IDNumber, Organization,
 class PublicDataVerificationAsync(RegexAsync, SCCAsync, NumberAsync, EmailAsync, IDNumberAsync, OrganizationAsync,
                                   TimeAsync, CompareAsync, VerifyTypeAsync, CoordinatesAsync, IPAddressAsync,
                                   EmptyAsync, PhoneNumberAsync, AdminDivisionAsync, DecodeAsync, PostalAsync,
-                                  UniqueAsync):
+                                  UniqueAsync, BatchAsync):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -30,11 +30,11 @@ class GeoDataValidator:
     def __init__(self, file_path: str, validator_type: str, boundary_file_path: str = None):
         """
         综合地理数据位置合理性验证
-        :param file_path: 地理数据shp文件路径
+        :param file_path: 地理数据文件路径，或GeoDataFrame、GeoSeries、shapely几何对象数组
         :param validator_type: 验证器类型，如 'point_data':矢量点数据位置合理性, 'line_data':矢量线数据位置合理性,
             'polygon_data':矢量面数据位置合理性, 'point_topology':点拓扑规则合理性, 'line_topology':线拓扑规则合理性,
             'polygon_topology':面拓扑规则合理性
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         if validator_type not in self.VALIDATOR_TYPES:
             raise ValueError(
@@ -67,7 +67,7 @@ class GeoDataValidator:
         if isinstance(self.validator, PointDataValidator):
             return self.validator.check_point_data_validity(**kwargs)
         elif isinstance(self.validator, LineDataValidator):
-            return self.validator.check_line_data_validity()
+            return self.validator.check_line_data_validity(**kwargs)
         elif isinstance(self.validator, PolygonDataValidator):
             return self.validator.check_polygon_data_validity(**kwargs)
 
@@ -82,6 +82,19 @@ class GeoDataValidator:
         elif isinstance(self.validator, PolygonTopologyValidator):
             return self.validator.check_polygon_topology_validity(**kwargs)
 
+    def validity_report(self, **kwargs):
+        """
+        执行全部检查并统计每项检查的违规数量和耗时。
+        :param kwargs: 传递给具体检查方法的关键字参数。
+        :return: 以检查名为索引，包含passed、violations、seconds列的DataFrame
+        """
+        return self.validator.validity_report(**kwargs)
+
+    def _specific_method_name(self, suffix: str = '') -> str:
+        """特定要素检查方法名，如 PolygonTopologyValidator 对应 check_specific_polygon"""
+        name = self.validator.__class__.__name__.replace('TopologyValidator', '').replace('DataValidator', '')
+        return f'check_specific_{name.lower()}{suffix}'
+
     def check_specific_validity(self, index: int, **kwargs):
         """
         检查特定地理要素的位置合理性和拓扑规则。
@@ -90,14 +103,14 @@ class GeoDataValidator:
         :return:
         """
         if isinstance(self.validator, (PointDataValidator, LineDataValidator, PolygonDataValidator)):
-            method_name = f'check_specific_{self.validator.__class__.__name__.lower().replace("validator", "")}'
+            method_name = self._specific_method_name()
             method = getattr(self.validator, method_name, None)
             if method:
                 return method(index, **kwargs)
             else:
                 raise AttributeError(f"Method {method_name} not found in {self.validator.__class__.__name__}")
         elif isinstance(self.validator, (PointTopologyValidator, LineTopologyValidator, PolygonTopologyValidator)):
-            method_name = f'check_specific_{self.validator.__class__.__name__.lower().replace("validator", "")}'
+            method_name = self._specific_method_name()
             method = getattr(self.validator, method_name, None)
             if method:
                 return method(index, **kwargs)
@@ -106,31 +119,144 @@ class GeoDataValidator:
         else:
             raise ValueError("Unknown validator type")
 
+    def check_specific_validity_batch(self, indices, **kwargs):
+        """
+        批量检查特定地理要素的位置合理性和拓扑规则，空间索引和重复点索引只构建一次。
+        :param indices: 要检查的要素索引序列。
+        :param kwargs: 传递给具体检查方法的关键字参数。
+        :return: 以要素索引为索引的DataFrame，每列为一项检查结果，valid列为综合结果
+        """
+        method_name = self._specific_method_name('_batch')
+        method = getattr(self.validator, method_name, None)
+        if method:
+            return method(indices, **kwargs)
+        else:
+            raise AttributeError(f"Method {method_name} not found in {self.validator.__class__.__name__}")
+
+
+def validate_file(file_path, validator_type: str, boundary_file_path=None, kwargs: dict = None):
+    """
+    加载并检查一个地理数据文件，供执行器执行，使用ProcessPoolExecutor时需为模块级函数
+    :param file_path: 地理数据文件路径，或GeoDataFrame、GeoSeries、shapely几何对象数组
+    :param validator_type: 验证器类型
+    :param boundary_file_path: 边界多边形文件地址（可选）
+    :param kwargs: 传递给check_validity的关键字参数
+    :return:
+    """
+    return GeoDataValidator(file_path, validator_type, boundary_file_path).check_validity(**(kwargs or {}))
+
 
 class GeoDataValidatorAsync(GeoDataValidator):
     def __init__(self, file_path: str, validator_type: str, boundary_file_path: str = None):
         super().__init__(file_path, validator_type, boundary_file_path)
 
+    @classmethod
+    async def create(cls, file_path, validator_type: str, boundary_file_path=None, executor=None):
+        """
+        异步创建验证器，在执行器中加载图层和边界，避免读取文件时阻塞事件循环
+        :param file_path: 地理数据文件路径，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param validator_type: 验证器类型
+        :param boundary_file_path: 边界多边形文件地址（可选）
+        :param executor: 加载图层的执行器，默认为事件循环的默认线程池；使用ProcessPoolExecutor时加载的验证器需序列化传回，
+            且不共享当前进程的图层和边界缓存，建议使用线程池
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        # 直接传入类而不是闭包，ProcessPoolExecutor可以序列化
+        return await loop.run_in_executor(executor, cls, file_path, validator_type, boundary_file_path)
+
+    @classmethod
+    async def iter_validity(cls, file_paths, validator_type: str, boundary_file_path=None, max_concurrency: int = 4,
+                            executor=None, return_exceptions: bool = False, **kwargs):
+        """
+        并发检查多个地理数据文件，每个文件的加载和检查作为一个任务交给执行器，完成后立即产出，
+        同一时间最多max_concurrency个文件在执行
+        :param file_paths: 地理数据文件路径（或内存图层）的可迭代对象
+        :param validator_type: 验证器类型
+        :param boundary_file_path: 所有文件共用的边界多边形文件地址（可选）
+        :param max_concurrency: 同时检查的文件数上限
+        :param executor: 执行检查的执行器，默认为事件循环的默认线程池；CPU密集的检查建议传入ProcessPoolExecutor
+        :param return_exceptions: 为 True 时单个文件检查出错产出异常对象作为结果，为 False 时直接抛出，默认为 False
+        :param kwargs: 传递给check_validity的关键字参数
+        :return: 异步生成器，按完成顺序产出(文件在输入中的序号, 文件路径, 检查结果)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        loop = asyncio.get_running_loop()
+        tasks = {}
+
+        def finished(done):
+            for task in done:
+                number, file_path = tasks.pop(task)
+                try:
+                    yield number, file_path, task.result()
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    yield number, file_path, error
+
+        try:
+            for number, file_path in enumerate(file_paths):
+                # 限制已创建的任务数量，避免一次性为所有文件创建任务
+                while len(tasks) >= max_concurrency:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for item in finished(done):
+                        yield item
+                future = loop.run_in_executor(executor, validate_file, file_path, validator_type, boundary_file_path,
+                                              kwargs)
+                tasks[asyncio.ensure_future(future)] = (number, file_path)
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for item in finished(done):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @classmethod
+    async def run_validity(cls, file_paths, validator_type: str, boundary_file_path=None, max_concurrency: int = 4,
+                           executor=None, return_exceptions: bool = False, **kwargs) -> list:
+        """
+        并发检查多个地理数据文件并按输入顺序返回结果
+        :param file_paths: 地理数据文件路径（或内存图层）的可迭代对象
+        :param validator_type: 验证器类型
+        :param boundary_file_path: 所有文件共用的边界多边形文件地址（可选）
+        :param max_concurrency: 同时检查的文件数上限
+        :param executor: 执行检查的执行器，默认为事件循环的默认线程池
+        :param return_exceptions: 为 True 时单个文件检查出错以异常对象作为结果，为 False 时直接抛出，默认为 False
+        :param kwargs: 传递给check_validity的关键字参数
+        :return: 与输入等长的检查结果列表
+        """
+        results = {}
+        async for number, _, result in cls.iter_validity(file_paths, validator_type, boundary_file_path,
+                                                         max_concurrency, executor, return_exceptions, **kwargs):
+            results[number] = result
+        return [results[number] for number in range(len(results))]
+
     async def check_validity(self, **kwargs):
         loop = asyncio.get_event_loop()
         if isinstance(self.validator, (PointDataValidator, LineDataValidator, PolygonDataValidator)):
-            return await loop.run_in_executor(None, self._check_data_validity, kwargs)
+            return await loop.run_in_executor(None, lambda: self._check_data_validity(**kwargs))
         elif isinstance(self.validator, (PointTopologyValidator, LineTopologyValidator, PolygonTopologyValidator)):
-            return await loop.run_in_executor(None, self._check_topology_validity, kwargs)
+            return await loop.run_in_executor(None, lambda: self._check_topology_validity(**kwargs))
         else:
             raise ValueError("Unknown validator type")
 
+    async def validity_report(self, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: self.validator.validity_report(**kwargs))
+
     async def check_specific_validity(self, index: int, **kwargs):
         loop = asyncio.get_event_loop()
         if isinstance(self.validator, (PointDataValidator, LineDataValidator, PolygonDataValidator)):
-            method_name = f'check_specific_{self.validator.__class__.__name__.lower().replace("validator", "")}'
+            method_name = self._specific_method_name()
             method = getattr(self.validator, method_name, None)
             if method:
                 return await loop.run_in_executor(None, lambda: method(index, **kwargs))
             else:
                 raise AttributeError(f"Method {method_name} not found in {self.validator.__class__.__name__}")
         elif isinstance(self.validator, (PointTopologyValidator, LineTopologyValidator, PolygonTopologyValidator)):
-            method_name = f'check_specific_{self.validator.__class__.__name__.lower().replace("validator", "")}'
+            method_name = self._specific_method_name()
             method = getattr(self.validator, method_name, None)
             if method:
                 return await loop.run_in_executor(None, lambda: method(index, **kwargs))
@@ -138,3 +264,12 @@ class GeoDataValidatorAsync(GeoDataValidator):
                 raise AttributeError(f"Method {method_name} not found in {self.validator.__class__.__name__}")
         else:
             raise ValueError("Unknown validator type")
+
+    async def check_specific_validity_batch(self, indices, **kwargs):
+        loop = asyncio.get_event_loop()
+        method_name = self._specific_method_name('_batch')
+        method = getattr(self.validator, method_name, None)
+        if method:
+            return await loop.run_in_executor(None, lambda: method(indices, **kwargs))
+        else:
+            raise AttributeError(f"Method {method_name} not found in {self.validator.__class__.__name__}")
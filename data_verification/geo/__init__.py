@@ -1,3 +1,8 @@
 from data_verification.geo.geo import PointTopologyValidator, PointDataValidator
 from data_verification.geo.geo import PolygonDataValidator, PolygonTopologyValidator
 from data_verification.geo.geo import LineDataValidator, LineTopologyValidator
+from data_verification.geo.layer import LayerCache, LAYER_CACHE, load_layer, as_layer
+from data_verification.geo.boundary import BoundaryIndex
+from data_verification.geo.tiled import TiledValidator
+from data_verification.geo.parallel import GeoParallelExecutor
+from data_verification.geo.incremental import IncrementalValidator
@@ -0,0 +1,112 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+
+from data_verification.geo.layer import load_layer, as_layer
+from data_verification.geo.topology import as_geometry_array
+
+# 进程内缓存的边界索引数量上限
+BOUNDARY_CACHE_SIZE = 8
+
+
+class BoundaryIndex:
+    # 按文件路径缓存的边界索引，同一边界文件在进程内只加载和合并一次；文件修改时间或大小变化时替换该路径的旧索引，
+    # 超出cache_size时按最近最少使用淘汰
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+    cache_size = BOUNDARY_CACHE_SIZE
+
+    def __init__(self, boundary_polygons):
+        """
+        边界索引，缓存边界多边形的合并结果并预处理（prepare），供各验证器重复进行包含判断，
+        各验证器的边界检查共享同一索引，多次检查只合并一次
+        :param boundary_polygons: 边界多边形GeoDataFrame
+        """
+        self.boundary_polygons = boundary_polygons
+        self._union = None
+        self._union_lock = threading.Lock()
+
+    def __getstate__(self):
+        """序列化时不包含锁和合并结果，便于在ProcessPoolExecutor中传递"""
+        return {'boundary_polygons': self.boundary_polygons}
+
+    def __setstate__(self, state):
+        self.__init__(state['boundary_polygons'])
+
+    @classmethod
+    def from_file(cls, boundary_file_path: str):
+        """
+        从边界文件获取边界索引，文件未变化时返回缓存的同一个索引；URL等非本地路径每次重新构建索引
+        :param boundary_file_path: 边界多边形shp文件地址
+        :return:
+        """
+        if not os.path.exists(boundary_file_path):
+            return cls(load_layer(boundary_file_path))
+        stat = os.stat(boundary_file_path)
+        path, signature = os.path.abspath(boundary_file_path), (stat.st_mtime_ns, stat.st_size)
+        with cls._lock:
+            entry = cls._cache.get(path)
+            if entry is not None and entry[0] == signature:
+                cls._cache.move_to_end(path)
+                return entry[1]
+        index = cls(load_layer(boundary_file_path))
+        with cls._lock:
+            entry = cls._cache.get(path)
+            # 其他线程已加载同一版本时使用已缓存的索引
+            if entry is not None and entry[0] == signature:
+                index = entry[1]
+            cls._cache[path] = (signature, index)
+            cls._cache.move_to_end(path)
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return index
+
+    @classmethod
+    def from_source(cls, boundary):
+        """
+        获取边界索引，文件路径通过from_file缓存；GeoDataFrame、GeoSeries或几何对象数组直接构建索引，不复制几何对象
+        :param boundary: 边界多边形文件地址、BoundaryIndex，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :return: 边界索引，boundary为None或空字符串时返回None
+        """
+        if isinstance(boundary, cls):
+            return boundary
+        if isinstance(boundary, (str, os.PathLike)) and boundary:
+            return cls.from_file(boundary)
+        boundary_polygons = as_layer(boundary)
+        return None if boundary_polygons is None else cls(boundary_polygons)
+
+    @classmethod
+    def clear_cache(cls):
+        """清空边界索引缓存"""
+        with cls._lock:
+            cls._cache.clear()
+
+    @property
+    def union(self):
+        """边界多边形的合并结果，首次访问时计算并预处理"""
+        if self._union is None:
+            with self._union_lock:
+                if self._union is None:
+                    union = shapely.union_all(as_geometry_array(self.boundary_polygons))
+                    shapely.prepare(union)
+                    self._union = union
+        return self._union
+
+    def within(self, geometries) -> np.ndarray:
+        """
+        判断几何对象是否位于边界内
+        :param geometries: 几何对象集合
+        :return: 布尔数组
+        """
+        return shapely.contains(self.union, as_geometry_array(geometries))
+
+    def all_within(self, geometries) -> bool:
+        """
+        判断几何对象是否全部位于边界内
+        :param geometries: 几何对象集合
+        :return:
+        """
+        return bool(self.within(geometries).all())
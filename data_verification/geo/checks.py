@@ -0,0 +1,40 @@
+import time
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+
+class ValidityChecks(ABC):
+    @abstractmethod
+    def _validity_checks(self, **options) -> list:
+        """
+        按开销从小到大排列的检查列表，由各验证器实现
+        :param options: 与对应的整体检查方法一致的检查选项
+        :return: (检查名, 判断是否通过的函数, 统计违规数量的函数) 列表
+        """
+
+    def _run_validity_checks(self, fail_fast: bool = True, **options) -> bool:
+        """
+        执行全部检查
+        :param fail_fast: 是否在任一检查不通过时立即返回，不再执行开销更大的检查
+        :param options: 与对应的整体检查方法一致的检查选项
+        :return:
+        """
+        checks = self._validity_checks(**options)
+        if fail_fast:
+            return all(passed() for _, passed, _ in checks)
+        return all([passed() for _, passed, _ in checks])
+
+    def validity_report(self, **options) -> pd.DataFrame:
+        """
+        执行全部检查并统计每项检查的违规数量和耗时
+        :param options: 与对应的整体检查方法一致的检查选项，如 allow_holes、check_within_boundaries
+        :return: 以检查名为索引，包含passed、violations、seconds列的DataFrame，按执行顺序排列
+        """
+        rows = []
+        for name, _, count in self._validity_checks(**options):
+            start = time.perf_counter()
+            violations = int(count())
+            rows.append({'check': name, 'passed': violations == 0, 'violations': violations,
+                         'seconds': time.perf_counter() - start})
+        return pd.DataFrame(rows, columns=['check', 'passed', 'violations', 'seconds']).set_index('check')
@@ -1,156 +1,207 @@
+import numpy as np
+import pandas as pd
+import shapely
 import geopandas as gpd
-from shapely.ops import unary_union
-from shapely.geometry import MultiPoint, Point, LineString
 
+from data_verification.geo.topology import line_intersection_pairs, polygon_overlap_pairs, dangling_nodes
+from data_verification.geo.topology import nearest_lines, as_geometry_array, line_intersection_flags
+from data_verification.geo.topology import polygon_overlap_flags, polygon_gap_flags, hole_flags, duplicate_flags
+from data_verification.geo.topology import has_line_intersection, has_polygon_overlap, coverage_gaps
+from data_verification.geo.checks import ValidityChecks
+from data_verification.geo.boundary import BoundaryIndex
+from data_verification.geo.layer import as_layer
 
-class LineDataValidator:
+
+def _nearest_lines_frame(points, lines, max_distance=None):
+    """将最近线查询结果整理为以点索引为索引的DataFrame"""
+    positions, distances = nearest_lines(points.geometry, lines.geometry, max_distance)
+    found = positions >= 0
+    line_ids = pd.Series(lines.index.to_numpy()[positions[found]], index=points.index[found]).reindex(points.index)
+    return pd.DataFrame({'line_id': line_ids, 'distance': distances}, index=points.index)
+
+
+def _gap_frame(polygons, tree=None):
+    """将空隙查询结果整理为GeoDataFrame，neighbours列为与空隙相邻的面索引列表"""
+    gaps, pairs = coverage_gaps(polygons.geometry, tree)
+    labels = polygons.index.to_numpy()
+    neighbours = [labels[pairs[pairs[:, 0] == number, 1]].tolist() for number in range(gaps.shape[0])]
+    return gpd.GeoDataFrame({'area': shapely.area(gaps), 'neighbours': neighbours}, geometry=gaps, crs=polygons.crs)
+
+
+def _count_outside(boundary_index, geometries):
+    """统计不在边界内的要素数量，没有提供边界时为0"""
+    if boundary_index is None:
+        return 0
+    return int((~boundary_index.within(geometries)).sum())
+
+
+def _as_positions(indices, size):
+    """将要素位置索引（支持负数）转为位置数组，超出范围时抛出IndexError"""
+    return np.arange(size)[np.atleast_1d(np.asarray(indices, dtype=np.int64))]
+
+
+class LineDataValidator(ValidityChecks):
     def __init__(self, line_file_path: str, boundary_file_path: str = None):
         """
         矢量线数据位置合理性验证
-        :param line_file_path: 线数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param line_file_path: 线数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载线数据
-        self.lines = gpd.read_file(line_file_path)
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
+        self.lines = as_layer(line_file_path)
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
         return self.lines.is_valid.all()
 
+    def find_dangling_nodes(self, tolerance=0.0):
+        """
+        查找悬挂节点，端点坐标按哈希计数，只被一条线使用的端点为悬挂节点
+        :param tolerance: 捕捉容差，大于0时端点先吸附到边长为tolerance的网格再计数，默认为 0.0 表示坐标完全相同才视为同一节点
+        :return: (悬挂节点坐标 n x 2 数组, 所属线的索引数组)
+        """
+        coordinates, owners = dangling_nodes(self.lines.geometry, tolerance)
+        return coordinates, self.lines.index.to_numpy()[owners]
+
     def _find_dangling_nodes(self):
         """查找悬挂节点"""
-        endpoints = [geom.boundary for geom in self.lines.geometry if not geom.is_empty]
-        if endpoints:
-            all_points = MultiPoint([pt for line in endpoints for pt in line])
-            points_counts = {pt: sum(pt.equals(other) for other in all_points) for pt in all_points}
-            dangling_nodes = [pt for pt, count in points_counts.items() if count == 1]
-            return len(dangling_nodes) > 0
-        else:
-            return False
+        coordinates, _ = dangling_nodes(self.lines.geometry)
+        return len(coordinates) > 0
+
+    def find_line_intersections(self):
+        """
+        基于空间索引查找存在不必要相交的线，只对外包矩形相交的候选线对计算交集
+        :return: n x 2 的数组，每行为一对相交线的索引
+        """
+        pairs = line_intersection_pairs(self.lines.geometry)
+        return self.lines.index.to_numpy()[pairs]
 
     def _check_line_intersections(self):
-        """检查不必要的线间相交"""
-        intersections = []
-        for i, line_a in self.lines.iterrows():
-            for j, line_b in self.lines.iterrows():
-                if i < j:  # 避免重复比较
-                    intersection = line_a.geometry.intersection(line_b.geometry)
-                    if not intersection.is_empty and not isinstance(intersection, (Point)):
-                        intersections.append(intersection)
-        return len(intersections) > 0
+        """检查不必要的线间相交，找到第一对后立即返回"""
+        return has_line_intersection(self.lines.geometry)
 
     def _check_lines_within_boundaries(self):
         """检查所有线是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        lines_within = self.lines.within(boundary_union)
-        return lines_within.all()
-
-    def check_line_data_validity(self) -> bool:
+        return self.boundary_index.all_within(self.lines.geometry)
+
+    def _validity_checks(self) -> list:
+        """几何有效性、边界、悬挂节点、线间相交，按开销从小到大排列"""
+        return [
+            ('geometry_validity', self._check_geometry_validity, lambda: (~self.lines.is_valid).sum()),
+            ('within_boundaries', self._check_lines_within_boundaries,
+             lambda: _count_outside(self.boundary_index, self.lines.geometry)),
+            ('dangling_nodes', lambda: not self._find_dangling_nodes(),
+             lambda: len(dangling_nodes(self.lines.geometry)[0])),
+            ('line_intersections', lambda: not self._check_line_intersections(),
+             lambda: len(line_intersection_pairs(self.lines.geometry))),
+        ]
+
+    def check_line_data_validity(self, fail_fast=True) -> bool:
         """
         检查矢量线数据的位置合理性。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_dangling_nodes = self._find_dangling_nodes()
-        has_unnecessary_intersections = self._check_line_intersections()
-        within_boundaries = self._check_lines_within_boundaries()
         # 如果几何有效、没有悬挂节点、没有不必要的交叉且在边界内，则认为数据合理
-        is_valid = geometry_valid and not has_dangling_nodes and not has_unnecessary_intersections and within_boundaries
+        return self._run_validity_checks(fail_fast)
 
-        return is_valid
 
-
-class PolygonDataValidator:
+class PolygonDataValidator(ValidityChecks):
     def __init__(self, polygon_file_path, boundary_file_path=None):
         """
         矢量面数据位置合理性验证
-        :param polygon_file_path: 面数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param polygon_file_path: 面数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载面数据
-        self.polygons = gpd.read_file(polygon_file_path)
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
+        self.polygons = as_layer(polygon_file_path)
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
         return self.polygons.is_valid.all()
 
+    def find_overlaps(self):
+        """
+        基于空间索引查找内部相交的多边形，只共享边界的相邻多边形不视为重叠
+        :return: n x 2 的数组，每行为一对重叠多边形的索引
+        """
+        pairs = polygon_overlap_pairs(self.polygons.geometry)
+        return self.polygons.index.to_numpy()[pairs]
+
     def _check_overlap(self):
-        """检查多边形之间的重叠情况"""
-        overlaps = []
-        for i, poly_a in self.polygons.iterrows():
-            for j, poly_b in self.polygons.iterrows():
-                if i < j:  # 避免重复比较
-                    intersection = poly_a.geometry.intersection(poly_b.geometry)
-                    if not intersection.is_empty and not isinstance(intersection, (Point, LineString)):
-                        overlaps.append(intersection)
-        return len(overlaps) > 0
-
-    def _check_gaps(self):
-        """检查多边形之间的空隙情况（适用于需要连续覆盖的情况）"""
-        unioned_polygon = unary_union(self.polygons.geometry)
-        boundary = unioned_polygon.boundary
-        # 如果边界为空，则说明没有空隙（所有多边形连成一片）
-        return not boundary.is_empty
+        """检查多边形之间的重叠情况，找到第一对后立即返回"""
+        return has_polygon_overlap(self.polygons.geometry)
+
+    def find_gaps(self):
+        """
+        基于共享边分析查找多边形之间的空隙（包括狭长的缝隙），不合并整个图层
+        :return: 空隙GeoDataFrame，包含area（面积）和neighbours（相邻多边形的索引列表）列
+        """
+        return _gap_frame(self.polygons)
+
+    def _check_gaps(self, allow_holes=False):
+        """检查多边形之间的空隙情况（适用于需要连续覆盖的情况），允许孔洞时多边形自身的孔洞不视为空隙"""
+        return len(coverage_gaps(self.polygons.geometry, allow_holes=allow_holes)[0]) > 0
 
     def _check_holes(self):
         """检查多边形内部是否存在孔洞（取决于应用需求）"""
-        holes_exist = any(not poly.is_empty and poly.interiors for poly in self.polygons.geometry)
-        return holes_exist
+        return bool(hole_flags(self.polygons.geometry).any())
 
     def _check_within_boundaries(self):
         """检查所有多边形是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        polygons_within = self.polygons.within(boundary_union)
-        return polygons_within.all()
-
-    def check_polygon_data_validity(self, allow_holes=False) -> bool:
+        return self.boundary_index.all_within(self.polygons.geometry)
+
+    def _validity_checks(self, allow_holes=False) -> list:
+        """几何有效性、孔洞、边界、重叠、空隙，按开销从小到大排列"""
+        checks = [('geometry_validity', self._check_geometry_validity, lambda: (~self.polygons.is_valid).sum())]
+        if not allow_holes:
+            checks.append(('holes', lambda: not self._check_holes(),
+                           lambda: hole_flags(self.polygons.geometry).sum()))
+        checks += [
+            ('within_boundaries', self._check_within_boundaries,
+             lambda: _count_outside(self.boundary_index, self.polygons.geometry)),
+            ('overlaps', lambda: not self._check_overlap(),
+             lambda: len(polygon_overlap_pairs(self.polygons.geometry))),
+            ('gaps', lambda: not self._check_gaps(allow_holes),
+             lambda: len(coverage_gaps(self.polygons.geometry, allow_holes=allow_holes)[0])),
+        ]
+        return checks
+
+    def check_polygon_data_validity(self, allow_holes=False, fail_fast=True) -> bool:
         """
         检查矢量面数据的位置合理性。
         :param allow_holes: 是否允许多边形内存在孔洞，默认为 False。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_overlaps = self._check_overlap()
-        has_gaps = self._check_gaps()
-        has_unwanted_holes = self._check_holes() and not allow_holes
-        within_boundaries = self._check_within_boundaries()
         # 如果几何有效、没有重叠、没有空隙、没有不希望出现的孔洞且在边界内，则认为数据合理
-        is_valid = geometry_valid and not has_overlaps and not has_gaps and not has_unwanted_holes and within_boundaries
-        return is_valid
+        return self._run_validity_checks(fail_fast, allow_holes=allow_holes)
 
 
-class PointDataValidator:
+class PointDataValidator(ValidityChecks):
     def __init__(self, point_file_path: str, boundary_file_path: str = None):
         """
         矢量点数据位置合理性验证
-        :param point_file_path: 点数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param point_file_path: 点数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载点数据
-        self.points = gpd.read_file(point_file_path)
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
+        self.points = as_layer(point_file_path)
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
@@ -158,109 +209,148 @@ class PointDataValidator:
 
     def _check_duplicates(self):
         """检查是否存在重复点"""
-        unique_points = self.points.drop_duplicates(subset=['geometry'])
-        return len(unique_points) != len(self.points)
+        return bool(duplicate_flags(self.points.geometry).any())
 
     def _check_within_boundaries(self):
         """检查所有点是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        points_within = self.points.within(boundary_union)
-        return points_within.all()
+        return self.boundary_index.all_within(self.points.geometry)
+
+    def find_nearest_lines(self, line_file_path, max_distance=None):
+        """
+        基于空间索引查找每个点最近的线及距离
+        :param line_file_path: 线数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param max_distance: 最大搜索距离，超出距离的点视为没有最近线，默认为None表示不限制
+        :return: 以点索引为索引，包含line_id（最近线索引，没有时为空）和distance（距离，没有时为inf）列的DataFrame
+        """
+        lines = as_layer(line_file_path, geometry_only=True)
+        return _nearest_lines_frame(self.points, lines, max_distance)
 
     def _check_proximity_to_lines(self, line_file_path, max_distance=0.0):
         """检查点与线的距离是否在允许范围内（可选）"""
-        lines = gpd.read_file(line_file_path)
-        distances = self.points.geometry.apply(lambda point: min(lines.distance(point)))
-        return (distances <= max_distance).all()
-
-    def check_point_data_validity(self, check_within_boundaries=True, line_file_path=None, max_distance=0.0) -> bool:
+        lines = as_layer(line_file_path, geometry_only=True)
+        _, distances = nearest_lines(self.points.geometry, lines.geometry, max_distance)
+        return bool((distances <= max_distance).all())
+
+    def _count_far_from_lines(self, line_file_path, max_distance=0.0):
+        """统计与线的距离超出允许范围的点数量"""
+        lines = as_layer(line_file_path, geometry_only=True)
+        _, distances = nearest_lines(self.points.geometry, lines.geometry, max_distance)
+        return int((distances > max_distance).sum())
+
+    def _validity_checks(self, check_within_boundaries=True, line_file_path=None, max_distance=0.0) -> list:
+        """几何有效性、重复点、边界、点到线距离，按开销从小到大排列"""
+        checks = [
+            ('geometry_validity', self._check_geometry_validity, lambda: (~self.points.is_valid).sum()),
+            ('duplicates', lambda: not self._check_duplicates(), lambda: duplicate_flags(self.points.geometry).sum()),
+        ]
+        if check_within_boundaries:
+            checks.append(('within_boundaries', self._check_within_boundaries,
+                           lambda: _count_outside(self.boundary_index, self.points.geometry)))
+        lines = as_layer(line_file_path, geometry_only=True)
+        if lines is not None:
+            checks.append(('proximity_to_lines', lambda: self._check_proximity_to_lines(lines, max_distance),
+                           lambda: self._count_far_from_lines(lines, max_distance)))
+        return checks
+
+    def check_point_data_validity(self, check_within_boundaries=True, line_file_path=None, max_distance=0.0,
+                                  fail_fast=True) -> bool:
         """
         检查矢量点数据的位置合理性。
         :param check_within_boundaries: 是否检查点是否位于边界内，默认为 True。
-        :param line_file_path: 用于检查点到线距离的线数据文件路径（可选）。
+        :param line_file_path: 用于检查点到线距离的线数据文件路径，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）。
         :param max_distance: 允许的最大距离，单位与坐标系一致，默认为 0.0 表示必须重合。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_duplicates = self._check_duplicates()
-        within_boundaries = self._check_within_boundaries() if check_within_boundaries else True
-        proximity_to_lines = True
-        if line_file_path:
-            proximity_to_lines = self._check_proximity_to_lines(line_file_path, max_distance)
         # 如果几何有效、没有重复点、都在边界内且与线的距离合理，则认为数据合理
-        is_valid = geometry_valid and not has_duplicates and within_boundaries and proximity_to_lines
-        return is_valid
+        return self._run_validity_checks(fail_fast, check_within_boundaries=check_within_boundaries,
+                                         line_file_path=line_file_path, max_distance=max_distance)
 
 
-class LineTopologyValidator:
+class LineTopologyValidator(ValidityChecks):
     def __init__(self, line_file_path, boundary_file_path=None):
         """
         线拓扑规则合理性验证
-        :param line_file_path: 线数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param line_file_path: 线数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载线数据
-        self.lines = gpd.read_file(line_file_path)
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
+        self.lines = as_layer(line_file_path)
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
+        # 空间索引在首次使用时构建
+        self._tree = None
+
+    def _get_tree(self):
+        """线数据的空间索引，整体检查与特定线检查共享"""
+        if self._tree is None:
+            self._tree = shapely.STRtree(as_geometry_array(self.lines))
+        return self._tree
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
         return self.lines.is_valid.all()
 
+    def find_dangling_nodes(self, tolerance=0.0):
+        """
+        查找悬挂节点，端点坐标按哈希计数，只被一条线使用的端点为悬挂节点
+        :param tolerance: 捕捉容差，大于0时端点先吸附到边长为tolerance的网格再计数，默认为 0.0 表示坐标完全相同才视为同一节点
+        :return: (悬挂节点坐标 n x 2 数组, 所属线的索引数组)
+        """
+        coordinates, owners = dangling_nodes(self.lines.geometry, tolerance)
+        return coordinates, self.lines.index.to_numpy()[owners]
+
     def _find_dangling_nodes(self):
         """查找悬挂节点"""
-        endpoints = [geom.boundary for geom in self.lines.geometry if not geom.is_empty]
-        if endpoints:
-            all_points = MultiPoint([pt for line in endpoints for pt in line])
-            points_counts = {pt: sum(pt.equals(other) for other in all_points) for pt in all_points}
-            dangling_nodes = [pt for pt, count in points_counts.items() if count == 1]
-            return len(dangling_nodes) > 0
-        else:
-            return False
+        coordinates, _ = dangling_nodes(self.lines.geometry)
+        return len(coordinates) > 0
+
+    def find_line_intersections(self):
+        """
+        基于空间索引查找存在不必要相交的线，只对外包矩形相交的候选线对计算交集
+        :return: n x 2 的数组，每行为一对相交线的索引
+        """
+        pairs = line_intersection_pairs(self.lines.geometry, self._get_tree())
+        return self.lines.index.to_numpy()[pairs]
 
     def _check_line_intersections(self):
-        """检查不必要的线间相交"""
-        intersections = []
-        for i, line_a in self.lines.iterrows():
-            for j, line_b in self.lines.iterrows():
-                if i < j:  # 避免重复比较
-                    intersection = line_a.geometry.intersection(line_b.geometry)
-                    if not intersection.is_empty and not isinstance(intersection, Point):
-                        intersections.append(intersection)
-        return len(intersections) > 0
+        """检查不必要的线间相交，找到第一对后立即返回"""
+        return has_line_intersection(self.lines.geometry, self._get_tree())
 
     def _check_lines_within_boundaries(self):
         """检查所有线是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        lines_within = self.lines.within(boundary_union)
-        return lines_within.all()
-
-    def check_line_topology_validity(self, check_within_boundaries=True) -> bool:
+        return self.boundary_index.all_within(self.lines.geometry)
+
+    def _validity_checks(self, check_within_boundaries=True) -> list:
+        """几何有效性、边界、悬挂节点、线间相交，按开销从小到大排列"""
+        checks = [('geometry_validity', self._check_geometry_validity, lambda: (~self.lines.is_valid).sum())]
+        if check_within_boundaries:
+            checks.append(('within_boundaries', self._check_lines_within_boundaries,
+                           lambda: _count_outside(self.boundary_index, self.lines.geometry)))
+        checks += [
+            ('dangling_nodes', lambda: not self._find_dangling_nodes(),
+             lambda: len(dangling_nodes(self.lines.geometry)[0])),
+            ('line_intersections', lambda: not self._check_line_intersections(),
+             lambda: len(line_intersection_pairs(self.lines.geometry, self._get_tree()))),
+        ]
+        return checks
+
+    def check_line_topology_validity(self, check_within_boundaries=True, fail_fast=True) -> bool:
         """
         检查矢量线数据的拓扑规则合理性。
         :param check_within_boundaries: 是否检查线是否位于边界内，默认为 True。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_dangling_nodes = self._find_dangling_nodes()
-        has_unnecessary_intersections = self._check_line_intersections()
-        within_boundaries = self._check_lines_within_boundaries() if check_within_boundaries else True
         # 如果几何有效、没有悬挂节点、没有不必要的交叉且（如果适用）在边界内，则认为数据合理
-        is_valid = geometry_valid and not has_dangling_nodes and not has_unnecessary_intersections and within_boundaries
-
-        return is_valid
+        return self._run_validity_checks(fail_fast, check_within_boundaries=check_within_boundaries)
 
     def check_specific_line(self, index: int) -> bool:
         """
@@ -268,105 +358,133 @@ class LineTopologyValidator:
         :param index: 要检查的线的索引。
         :return:
         """
-        specific_line = self.lines.iloc[[index]]
-        geometry_valid = specific_line.is_valid.all()
-        has_dangling_nodes = self._find_dangling_nodes_for_specific_line(specific_line)
-        has_unnecessary_intersections = self._check_specific_line_intersections(index)
-        # 如果几何有效、没有悬挂节点且没有不必要的交叉，则认为数据合理
-        is_valid = geometry_valid and not has_dangling_nodes and not has_unnecessary_intersections
-        return is_valid
+        return bool(self.check_specific_line_batch([index])['valid'].iloc[0])
 
-    @staticmethod
-    def _find_dangling_nodes_for_specific_line(specific_line):
-        """针对特定线查找悬挂节点"""
-        endpoints = [geom.boundary for geom in specific_line.geometry if not geom.is_empty]
-        if endpoints:
-            all_points = MultiPoint([pt for line in endpoints for pt in line])
-            points_counts = {pt: sum(pt.equals(other) for other in all_points) for pt in all_points}
-            dangling_nodes = [pt for pt, count in points_counts.items() if count == 1]
-            return len(dangling_nodes) > 0
-        else:
-            return False
-
-    def _check_specific_line_intersections(self, index):
+    def check_specific_line_batch(self, indices) -> pd.DataFrame:
+        """
+        批量检查特定线的拓扑规则合理性，空间索引只构建一次，所有线在一次查询中完成检查。
+        :param indices: 要检查的线的索引序列。
+        :return: 以线的索引为索引，包含geometry_valid、has_dangling_nodes、has_unnecessary_intersections和valid列的DataFrame
+        """
+        positions = _as_positions(indices, len(self.lines))
+        specific_lines = as_geometry_array(self.lines)[positions]
+        result = pd.DataFrame({
+            'geometry_valid': shapely.is_valid(specific_lines),
+            'has_dangling_nodes': self._find_dangling_nodes_for_specific_line(positions),
+            'has_unnecessary_intersections': self._check_specific_line_intersections(positions),
+        }, index=pd.Index(positions, name='index'))
+        # 如果几何有效、没有悬挂节点且没有不必要的交叉，则认为数据合理
+        result['valid'] = (result['geometry_valid'] & ~result['has_dangling_nodes']
+                           & ~result['has_unnecessary_intersections'])
+        return result
+
+    def _find_dangling_nodes_for_specific_line(self, positions):
+        """针对特定线查找悬挂节点，端点与空间索引查询到的相交线的端点一起计数，与整体检查结果一致"""
+        geometries = as_geometry_array(self.lines)
+        neighbours = self._get_tree().query(geometries[positions], predicate='intersects')[1]
+        context = np.unique(np.concatenate((positions, neighbours)))
+        _, owners = dangling_nodes(geometries[context])
+        return np.isin(positions, context[owners])
+
+    def _check_specific_line_intersections(self, positions):
         """检查特定线与其他线的不必要相交"""
-        specific_line = self.lines.iloc[index].geometry
-        intersections = []
-        for i, line_b in self.lines.iterrows():
-            if i != index:  # 不与自身比较
-                intersection = specific_line.intersection(line_b.geometry)
-                if not intersection.is_empty and not isinstance(intersection, Point):
-                    intersections.append(intersection)
-        return len(intersections) > 0
+        return line_intersection_flags(self.lines.geometry, positions, self._get_tree())
 
 
-class PolygonTopologyValidator:
+class PolygonTopologyValidator(ValidityChecks):
     def __init__(self, polygon_file_path, boundary_file_path=None):
         """
         面拓扑规则合理性验证
-        :param polygon_file_path: 面数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param polygon_file_path: 面数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载面数据
-        self.polygons = gpd.read_file(polygon_file_path)
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
+        self.polygons = as_layer(polygon_file_path)
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
+        # 空间索引和空隙在首次使用时构建
+        self._tree = None
+        self._gaps = {}
+
+    def _get_tree(self):
+        """面数据的空间索引，整体检查与特定多边形检查共享"""
+        if self._tree is None:
+            self._tree = shapely.STRtree(as_geometry_array(self.polygons))
+        return self._tree
+
+    def _get_gaps(self, allow_holes=False):
+        """按是否允许孔洞缓存的空隙面，整体检查与特定多边形检查共享"""
+        if allow_holes not in self._gaps:
+            self._gaps[allow_holes] = coverage_gaps(self.polygons.geometry, self._get_tree(),
+                                                    allow_holes=allow_holes)[0]
+        return self._gaps[allow_holes]
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
         return self.polygons.is_valid.all()
 
+    def find_overlaps(self):
+        """
+        基于空间索引查找内部相交的多边形，只共享边界的相邻多边形不视为重叠
+        :return: n x 2 的数组，每行为一对重叠多边形的索引
+        """
+        pairs = polygon_overlap_pairs(self.polygons.geometry, self._get_tree())
+        return self.polygons.index.to_numpy()[pairs]
+
     def _check_overlap(self):
-        """检查多边形之间的重叠情况"""
-        overlaps = []
-        for i, poly_a in self.polygons.iterrows():
-            for j, poly_b in self.polygons.iterrows():
-                if i < j:  # 避免重复比较
-                    intersection = poly_a.geometry.intersection(poly_b.geometry)
-                    if not intersection.is_empty and not isinstance(intersection, (Point, LineString)):
-                        overlaps.append(intersection)
-        return len(overlaps) > 0
-
-    def _check_gaps(self):
-        """检查多边形之间的空隙情况（适用于需要连续覆盖的情况）"""
-        unioned_polygon = unary_union(self.polygons.geometry)
-        boundary = unioned_polygon.boundary
-        # 如果边界为空，则说明没有空隙（所有多边形连成一片）
-        return not boundary.is_empty
+        """检查多边形之间的重叠情况，找到第一对后立即返回"""
+        return has_polygon_overlap(self.polygons.geometry, self._get_tree())
+
+    def find_gaps(self):
+        """
+        基于共享边分析查找多边形之间的空隙（包括狭长的缝隙），不合并整个图层
+        :return: 空隙GeoDataFrame，包含area（面积）和neighbours（相邻多边形的索引列表）列
+        """
+        return _gap_frame(self.polygons, self._get_tree())
+
+    def _check_gaps(self, allow_holes=False):
+        """检查多边形之间的空隙情况（适用于需要连续覆盖的情况），允许孔洞时多边形自身的孔洞不视为空隙"""
+        return len(self._get_gaps(allow_holes)) > 0
 
     def _check_holes(self):
         """检查多边形内部是否存在孔洞（取决于应用需求）"""
-        holes_exist = any(not poly.is_empty and poly.interiors for poly in self.polygons.geometry)
-        return holes_exist
+        return bool(hole_flags(self.polygons.geometry).any())
 
     def _check_polygons_within_boundaries(self):
         """检查所有多边形是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        polygons_within = self.polygons.within(boundary_union)
-        return polygons_within.all()
-
-    def check_polygon_topology_validity(self, allow_holes=False, check_within_boundaries=True) -> bool:
+        return self.boundary_index.all_within(self.polygons.geometry)
+
+    def _validity_checks(self, allow_holes=False, check_within_boundaries=True) -> list:
+        """几何有效性、孔洞、边界、重叠、空隙，按开销从小到大排列"""
+        checks = [('geometry_validity', self._check_geometry_validity, lambda: (~self.polygons.is_valid).sum())]
+        if not allow_holes:
+            checks.append(('holes', lambda: not self._check_holes(),
+                           lambda: hole_flags(self.polygons.geometry).sum()))
+        if check_within_boundaries:
+            checks.append(('within_boundaries', self._check_polygons_within_boundaries,
+                           lambda: _count_outside(self.boundary_index, self.polygons.geometry)))
+        checks += [
+            ('overlaps', lambda: not self._check_overlap(),
+             lambda: len(polygon_overlap_pairs(self.polygons.geometry, self._get_tree()))),
+            ('gaps', lambda: not self._check_gaps(allow_holes), lambda: len(self._get_gaps(allow_holes))),
+        ]
+        return checks
+
+    def check_polygon_topology_validity(self, allow_holes=False, check_within_boundaries=True, fail_fast=True) -> bool:
         """
         检查矢量面数据的拓扑规则合理性。
         :param allow_holes: 是否允许多边形内存在孔洞，默认为 False。
         :param check_within_boundaries: 是否检查多边形是否位于边界内，默认为 True。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_overlaps = self._check_overlap()
-        has_gaps = self._check_gaps()
-        has_unwanted_holes = self._check_holes() and not allow_holes
-        within_boundaries = self._check_polygons_within_boundaries() if check_within_boundaries else True
         # 如果几何有效、没有重叠、没有空隙、没有不希望出现的孔洞且（如果适用）在边界内，则认为数据合理
-        is_valid = geometry_valid and not has_overlaps and not has_gaps and not has_unwanted_holes and within_boundaries
-        return is_valid
+        return self._run_validity_checks(fail_fast, allow_holes=allow_holes,
+                                         check_within_boundaries=check_within_boundaries)
 
     def check_specific_polygon(self, index, allow_holes=False) -> bool:
         """
@@ -375,65 +493,74 @@ class PolygonTopologyValidator:
         :param allow_holes: 是否允许该多边形内存在孔洞，默认为 False。
         :return:
         """
-        specific_polygon = self.polygons.iloc[[index]]
-        geometry_valid = specific_polygon.is_valid.all()
-        has_overlaps = self._check_specific_overlap(index)
-        has_gaps = self._check_specific_gap(index)
-        has_unwanted_holes = self._check_specific_holes(specific_polygon) and not allow_holes
+        return bool(self.check_specific_polygon_batch([index], allow_holes)['valid'].iloc[0])
+
+    def check_specific_polygon_batch(self, indices, allow_holes=False) -> pd.DataFrame:
+        """
+        批量检查特定多边形的拓扑规则合理性，空间索引只构建一次，所有多边形在一次查询中完成检查。
+        :param indices: 要检查的多边形的索引序列。
+        :param allow_holes: 是否允许多边形内存在孔洞，默认为 False。
+        :return: 以多边形的索引为索引，包含geometry_valid、has_overlaps、has_gaps、has_holes和valid列的DataFrame
+        """
+        positions = _as_positions(indices, len(self.polygons))
+        specific_polygons = as_geometry_array(self.polygons)[positions]
+        result = pd.DataFrame({
+            'geometry_valid': shapely.is_valid(specific_polygons),
+            'has_overlaps': self._check_specific_overlap(positions),
+            'has_gaps': self._check_specific_gap(positions, allow_holes),
+            'has_holes': self._check_specific_holes(specific_polygons),
+        }, index=pd.Index(positions, name='index'))
         # 如果几何有效、没有重叠、没有空隙且没有不希望出现的孔洞，则认为数据合理
-        is_valid = geometry_valid and not has_overlaps and not has_gaps and not has_unwanted_holes
-        return is_valid
-
-    def _check_specific_overlap(self, index):
-        """针对特定多边形检查重叠情况"""
-        specific_polygon = self.polygons.iloc[index].geometry
-        overlaps = []
-        for i, poly_b in self.polygons.iterrows():
-            if i != index:  # 不与自身比较
-                intersection = specific_polygon.intersection(poly_b.geometry)
-                if not intersection.is_empty and not isinstance(intersection, (Point, LineString)):
-                    overlaps.append(intersection)
-        return len(overlaps) > 0
-
-    def _check_specific_gap(self, index):
-        """针对特定多边形检查空隙情况（适用于需要连续覆盖的情况）"""
-        specific_polygon = self.polygons.iloc[[index]]
-        remaining_polygons = self.polygons.drop(index)
-        if remaining_polygons.empty:
-            return False  # 没有其他多边形，默认认为没有空隙
-        unioned_remaining_polygon = unary_union(remaining_polygons.geometry)
-        boundary = specific_polygon.unary_union.boundary.difference(unioned_remaining_polygon.boundary)
-        # 如果边界不为空，则说明存在空隙
-        return not boundary.is_empty
-
-    def _check_specific_holes(self, specific_polygon):
+        result['valid'] = (result['geometry_valid'] & ~result['has_overlaps'] & ~result['has_gaps']
+                           & (~result['has_holes'] | allow_holes))
+        return result
+
+    def _check_specific_overlap(self, positions):
+        """针对特定多边形检查重叠情况，只共享边界的相邻多边形不视为重叠"""
+        return polygon_overlap_flags(self.polygons.geometry, positions, self._get_tree())
+
+    def _check_specific_gap(self, positions, allow_holes=False):
+        """针对特定多边形检查是否与空隙相邻（适用于需要连续覆盖的情况），空隙与整体检查共享"""
+        return polygon_gap_flags(self.polygons.geometry, positions, gaps=self._get_gaps(allow_holes))
+
+    @staticmethod
+    def _check_specific_holes(specific_polygons):
         """针对特定多边形检查孔洞情况"""
-        holes_exist = any(not poly.is_empty and poly.interiors for poly in specific_polygon.geometry)
-        return holes_exist
+        return hole_flags(specific_polygons)
 
 
-class PointTopologyValidator:
+class PointTopologyValidator(ValidityChecks):
     def __init__(self, point_file_path, boundary_file_path=None, line_file_path=None):
         """
         点拓扑规则合理性验证
-        :param point_file_path: 点数据shp文件地址
-        :param line_file_path: 线数据shp文件地址
-        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param point_file_path: 点数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param line_file_path: 线数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
         """
         # 加载点数据
-        self.points = gpd.read_file(point_file_path)
-
-        # 如果提供了边界文件，则加载边界多边形数据
-        if boundary_file_path:
-            self.boundary_polygons = gpd.read_file(boundary_file_path)
-        else:
-            self.boundary_polygons = None
-
-        # 如果提供了线文件，则加载线数据
-        if line_file_path:
-            self.lines = gpd.read_file(line_file_path)
-        else:
-            self.lines = None
+        self.points = as_layer(point_file_path)
+
+        # 如果提供了边界，则加载边界多边形数据
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.boundary_polygons = None if self.boundary_index is None else self.boundary_index.boundary_polygons
+
+        # 如果提供了线数据，则加载线数据
+        self.lines = as_layer(line_file_path)
+        # 重复点索引和线数据空间索引在首次使用时构建
+        self._duplicates = None
+        self._line_tree = None
+
+    def _get_duplicates(self):
+        """每个点是否与其他点重复，整体检查与特定点检查共享"""
+        if self._duplicates is None:
+            self._duplicates = duplicate_flags(self.points.geometry)
+        return self._duplicates
+
+    def _get_line_tree(self):
+        """线数据的空间索引"""
+        if self._line_tree is None:
+            self._line_tree = shapely.STRtree(as_geometry_array(self.lines))
+        return self._line_tree
 
     def _check_geometry_validity(self):
         """检查几何有效性"""
@@ -441,43 +568,68 @@ class PointTopologyValidator:
 
     def _check_duplicates(self):
         """检查是否存在重复点"""
-        unique_points = self.points.drop_duplicates(subset=['geometry'])
-        return len(unique_points) != len(self.points)
+        return bool(self._get_duplicates().any())
 
     def _check_within_boundaries(self):
         """检查所有点是否都在给定的边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        # 使用unary_union合并所有边界多边形
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        points_within = self.points.within(boundary_union)
-        return points_within.all()
+        return self.boundary_index.all_within(self.points.geometry)
+
+    def find_nearest_lines(self, max_distance=None):
+        """
+        基于空间索引查找每个点最近的线及距离
+        :param max_distance: 最大搜索距离，超出距离的点视为没有最近线，默认为None表示不限制
+        :return: 以点索引为索引，包含line_id（最近线索引，没有时为空）和distance（距离，没有时为inf）列的DataFrame
+        """
+        if self.lines is None:
+            raise ValueError("No lines provided for proximity checking.")
+        return _nearest_lines_frame(self.points, self.lines, max_distance)
 
     def _check_proximity_to_lines(self, max_distance=0.0):
         """检查点与线的距离是否在允许范围内（可选）"""
         if self.lines is None:
             print("No lines provided for proximity checking.")
             return True  # 没有提供线，默认认为合理
-        distances = self.points.geometry.apply(lambda point: min(self.lines.distance(point)))
-        return (distances <= max_distance).all()
+        _, distances = nearest_lines(self.points.geometry, self.lines.geometry, max_distance, self._get_line_tree())
+        return bool((distances <= max_distance).all())
+
+    def _count_far_from_lines(self, max_distance=0.0):
+        """统计与线的距离超出允许范围的点数量，没有提供线时为0"""
+        if self.lines is None:
+            return 0
+        _, distances = nearest_lines(self.points.geometry, self.lines.geometry, max_distance, self._get_line_tree())
+        return int((distances > max_distance).sum())
+
+    def _validity_checks(self, check_within_boundaries=True, check_proximity_to_lines=True, max_distance=0.0) -> list:
+        """几何有效性、重复点、边界、点到线距离，按开销从小到大排列"""
+        checks = [
+            ('geometry_validity', self._check_geometry_validity, lambda: (~self.points.is_valid).sum()),
+            ('duplicates', lambda: not self._check_duplicates(), lambda: self._get_duplicates().sum()),
+        ]
+        if check_within_boundaries:
+            checks.append(('within_boundaries', self._check_within_boundaries,
+                           lambda: _count_outside(self.boundary_index, self.points.geometry)))
+        if check_proximity_to_lines:
+            checks.append(('proximity_to_lines', lambda: self._check_proximity_to_lines(max_distance),
+                           lambda: self._count_far_from_lines(max_distance)))
+        return checks
 
     def check_point_topology_validity(self, check_within_boundaries=True, check_proximity_to_lines=True,
-                                      max_distance=0.0) -> bool:
+                                      max_distance=0.0, fail_fast=True) -> bool:
         """
         检查矢量点数据的拓扑规则合理性。
         :param check_within_boundaries: 是否检查点是否位于边界内，默认为 True。
         :param check_proximity_to_lines: 是否检查点到线的距离，默认为 True。
         :param max_distance: 允许的最大距离，单位与坐标系统一致，默认为 0.0 表示必须重合。
+        :param fail_fast: 是否按开销从小到大执行检查并在任一检查不通过时立即返回，默认为 True。
         :return:
         """
-        geometry_valid = self._check_geometry_validity()
-        has_duplicates = self._check_duplicates()
-        within_boundaries = self._check_within_boundaries() if check_within_boundaries else True
-        proximity_to_lines = self._check_proximity_to_lines(max_distance) if check_proximity_to_lines else True
         # 如果几何有效、没有重复点、都在边界内且与线的距离合理，则认为数据合理
-        is_valid = geometry_valid and not has_duplicates and within_boundaries and proximity_to_lines
-        return is_valid
+        return self._run_validity_checks(fail_fast, check_within_boundaries=check_within_boundaries,
+                                         check_proximity_to_lines=check_proximity_to_lines,
+                                         max_distance=max_distance)
 
     def check_specific_point(self, index, check_within_boundaries=True, check_proximity_to_lines=True,
                              max_distance=0.0) -> bool:
@@ -489,36 +641,50 @@ class PointTopologyValidator:
         :param max_distance: 允许的最大距离，单位与坐标系统一致，默认为 0.0 表示必须重合。
         :return:
         """
-        specific_point = self.points.iloc[[index]]
-        geometry_valid = specific_point.is_valid.all()
-        has_duplicates = self._check_specific_duplicates(index)
-        within_boundaries = self._check_specific_within_boundaries(specific_point) if check_within_boundaries else True
-        proximity_to_lines = self._check_specific_proximity_to_lines(specific_point,
-                                                                     max_distance) if check_proximity_to_lines else True
+        result = self.check_specific_point_batch([index], check_within_boundaries, check_proximity_to_lines,
+                                                 max_distance)
+        return bool(result['valid'].iloc[0])
+
+    def check_specific_point_batch(self, indices, check_within_boundaries=True, check_proximity_to_lines=True,
+                                   max_distance=0.0) -> pd.DataFrame:
+        """
+        批量检查特定点的拓扑规则合理性，重复点索引和空间索引只构建一次，所有点在一次查询中完成检查。
+        :param indices: 要检查的点的索引序列。
+        :param check_within_boundaries: 是否检查点是否位于边界内，默认为 True。
+        :param check_proximity_to_lines: 是否检查点到线的距离，默认为 True。
+        :param max_distance: 允许的最大距离，单位与坐标系统一致，默认为 0.0 表示必须重合。
+        :return: 以点的索引为索引，包含geometry_valid、has_duplicates、within_boundaries、proximity_to_lines和valid列的DataFrame
+        """
+        positions = _as_positions(indices, len(self.points))
+        specific_points = as_geometry_array(self.points)[positions]
+        result = pd.DataFrame({
+            'geometry_valid': shapely.is_valid(specific_points),
+            'has_duplicates': self._check_specific_duplicates(positions),
+            'within_boundaries': self._check_specific_within_boundaries(
+                specific_points) if check_within_boundaries else True,
+            'proximity_to_lines': self._check_specific_proximity_to_lines(
+                specific_points, max_distance) if check_proximity_to_lines else True,
+        }, index=pd.Index(positions, name='index'))
         # 如果几何有效、不是重复点、在边界内且与线的距离合理，则认为数据合理
-        is_valid = geometry_valid and not has_duplicates and within_boundaries and proximity_to_lines
-        return is_valid
+        result['valid'] = (result['geometry_valid'] & ~result['has_duplicates'] & result['within_boundaries']
+                           & result['proximity_to_lines'])
+        return result
 
-    def _check_specific_duplicates(self, index):
+    def _check_specific_duplicates(self, positions):
         """针对特定点检查是否是重复点"""
-        specific_point = self.points.iloc[index].geometry
-        other_points = self.points.drop(index).geometry
-        duplicates = any(specific_point.equals(other) for other in other_points)
-        return duplicates
+        return self._get_duplicates()[positions]
 
-    def _check_specific_within_boundaries(self, specific_point):
+    def _check_specific_within_boundaries(self, specific_points):
         """针对特定点检查是否位于边界内"""
         if self.boundary_polygons is None:
             print("No boundary provided for checking.")
             return True  # 没有提供边界，默认认为合理
-        boundary_union = unary_union(self.boundary_polygons.geometry)
-        point_within = specific_point.within(boundary_union)
-        return point_within.all()
+        return self.boundary_index.within(specific_points)
 
-    def _check_specific_proximity_to_lines(self, specific_point, max_distance=0.0):
+    def _check_specific_proximity_to_lines(self, specific_points, max_distance=0.0):
         """针对特定点检查与线的距离是否在允许范围内"""
         if self.lines is None:
             print("No lines provided for proximity checking.")
             return True  # 没有提供线，默认认为合理
-        distance = min(self.lines.distance(specific_point.geometry))
-        return distance <= max_distance
+        _, distances = nearest_lines(specific_points, self.lines.geometry, max_distance, self._get_line_tree())
+        return distances <= max_distance
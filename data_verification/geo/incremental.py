@@ -0,0 +1,277 @@
+import os
+import json
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from data_verification.geo import layer
+from data_verification.geo.boundary import BoundaryIndex
+from data_verification.geo.topology import as_geometry_array, iter_neighbours, unnecessary_intersections
+from data_verification.geo.topology import interior_overlaps, dangling_nodes, hole_flags, duplicate_flags
+from data_verification.geo.topology import coverage_gaps
+
+# 状态文件格式版本，格式变化时旧状态文件被忽略并重新全量检查
+STATE_VERSION = 1
+# shapely几何类型编号到检查类型的映射
+GEOMETRY_TYPE_KINDS = {0: 'point', 4: 'point', 1: 'line', 2: 'line', 5: 'line', 3: 'polygon', 6: 'polygon'}
+# 各检查类型的要素对检查
+PAIR_TESTS = {'line': unnecessary_intersections, 'polygon': interior_overlaps}
+
+
+def fingerprints(geometries) -> np.ndarray:
+    """
+    计算几何对象指纹，几何对象标准化后对WKB取64位哈希
+    :param geometries: 几何对象集合
+    :return: uint64数组，空几何对象（None）的指纹为0
+    """
+    geometries = as_geometry_array(geometries)
+    result = np.zeros(geometries.shape[0], dtype=np.uint64)
+    present = ~shapely.is_missing(geometries)
+    if present.any():
+        result[present] = pd.util.hash_array(shapely.to_wkb(shapely.normalize(geometries[present])))
+    return result
+
+
+def _expand(bounds: np.ndarray, distance: float) -> np.ndarray:
+    """将外包矩形向外扩展指定距离后转为矩形几何对象"""
+    return shapely.box(bounds[:, 0] - distance, bounds[:, 1] - distance,
+                       bounds[:, 2] + distance, bounds[:, 3] + distance)
+
+
+def _neighbours(tree: shapely.STRtree, geometries: np.ndarray, distance: float) -> np.ndarray:
+    """查询与几何对象相交或距离不超过distance的要素位置"""
+    if distance > 0:
+        return tree.query(geometries, predicate='dwithin', distance=distance)[1]
+    return tree.query(geometries, predicate='intersects')[1]
+
+
+class IncrementalValidator:
+    def __init__(self, file_path: str, state_path: str = None, boundary_file_path: str = None,
+                 id_column: str = None):
+        """
+        增量验证，在两次运行之间保存每个要素的几何指纹、外包矩形和检查结果，
+        再次运行时只对新增、修改的要素及其空间相邻要素重新检查，结果与全量检查一致
+        :param file_path: 矢量数据文件地址
+        :param state_path: 状态文件地址，默认为数据文件同目录下的 '<文件名>.validation.npz'
+        :param boundary_file_path: 边界多边形shp文件地址（可选）
+        :param id_column: 唯一标识要素的属性列，默认为None表示使用要素FID；
+            编辑后会重新排列FID的格式（如删除要素后重新打包的shp）建议指定该列
+        """
+        self.file_path = file_path
+        self.state_path = state_path or os.path.splitext(file_path)[0] + '.validation.npz'
+        self.boundary_file_path = boundary_file_path
+        self.id_column = id_column
+
+    def read_features(self) -> tuple:
+        """
+        读取要素标识和几何对象
+        :return: (要素标识数组, 几何对象数组)
+        """
+        if self.id_column is not None:
+            frame = layer.read_layer(self.file_path, columns=[self.id_column])
+            ids = frame[self.id_column].to_numpy()
+            if pd.Index(ids).has_duplicates:
+                raise ValueError(f"Column '{self.id_column}' does not uniquely identify features")
+        elif layer.pyogrio is not None:
+            frame = layer.read_layer(self.file_path, columns=[], fid_as_index=True)
+            ids = frame.index.to_numpy()
+        else:
+            frame = layer.read_layer(self.file_path, columns=[])
+            ids = frame.index.to_numpy()
+        if ids.dtype == object:
+            ids = ids.astype(str)
+        return ids, as_geometry_array(frame)
+
+    def _boundary_signature(self) -> str:
+        """边界文件的路径、修改时间和大小，边界文件变化时所有要素重新检查是否位于边界内"""
+        if not self.boundary_file_path:
+            return ''
+        stat = os.stat(self.boundary_file_path)
+        return f'{os.path.abspath(self.boundary_file_path)}:{stat.st_mtime_ns}:{stat.st_size}'
+
+    def load_state(self) -> dict:
+        """
+        读取状态文件
+        :return: 状态字典，状态文件不存在或格式版本不一致时为None
+        """
+        if not os.path.exists(self.state_path):
+            return None
+        with np.load(self.state_path, allow_pickle=False) as data:
+            state = {key: data[key] for key in data.files}
+        state['meta'] = json.loads(str(state['meta']))
+        if state['meta'].get('version') != STATE_VERSION:
+            return None
+        return state
+
+    def save_state(self, state: dict):
+        """
+        保存状态文件，先写入临时文件再替换，避免中断时留下不完整的状态
+        :param state: 状态字典
+        :return:
+        """
+        arrays = {key: value for key, value in state.items() if key != 'meta'}
+        arrays['meta'] = np.array(json.dumps(state['meta']))
+        temporary = self.state_path + '.tmp'
+        with open(temporary, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(temporary, self.state_path)
+
+    def clear_state(self):
+        """删除状态文件，下次运行时全量检查"""
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    def validate(self, tolerance: float = 0.0, allow_holes: bool = False) -> dict:
+        """
+        检查要素并保存状态，没有可用的状态时全量检查
+        :param tolerance: 悬挂节点的捕捉容差，默认为 0.0 表示坐标完全相同才视为同一节点
+        :param allow_holes: 是否允许多边形内存在孔洞，默认为 False
+        :return: 检查报告字典，要素均以要素标识表示，包含features、added、changed、deleted、rechecked、
+            invalid_geometry、outside_boundaries、对应几何类型的检查结果（line_intersections、dangling_nodes、
+            dangling_node_ids、overlaps、holes、gaps、duplicates）和valid
+        """
+        ids, geometries = self.read_features()
+        present = ~shapely.is_missing(geometries)
+        type_ids = shapely.get_type_id(geometries[present])
+        kind = GEOMETRY_TYPE_KINDS.get(int(type_ids[0]), 'polygon') if type_ids.shape[0] else 'polygon'
+        meta = {'version': STATE_VERSION, 'kind': kind, 'tolerance': tolerance,
+                'boundary': self._boundary_signature()}
+        hashes = fingerprints(geometries)
+        bounds = shapely.bounds(geometries)
+        tree = shapely.STRtree(geometries)
+        size = geometries.shape[0]
+
+        state = self.load_state()
+        if state is not None and (state['meta']['kind'] != kind or state['meta']['tolerance'] != tolerance):
+            state = None
+        if state is None:
+            # 没有可用的状态，所有要素都需要检查
+            kept = np.zeros(size, dtype=bool)
+            old_positions = np.empty(0, dtype=np.int64)
+            unchanged = np.empty(0, dtype=bool)
+            removed_bounds = np.empty((0, 4))
+            added = ids
+            changed = deleted = ids[:0]
+        else:
+            old_positions = pd.Index(ids).get_indexer(state['ids'])
+            unchanged = (old_positions >= 0) & (state['hashes'] == hashes[np.maximum(old_positions, 0)])
+            kept = np.zeros(size, dtype=bool)
+            kept[old_positions[unchanged]] = True
+            # 删除的要素和修改前的要素所在范围内的要素也可能受影响
+            removed = ~unchanged
+            removed_bounds = state['bounds'][removed & ~np.isnan(state['bounds']).any(axis=1)]
+            deleted = state['ids'][old_positions < 0]
+            changed = state['ids'][(old_positions >= 0) & removed]
+            added = ids[~np.isin(ids, state['ids'])]
+        dirty = np.flatnonzero(~kept)
+
+        def carry(key, compute, positions):
+            """沿用未变化要素的逐要素结果，对positions处的要素重新计算"""
+            flags = np.zeros(size, dtype=bool)
+            if state is not None and key in state:
+                flags[old_positions[unchanged]] = state[key][unchanged]
+            if positions.shape[0]:
+                flags[positions] = compute(positions)
+            return flags
+
+        # 受影响的要素：新增和修改的要素、与其相交的要素以及位于删除或修改前要素范围内的要素；
+        # 端点吸附到边长为tolerance的网格，同一网格内的端点距离小于网格对角线长度
+        reach = tolerance * np.sqrt(2)
+        affected = [dirty]
+        if dirty.shape[0]:
+            affected.append(_neighbours(tree, geometries[dirty], reach))
+        if removed_bounds.shape[0]:
+            affected.append(tree.query(_expand(removed_bounds, reach))[1])
+        affected = np.unique(np.concatenate(affected)).astype(np.int64)
+
+        new_state = {'meta': meta, 'ids': ids, 'hashes': hashes, 'bounds': bounds}
+        new_state['invalid'] = carry('invalid', lambda positions: ~shapely.is_valid(geometries[positions]), dirty)
+        if self.boundary_file_path:
+            boundary_index = BoundaryIndex.from_file(self.boundary_file_path)
+            boundary_changed = state is None or state['meta']['boundary'] != meta['boundary']
+            new_state['outside'] = carry('outside', lambda positions: ~boundary_index.within(geometries[positions]),
+                                         np.arange(size) if boundary_changed else dirty)
+        if kind in PAIR_TESTS:
+            new_state['pairs'] = self._pairs(kind, ids, geometries, tree, dirty, state, unchanged)
+        if kind == 'line':
+            new_state['nodes'], new_state['node_ids'] = self._dangling(ids, geometries, tree, affected, tolerance,
+                                                                       reach, state, old_positions, unchanged)
+        elif kind == 'polygon':
+            new_state['holes'] = carry('holes', lambda positions: hole_flags(geometries[positions]), dirty)
+        else:
+            new_state['duplicates'] = carry('duplicates',
+                                            lambda positions: self._duplicates(geometries, tree, positions), affected)
+        self.save_state(new_state)
+
+        report = {'features': size, 'added': added, 'changed': changed, 'deleted': deleted,
+                  'rechecked': int(affected.shape[0]), 'invalid_geometry': ids[new_state['invalid']],
+                  'outside_boundaries': ids[new_state['outside']] if 'outside' in new_state else ids[:0]}
+        problems = ['invalid_geometry', 'outside_boundaries']
+        if kind == 'line':
+            report.update(line_intersections=new_state['pairs'], dangling_nodes=new_state['nodes'],
+                          dangling_node_ids=new_state['node_ids'])
+            problems += ['line_intersections', 'dangling_nodes']
+        elif kind == 'polygon':
+            # 空隙由共享边分析得到，开销与读取图层相当，每次全量计算
+            report.update(overlaps=new_state['pairs'], holes=ids[new_state['holes']],
+                          gaps=coverage_gaps(geometries, tree, allow_holes=allow_holes)[0])
+            problems += ['overlaps', 'gaps'] + ([] if allow_holes else ['holes'])
+        else:
+            report['duplicates'] = ids[new_state['duplicates']]
+            problems.append('duplicates')
+        report['valid'] = not any(len(report[key]) for key in problems)
+        return report
+
+    @staticmethod
+    def _pairs(kind, ids, geometries, tree, dirty, state, unchanged) -> np.ndarray:
+        """沿用两个要素都未变化的要素对，对新增和修改的要素重新查找要素对"""
+        test, found = PAIR_TESTS[kind], []
+        is_dirty = np.zeros(geometries.shape[0], dtype=bool)
+        is_dirty[dirty] = True
+        for query, other in iter_neighbours(geometries, dirty, tree):
+            left = dirty[query]
+            # 两个要素都需要重新检查时只保留一次
+            keep = ~is_dirty[other] | (left < other)
+            left, other = left[keep], other[keep]
+            bad = test(geometries[left], geometries[other])
+            found.append(np.column_stack((left[bad], other[bad])))
+        positions = np.concatenate(found) if found else np.empty((0, 2), dtype=np.int64)
+        if state is not None and state['pairs'].shape[0]:
+            old = state['pairs']
+            kept_ids = state['ids'][unchanged]
+            still = np.isin(old[:, 0], kept_ids) & np.isin(old[:, 1], kept_ids)
+            index = pd.Index(ids)
+            old_positions = np.column_stack((index.get_indexer(old[still, 0]), index.get_indexer(old[still, 1])))
+            positions = np.concatenate((positions, old_positions))
+        positions = np.sort(positions, axis=1)
+        positions = positions[np.lexsort((positions[:, 1], positions[:, 0]))]
+        return ids[positions].reshape(-1, 2)
+
+    @staticmethod
+    def _dangling(ids, geometries, tree, affected, tolerance, reach, state, old_positions, unchanged) -> tuple:
+        """沿用未受影响的线的悬挂节点，对受影响的线及与其相邻的线重新计数"""
+        owners = np.empty(0, dtype=np.int64)
+        nodes = np.empty((0, 2))
+        if affected.shape[0]:
+            context = np.unique(np.concatenate((affected, _neighbours(tree, geometries[affected], reach))))
+            nodes, local = dangling_nodes(geometries[context], tolerance)
+            owners = context[local]
+            keep = np.isin(owners, affected)
+            nodes, owners = nodes[keep], owners[keep]
+        if state is not None and state['node_ids'].shape[0]:
+            positions = np.full(state['ids'].shape[0], -1, dtype=np.int64)
+            positions[unchanged] = old_positions[unchanged]
+            old_owners = positions[pd.Index(state['ids']).get_indexer(state['node_ids'])]
+            keep = (old_owners >= 0) & ~np.isin(old_owners, affected)
+            nodes = np.concatenate((nodes, state['nodes'][keep]))
+            owners = np.concatenate((owners, old_owners[keep]))
+        order = np.lexsort((nodes[:, 1], nodes[:, 0], owners))
+        return nodes[order], ids[owners[order]]
+
+    @staticmethod
+    def _duplicates(geometries, tree, positions) -> np.ndarray:
+        """判断指定要素是否与其他要素重复，只与相交的要素比较"""
+        context = np.unique(np.concatenate((positions, tree.query(geometries[positions], predicate='intersects')[1])))
+        flags = duplicate_flags(geometries[context])
+        return flags[np.searchsorted(context, positions)]
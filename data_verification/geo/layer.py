@@ -0,0 +1,289 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+import geopandas as gpd
+
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# 图层缓存默认占用的内存上限（字节）
+DEFAULT_LAYER_CACHE_BYTES = 512 * 1024 * 1024
+# 列式存储格式的文件扩展名
+PARQUET_SUFFIXES = ('.parquet', '.geoparquet')
+FEATHER_SUFFIXES = ('.feather', '.arrow', '.ipc')
+
+
+def is_columnar(path: str) -> bool:
+    """判断文件是否为GeoParquet或Feather（Arrow IPC）文件"""
+    return os.fspath(path).lower().endswith(PARQUET_SUFFIXES + FEATHER_SUFFIXES)
+
+
+def _geo_metadata(path: str, parquet: bool) -> dict:
+    """读取GeoParquet/Feather文件的geo元数据，只读取文件结构不读取数据"""
+    if parquet:
+        schema = pyarrow.parquet.read_schema(path, memory_map=True)
+    else:
+        with pyarrow.memory_map(path) as source:
+            schema = pyarrow.ipc.open_file(source).schema
+    metadata = schema.metadata or {}
+    if b'geo' not in metadata:
+        raise ValueError(f"'{path}' has no GeoParquet 'geo' metadata")
+    return json.loads(metadata[b'geo'])
+
+
+def _covering_column(geo: dict) -> str:
+    """主几何列的bbox覆盖列名（GeoParquet 1.1 covering），没有时为None"""
+    covering = geo['columns'][geo['primary_column']].get('covering', {}).get('bbox')
+    return covering['xmin'][0] if covering else None
+
+
+def _read_covering(path: str, column: str) -> np.ndarray:
+    """读取bbox覆盖列，每个要素4个浮点数，为空的行为NaN"""
+    table = pyarrow.parquet.read_table(path, columns=[column], memory_map=True)
+    struct = table.column(column).combine_chunks()
+    return np.column_stack([pyarrow.compute.struct_field(struct, name).to_numpy(zero_copy_only=False)
+                            for name in ('xmin', 'ymin', 'xmax', 'ymax')]).astype(np.float64)
+
+
+def _bbox_mask(bounds: np.ndarray, bbox: tuple) -> np.ndarray:
+    """外包矩形与范围相交的要素，外包矩形为空的要素不相交"""
+    minx, miny, maxx, maxy = bbox
+    return (~np.isnan(bounds).any(axis=1) & (bounds[:, 0] <= maxx) & (bounds[:, 1] <= maxy)
+            & (bounds[:, 2] >= minx) & (bounds[:, 3] >= miny))
+
+
+def columnar_layer_info(path: str) -> dict:
+    """
+    从GeoParquet/Feather文件的元数据获取图层信息，不读取几何数据
+    :param path: GeoParquet或Feather文件地址
+    :return: 包含features（要素数量）、total_bounds（范围，未知时为None）、geometry_types（几何类型名列表）、
+        bbox_filter（是否可以按范围只读取相交的行，即存在bbox覆盖列的GeoParquet文件）的字典
+    """
+    if pyarrow is None:
+        raise ImportError("Reading GeoParquet and Feather files requires pyarrow")
+    parquet = path.lower().endswith(PARQUET_SUFFIXES)
+    geo = _geo_metadata(path, parquet)
+    column = geo['columns'][geo['primary_column']]
+    covering = _covering_column(geo) if parquet else None
+    if parquet:
+        features = pyarrow.parquet.read_metadata(path).num_rows
+    else:
+        with pyarrow.memory_map(path) as source:
+            reader = pyarrow.ipc.open_file(source)
+            features = sum(reader.get_batch(number).num_rows for number in range(reader.num_record_batches))
+    total_bounds = column.get('bbox')
+    if total_bounds is None and covering is not None:
+        bounds = _read_covering(path, covering)
+        total_bounds = [np.nanmin(bounds[:, 0]), np.nanmin(bounds[:, 1]), np.nanmax(bounds[:, 2]),
+                        np.nanmax(bounds[:, 3])] if features else None
+    return {'features': features, 'total_bounds': None if total_bounds is None else tuple(total_bounds[:4]),
+            'geometry_types': list(column.get('geometry_types', [])), 'bbox_filter': covering is not None}
+
+
+def read_columnar_layer(path: str, columns: list = None, bbox: tuple = None, fid_as_index: bool = False,
+                        **kwargs) -> gpd.GeoDataFrame:
+    """
+    读取GeoParquet或Feather（Arrow IPC）图层，通过内存映射读取文件，只读取需要的列；
+    未压缩的Feather文件直接映射为Arrow缓冲区，几何列以geoarrow编码存储时按坐标数组批量构建几何对象
+    :param path: GeoParquet或Feather文件地址
+    :param columns: 需要读取的属性列，默认为None表示读取全部属性列，为空列表时只读取几何列，几何列始终读取
+    :param bbox: (minx, miny, maxx, maxy)，只保留外包矩形与该范围相交的要素；存在bbox覆盖列的GeoParquet文件
+        （如to_parquet(write_covering_bbox=True)写入）按覆盖列过滤后只解码相交的行，其他文件需解码全部几何对象后过滤
+    :param fid_as_index: 是否以行号（与GDAL的Arrow驱动的FID一致）作为索引，按bbox读取时始终以行号作为索引
+    :param kwargs: 传递给pyarrow读取函数的其他参数，如GeoParquet的filters
+    :return:
+    """
+    if pyarrow is None:
+        raise ImportError("Reading GeoParquet and Feather files requires pyarrow")
+    parquet = path.lower().endswith(PARQUET_SUFFIXES)
+    geo = _geo_metadata(path, parquet)
+    if columns is not None:
+        geometry = geo['primary_column']
+        columns = list(columns) + ([geometry] if geometry not in columns else [])
+    kwargs.setdefault('memory_map', True)
+    covering = _covering_column(geo) if parquet else None
+    if bbox is not None and covering is not None:
+        # 先按覆盖列计算相交的行号（每行只读取4个浮点数），再由geopandas按相同条件下推过滤，行号作为FID保持稳定
+        rows = np.flatnonzero(_bbox_mask(_read_covering(path, covering), bbox))
+        frame = gpd.read_parquet(path, columns=columns, bbox=tuple(bbox), **kwargs)
+        if len(frame) != rows.shape[0]:
+            raise RuntimeError(f"Bounding box filter of '{path}' returned an unexpected number of rows")
+        frame.index = rows
+        return frame
+    if parquet:
+        frame = gpd.read_parquet(path, columns=columns, **kwargs)
+    else:
+        frame = gpd.read_feather(path, columns=columns, **kwargs)
+    if fid_as_index or bbox is not None:
+        frame.index = np.arange(len(frame))
+    if bbox is not None:
+        frame = frame[_bbox_mask(shapely.bounds(frame.geometry.to_numpy()), bbox)]
+    return frame
+
+
+def read_layer(path: str, columns: list = None, **kwargs) -> gpd.GeoDataFrame:
+    """
+    读取矢量图层，GeoParquet和Feather文件通过pyarrow内存映射读取；
+    其他格式安装pyogrio时直接使用其列式读取，同时安装pyarrow时通过Arrow批量传输
+    :param path: 矢量数据文件地址
+    :param columns: 需要读取的属性列，默认为None表示读取全部属性列，为空列表时只读取几何列
+    :param kwargs: 传递给读取函数的其他参数，如bbox、skip_features、max_features
+    :return:
+    """
+    if is_columnar(path):
+        return read_columnar_layer(path, columns=columns, **kwargs)
+    if pyogrio is not None:
+        return pyogrio.read_dataframe(path, columns=columns, use_arrow=pyarrow is not None, **kwargs)
+    if columns is not None:
+        kwargs['columns'] = columns
+    return gpd.read_file(path, **kwargs)
+
+
+def estimate_nbytes(frame: gpd.GeoDataFrame) -> int:
+    """估算图层占用的内存，几何列按坐标数量计算"""
+    attributes = frame.drop(columns=frame.geometry.name).memory_usage(index=True, deep=True).sum()
+    coordinates = shapely.get_num_coordinates(frame.geometry.to_numpy()).sum()
+    # 每个坐标按x、y两个float64计，每个几何对象另计固定开销
+    return int(attributes + coordinates * 16 + len(frame) * 64)
+
+
+class LayerCache:
+    def __init__(self, max_bytes: int = DEFAULT_LAYER_CACHE_BYTES):
+        """
+        矢量图层缓存，按文件路径和读取的列缓存，文件修改时间或大小变化时重新读取，
+        超出内存上限时按最近最少使用（LRU）淘汰；缓存的图层由各验证器共享，不应原地修改
+        :param max_bytes: 缓存图层占用的内存上限（字节）
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._layers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, columns: list = None) -> gpd.GeoDataFrame:
+        """
+        获取图层，未缓存或文件已变化时读取并加入缓存；URL、/vsizip/、/vsicurl/等非本地路径无法判断文件是否变化，
+        直接读取不缓存
+        :param path: 矢量数据文件地址
+        :param columns: 需要读取的属性列，默认为None表示读取全部属性列，为空列表时只读取几何列
+        :return:
+        """
+        if not os.path.exists(path):
+            return read_layer(path, columns=None if columns is None else list(columns))
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (os.path.abspath(path), None if columns is None else tuple(columns))
+        with self._lock:
+            entry = self._layers.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                self._layers.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+        frame = read_layer(path, columns=None if columns is None else list(columns))
+        nbytes = estimate_nbytes(frame)
+        with self._lock:
+            self._discard(key)
+            # 超过内存上限的图层不缓存
+            if nbytes <= self.max_bytes:
+                self._layers[key] = (signature, frame, nbytes)
+                self.nbytes += nbytes
+                self._evict()
+        return frame
+
+    def resize(self, max_bytes: int):
+        """
+        调整缓存内存上限，超出部分立即淘汰
+        :param max_bytes: 缓存图层占用的内存上限（字节）
+        :return:
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """清空缓存与统计信息"""
+        with self._lock:
+            self._layers.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        获取缓存统计信息
+        :return: 包含hits、misses、evictions、size、nbytes、max_bytes的字典
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self._layers), 'nbytes': self.nbytes, 'max_bytes': self.max_bytes}
+
+    def _discard(self, key):
+        """移除指定图层，调用方需持有锁"""
+        entry = self._layers.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def _evict(self):
+        """淘汰最久未使用的图层，调用方需持有锁"""
+        while self.nbytes > self.max_bytes:
+            _, (_, _, nbytes) = self._layers.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._layers)
+
+
+# 全局图层缓存
+LAYER_CACHE = LayerCache()
+
+
+def load_layer(path: str, columns: list = None) -> gpd.GeoDataFrame:
+    """
+    通过全局图层缓存读取矢量图层
+    :param path: 矢量数据文件地址
+    :param columns: 需要读取的属性列，默认为None表示读取全部属性列，为空列表时只读取几何列
+    :return:
+    """
+    return LAYER_CACHE.get(os.fspath(path), columns)
+
+
+def as_layer(source, geometry_only: bool = False) -> gpd.GeoDataFrame:
+    """
+    获取验证器使用的图层，文件路径通过全局图层缓存读取；GeoDataFrame直接使用，
+    GeoSeries和shapely几何对象数组包装为GeoDataFrame，均不复制几何对象，验证期间不应修改传入的数据
+    :param source: 矢量数据文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组
+    :param geometry_only: 文件路径是否只读取几何列，默认为False表示读取全部属性列（与gpd.read_file一致）
+    :return: GeoDataFrame，source为None或空字符串时返回None
+    """
+    if source is None or isinstance(source, str) and not source:
+        return None
+    if isinstance(source, (str, os.PathLike)):
+        return load_layer(source, columns=[] if geometry_only else None)
+    if isinstance(source, gpd.GeoDataFrame):
+        return source
+    if not isinstance(source, gpd.GeoSeries):
+        if not isinstance(source, gpd.array.GeometryArray):
+            source = gpd.array.from_shapely(np.asarray(source, dtype=object))
+        source = gpd.GeoSeries(source, copy=False)
+    return gpd.GeoDataFrame(geometry=source)
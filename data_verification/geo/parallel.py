@@ -0,0 +1,156 @@
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import shapely
+
+from data_verification.geo.topology import as_geometry_array, iter_neighbours, unnecessary_intersections
+from data_verification.geo.topology import interior_overlaps, duplicate_flags, free_edge_segments, coverage_gaps
+
+
+def _duplicate_flags(geometries: np.ndarray, owned: np.ndarray) -> np.ndarray:
+    """判断负责的要素是否与分区内其他要素重复"""
+    return duplicate_flags(geometries)[owned]
+
+
+# 要素对检查及其逐对判断函数
+PAIR_CHECKS = {
+    'intersections': unnecessary_intersections,
+    'overlaps': interior_overlaps,
+}
+# 逐要素检查及其判断函数，函数接收分区几何对象数组和负责要素的位置数组
+FEATURE_CHECKS = {
+    'duplicates': _duplicate_flags,
+}
+
+
+def run_partition(check: str, wkb: np.ndarray, positions: np.ndarray, owned: np.ndarray) -> np.ndarray:
+    """
+    在子进程中对一个分区执行检查
+    :param check: 检查名，PAIR_CHECKS或FEATURE_CHECKS中的键，或 'gaps'
+    :param wkb: 分区内全部要素（负责的要素及其相邻要素）的WKB数组
+    :param positions: 分区内要素在整个图层中的位置
+    :param owned: 分区负责的要素在分区内的位置
+    :return: 要素对检查返回 n x 2 的图层位置数组（每对左侧位置小于右侧），逐要素检查返回存在问题的要素的图层位置数组，
+        'gaps'返回负责的面中只属于一个面的线段端点 n x 4 数组
+    """
+    geometries = shapely.from_wkb(wkb)
+    if check == 'gaps':
+        # 与负责的面共享边的面必然与其相交，已包含在分区内，因此负责的面的线段计数与整个图层一致
+        segments, owners = free_edge_segments(geometries)
+        return segments[np.isin(owners, owned)]
+    if check in FEATURE_CHECKS:
+        return positions[owned[FEATURE_CHECKS[check](geometries, owned)]]
+    test, pairs = PAIR_CHECKS[check], []
+    for query, other in iter_neighbours(geometries, owned):
+        left, right = owned[query], other
+        # 每对只由图层位置较小的要素所在分区负责
+        keep = positions[left] < positions[right]
+        left, right = left[keep], right[keep]
+        bad = test(geometries[left], geometries[right])
+        pairs.append(np.column_stack((positions[left[bad]], positions[right[bad]])))
+    return np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=np.int64)
+
+
+class GeoParallelExecutor:
+    CHECKS = tuple(PAIR_CHECKS) + ('gaps',) + tuple(FEATURE_CHECKS)
+
+    def __init__(self, max_workers: int = None, partitions: int = None):
+        """
+        多进程执行地理拓扑检查，按空间网格将图层划分为多个分区，每个分区由一个进程检查
+        :param max_workers: 最大进程数，默认为CPU核数
+        :param partitions: 分区数量，默认为进程数的4倍，以平衡要素分布不均时各进程的负载
+        """
+        if partitions is not None and partitions < 1:
+            raise ValueError("partitions must be greater than 0")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.partitions = partitions or self.max_workers * 4
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """进程池在首次使用时创建，之后重复使用，避免每次调用都启动进程"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def partition(self, geometries) -> list:
+        """
+        按空间网格划分分区，要素由其外包矩形左下角所在的网格负责，
+        分区包含负责的要素及外包矩形与这些要素范围相交的全部要素，保证跨分区的相邻要素参与检查
+        :param geometries: 几何对象集合
+        :return: (分区要素位置数组, 负责要素在分区内的位置数组) 列表
+        """
+        geometries = as_geometry_array(geometries)
+        bounds = shapely.bounds(geometries)
+        present = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        if present.shape[0] == 0:
+            return []
+        bounds = bounds[present]
+        minx, miny = bounds[:, 0].min(), bounds[:, 1].min()
+        maxx, maxy = bounds[:, 2].max(), bounds[:, 3].max()
+        side = math.ceil(math.sqrt(self.partitions))
+        width = (maxx - minx) / side or 1.0
+        height = (maxy - miny) / side or 1.0
+        columns = np.clip(((bounds[:, 0] - minx) // width).astype(np.int64), 0, side - 1)
+        rows = np.clip(((bounds[:, 1] - miny) // height).astype(np.int64), 0, side - 1)
+        cells = rows * side + columns
+        tree = shapely.STRtree(geometries)
+        order = np.argsort(cells, kind='stable')
+        starts = np.flatnonzero(np.r_[True, cells[order][1:] != cells[order][:-1]])
+        partitions = []
+        for group in np.split(order, starts[1:]):
+            owned = present[group]
+            extent = bounds[group]
+            envelope = shapely.box(extent[:, 0].min(), extent[:, 1].min(), extent[:, 2].max(), extent[:, 3].max())
+            positions = np.unique(np.concatenate((tree.query(envelope), owned)))
+            partitions.append((positions, np.searchsorted(positions, owned)))
+        return partitions
+
+    def run(self, check: str, geometries) -> np.ndarray:
+        """
+        分区并行执行检查并合并结果
+        :param check: 检查名，'intersections':线的不必要相交, 'overlaps':面的内部重叠, 'gaps':与空隙相邻的面, 'duplicates':重复要素
+        :param geometries: GeoDataFrame、GeoSeries或几何对象集合
+        :return: 要素对检查返回 n x 2 的索引数组，逐要素检查返回存在问题的要素索引数组；
+            输入带有索引时返回索引标签，否则返回位置
+        """
+        if check not in self.CHECKS:
+            raise ValueError(f"Invalid check '{check}'. Available checks are {list(self.CHECKS)}")
+        array = as_geometry_array(geometries)
+        partitions = self.partition(array)
+        wkb = shapely.to_wkb(array)
+        # 只有一个分区或一个进程时直接在当前进程执行，避免启动进程和传输数据的开销
+        if len(partitions) <= 1 or self.max_workers == 1:
+            results = [run_partition(check, wkb[positions], positions, owned) for positions, owned in partitions]
+        else:
+            executor = self._get_executor()
+            futures = [executor.submit(run_partition, check, wkb[positions], positions, owned)
+                       for positions, owned in partitions]
+            results = [future.result() for future in futures]
+        if check in PAIR_CHECKS:
+            found = np.concatenate(results) if results else np.empty((0, 2), dtype=np.int64)
+            found = found[np.lexsort((found[:, 1], found[:, 0]))]
+        elif check == 'gaps':
+            # 各分区的线段合并后统一构面，空隙与PolygonTopologyValidator.find_gaps一致
+            segments = np.concatenate(results) if results else np.empty((0, 4))
+            _, pairs = coverage_gaps(array, edges=shapely.linestrings(segments.reshape(-1, 2, 2)))
+            found = np.unique(pairs[:, 1])
+        else:
+            found = np.sort(np.concatenate(results)) if results else np.empty(0, dtype=np.int64)
+        # GeoDataFrame、GeoSeries返回索引标签，列表等序列的index为方法，返回位置
+        if hasattr(getattr(geometries, 'index', None), 'to_numpy'):
+            return geometries.index.to_numpy()[found]
+        return found
+
+    def shutdown(self, wait: bool = True):
+        """关闭进程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
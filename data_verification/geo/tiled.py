@@ -0,0 +1,159 @@
+import math
+
+import numpy as np
+import shapely
+
+from data_verification.geo import layer
+from data_verification.geo.boundary import BoundaryIndex
+from data_verification.geo.topology import as_geometry_array, line_intersection_pairs, polygon_overlap_pairs
+from data_verification.geo.topology import dangling_nodes, hole_flags, duplicate_flags
+
+# 未指定分块大小时每个分块的预计要素数量
+TILE_FEATURES = 100000
+# 几何类型名前缀到检查类型的映射
+GEOMETRY_KINDS = {'Point': 'point', 'MultiPoint': 'point', 'LineString': 'line', 'MultiLineString': 'line',
+                  'Polygon': 'polygon', 'MultiPolygon': 'polygon'}
+
+
+class TiledValidator:
+    def __init__(self, file_path: str, boundary_file_path: str = None, tile_size: float = None,
+                 tile_features: int = TILE_FEATURES, halo: float = 0.0):
+        """
+        分块验证超出内存的矢量数据，按空间分块读取，每次只加载一个分块（含缓冲区）内的要素
+        :param file_path: 矢量数据文件地址，GeoParquet文件需包含bbox覆盖列以便按分块只读取相交的行
+        :param boundary_file_path: 边界多边形文件地址，或GeoDataFrame、GeoSeries、shapely几何对象数组（可选）
+        :param tile_size: 分块边长，单位与坐标系统一致，默认为None表示按tile_features估算
+        :param tile_features: 未指定tile_size时每个分块的预计要素数量，按要素均匀分布估算分块边长
+        :param halo: 分块缓冲区宽度，读取分块时向外扩展该距离，悬挂节点检查会自动扩展到不小于捕捉容差
+        """
+        if tile_size is not None and tile_size <= 0:
+            raise ValueError("tile_size must be greater than 0")
+        if tile_features < 1:
+            raise ValueError("tile_features must be greater than 0")
+        if halo < 0:
+            raise ValueError("halo must not be negative")
+        self.file_path = file_path
+        self.boundary_index = BoundaryIndex.from_source(boundary_file_path)
+        self.halo = halo
+        if layer.is_columnar(file_path):
+            # GeoParquet/Feather的要素数量、范围和几何类型从Arrow/GeoParquet元数据获取
+            info = layer.columnar_layer_info(file_path)
+            if not info['bbox_filter']:
+                raise ValueError(f"Tiled validation of '{file_path}' requires a GeoParquet file with a bbox covering "
+                                 f"column, e.g. written with to_parquet(write_covering_bbox=True)")
+            geometry_types = [name.replace(' Z', '').replace(' M', '') for name in info['geometry_types']]
+        else:
+            if layer.pyogrio is None:
+                raise ImportError("Tiled validation requires pyogrio")
+            info = layer.pyogrio.read_info(file_path, force_feature_count=True, force_total_bounds=True)
+            geometry_types = [(info['geometry_type'] or '').replace(' Z', '').replace(' M', '')]
+        kinds = {GEOMETRY_KINDS.get(name) for name in geometry_types}
+        if len(kinds) != 1 or None in kinds:
+            raise ValueError(f"Unsupported geometry type '{', '.join(geometry_types)}'")
+        self.kind = kinds.pop()
+        self.features = info['features']
+        self.bounds = tuple(info['total_bounds'])
+        minx, miny, maxx, maxy = self.bounds
+        width, height = maxx - minx, maxy - miny
+        if tile_size is None:
+            # 假设要素均匀分布，按总面积和分块数量估算正方形分块的边长
+            tiles = max(math.ceil(self.features / tile_features), 1)
+            tile_size = math.sqrt(max(width * height, 0.0) / tiles) or max(width, height) / tiles or 1.0
+        self.tile_size = tile_size
+        self.shape = (max(math.ceil(width / tile_size), 1), max(math.ceil(height / tile_size), 1))
+
+    def tiles(self) -> list:
+        """
+        获取所有分块的范围
+        :return: (minx, miny, maxx, maxy) 列表，按行优先排列
+        """
+        minx, miny, _, _ = self.bounds
+        return [(minx + i * self.tile_size, miny + j * self.tile_size,
+                 minx + (i + 1) * self.tile_size, miny + (j + 1) * self.tile_size)
+                for j in range(self.shape[1]) for i in range(self.shape[0])]
+
+    def _owner(self, coordinates: np.ndarray) -> np.ndarray:
+        """坐标所属分块的编号，分块按左闭右开划分，最后一行、一列包含数据范围的上边界"""
+        minx, miny, _, _ = self.bounds
+        columns = np.clip(np.floor((coordinates[:, 0] - minx) / self.tile_size), 0, self.shape[0] - 1)
+        rows = np.clip(np.floor((coordinates[:, 1] - miny) / self.tile_size), 0, self.shape[1] - 1)
+        return (rows * self.shape[0] + columns).astype(np.int64)
+
+    def iter_tiles(self, halo: float = None):
+        """
+        逐个读取分块，读取范围为分块向外扩展缓冲区宽度
+        :param halo: 缓冲区宽度，默认为初始化时的halo
+        :return: 生成器，产出(分块编号, 分块范围, 以要素FID为索引的GeoDataFrame)
+        """
+        halo = self.halo if halo is None else halo
+        # 额外扩展极小距离，保证恰好位于分块边线上的要素被相邻分块同时读取
+        margin = halo + self.tile_size * 1e-9
+        for number, (minx, miny, maxx, maxy) in enumerate(self.tiles()):
+            frame = layer.read_layer(self.file_path, columns=[], fid_as_index=True,
+                                     bbox=(minx - margin, miny - margin, maxx + margin, maxy + margin))
+            yield number, (minx, miny, maxx, maxy), frame
+
+    def validate(self, tolerance: float = 0.0, allow_holes: bool = False, check_within_boundaries: bool = True) -> dict:
+        """
+        分块执行全部检查并合并结果，跨分块的重叠、相交和悬挂节点通过缓冲区和要素FID去重保证不遗漏、不重复
+        :param tolerance: 悬挂节点的捕捉容差，默认为 0.0 表示坐标完全相同才视为同一节点
+        :param allow_holes: 是否允许多边形内存在孔洞，默认为 False
+        :param check_within_boundaries: 是否检查要素是否位于边界内，默认为 True
+        :return: 检查报告字典，包含tiles、features、invalid_geometry、outside_boundaries及对应几何类型的检查结果和valid
+        """
+        found = {'invalid_geometry': [], 'outside_boundaries': []}
+        if self.kind == 'line':
+            found.update(dangling_nodes=[], dangling_node_ids=[], line_intersections=[])
+        elif self.kind == 'polygon':
+            found.update(overlaps=[], holes=[])
+        else:
+            found.update(duplicates=[])
+        features = 0
+        for number, _, frame in self.iter_tiles(max(self.halo, tolerance)):
+            if frame.empty:
+                continue
+            fids = frame.index.to_numpy()
+            geometries = as_geometry_array(frame)
+            # 要素由其第一个坐标所在的分块负责，逐要素的检查只在负责的分块内统计
+            coordinates, owners = shapely.get_coordinates(geometries, return_index=True)
+            _, first = np.unique(owners, return_index=True)
+            owned = np.zeros(fids.shape[0], dtype=bool)
+            owned[owners[first]] = self._owner(coordinates[first]) == number
+            features += int(owned.sum())
+            found['invalid_geometry'].append(fids[owned & ~shapely.is_valid(geometries)])
+            if check_within_boundaries and self.boundary_index is not None:
+                found['outside_boundaries'].append(fids[owned & ~self.boundary_index.within(geometries)])
+            if self.kind == 'line':
+                pairs = line_intersection_pairs(geometries)
+                found['line_intersections'].append(fids[pairs])
+                nodes, node_owners = dangling_nodes(geometries, tolerance)
+                # 悬挂节点由其（吸附后）坐标所在的分块负责
+                anchors = np.round(nodes / tolerance) * tolerance if tolerance > 0 else nodes
+                keep = self._owner(anchors) == number
+                found['dangling_nodes'].append(nodes[keep])
+                found['dangling_node_ids'].append(fids[node_owners[keep]])
+            elif self.kind == 'polygon':
+                pairs = polygon_overlap_pairs(geometries)
+                found['overlaps'].append(fids[pairs])
+                found['holes'].append(fids[owned & hole_flags(geometries)])
+            else:
+                found['duplicates'].append(fids[owned & duplicate_flags(geometries)])
+        return self._report(found, features, allow_holes)
+
+    def _report(self, found: dict, features: int, allow_holes: bool) -> dict:
+        """合并各分块的检查结果，同一要素对在多个分块中出现时只保留一次"""
+        report = {'tiles': self.shape[0] * self.shape[1], 'features': features}
+        for key in ('invalid_geometry', 'outside_boundaries', 'holes', 'duplicates'):
+            if key in found:
+                report[key] = np.unique(np.concatenate(found[key] or [np.empty(0, dtype=np.int64)]))
+        for key in ('line_intersections', 'overlaps'):
+            if key in found:
+                pairs = np.concatenate(found[key] or [np.empty((0, 2), dtype=np.int64)])
+                report[key] = np.unique(np.sort(pairs, axis=1), axis=0) if pairs.shape[0] else pairs
+        if 'dangling_nodes' in found:
+            report['dangling_nodes'] = np.concatenate(found['dangling_nodes'] or [np.empty((0, 2))])
+            report['dangling_node_ids'] = np.concatenate(found['dangling_node_ids'] or [np.empty(0, dtype=np.int64)])
+        problems = ['invalid_geometry', 'outside_boundaries', 'line_intersections', 'dangling_nodes', 'overlaps',
+                    'duplicates'] + ([] if allow_holes else ['holes'])
+        report['valid'] = not any(len(report[key]) for key in problems if key in report)
+        return report
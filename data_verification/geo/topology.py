@@ -0,0 +1,342 @@
+import numpy as np
+import shapely
+
+# 每批查询空间索引的要素数量，限制候选要素对等中间结果占用的内存
+QUERY_BLOCK_SIZE = 10000
+# 只判断是否存在问题时每批查询的要素数量，较小的批次可以在找到第一个问题后尽早返回
+EARLY_EXIT_BLOCK_SIZE = 1000
+# 两个几何对象内部相交的DE-9IM模式
+INTERIOR_INTERSECTS = 'T********'
+
+
+def as_geometry_array(geometries) -> np.ndarray:
+    """
+    将GeoSeries、GeoDataFrame或几何对象序列转为shapely几何对象数组
+    :param geometries: 几何对象集合
+    :return:
+    """
+    if hasattr(geometries, 'geometry'):
+        geometries = geometries.geometry
+    return np.asarray(geometries, dtype=object)
+
+
+def iter_candidate_pairs(geometries: np.ndarray, tree: shapely.STRtree = None, predicate: str = 'intersects',
+                         block_size: int = QUERY_BLOCK_SIZE):
+    """
+    使用STRtree分批查询满足空间谓词的要素对，每对只返回一次（i < j）
+    :param geometries: shapely几何对象数组
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :param predicate: STRtree支持的空间谓词
+    :param block_size: 每批查询的要素数量
+    :return: 生成器，每批产出(左侧位置数组, 右侧位置数组)
+    """
+    if tree is None:
+        tree = shapely.STRtree(geometries)
+    for start in range(0, geometries.shape[0], block_size):
+        left, right = tree.query(geometries[start:start + block_size], predicate=predicate)
+        left = left + start
+        keep = left < right
+        if keep.any():
+            yield left[keep], right[keep]
+
+
+def unnecessary_intersections(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """逐对判断线是否存在不必要相交，交集不为空且不是单个点时视为不必要相交"""
+    intersections = shapely.intersection(left, right)
+    return ~shapely.is_empty(intersections) & (shapely.get_type_id(intersections) != shapely.GeometryType.POINT)
+
+
+def interior_overlaps(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """逐对判断面是否内部相交，不构建交集几何"""
+    return shapely.relate_pattern(left, right, INTERIOR_INTERSECTS)
+
+
+def _collect_pairs(blocks: list) -> np.ndarray:
+    """将分批结果合并为 n x 2 的位置数组"""
+    blocks = [np.column_stack(block) for block in blocks if block[0].shape[0]]
+    if not blocks:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(blocks).astype(np.int64)
+
+
+def line_intersection_pairs(geometries, tree: shapely.STRtree = None) -> np.ndarray:
+    """
+    查找存在不必要相交的线要素对，交集不为空且不是单个点时视为不必要相交
+    :param geometries: 线几何对象集合
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return: n x 2 的位置数组，每行为一对相交线的位置
+    """
+    geometries = as_geometry_array(geometries)
+    pairs = []
+    for left, right in iter_candidate_pairs(geometries, tree):
+        bad = unnecessary_intersections(geometries[left], geometries[right])
+        pairs.append((left[bad], right[bad]))
+    return _collect_pairs(pairs)
+
+
+def polygon_overlap_pairs(geometries, tree: shapely.STRtree = None) -> np.ndarray:
+    """
+    查找内部相交的面要素对，只共享边界或顶点的相邻面不视为重叠，不构建交集几何
+    :param geometries: 面几何对象集合
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return: n x 2 的位置数组，每行为一对重叠面的位置
+    """
+    geometries = as_geometry_array(geometries)
+    pairs = []
+    for left, right in iter_candidate_pairs(geometries, tree):
+        overlapping = interior_overlaps(geometries[left], geometries[right])
+        pairs.append((left[overlapping], right[overlapping]))
+    return _collect_pairs(pairs)
+
+
+def free_edge_segments(geometries) -> tuple:
+    """
+    查找面边界中只属于一个面的线段，相邻面共享的边按线段端点哈希计数后抵消
+    :param geometries: 面几何对象集合
+    :return: (线段端点 n x 4 数组（x1, y1, x2, y2）, 所属面位置数组)
+    """
+    parts, part_owners = shapely.get_parts(as_geometry_array(geometries), return_index=True)
+    rings, ring_parts = shapely.get_rings(parts, return_index=True)
+    coordinates, ring_ids = shapely.get_coordinates(rings, return_index=True)
+    same_ring = ring_ids[1:] == ring_ids[:-1]
+    starts, ends = coordinates[:-1][same_ring], coordinates[1:][same_ring]
+    owners = part_owners[ring_parts[ring_ids[:-1][same_ring]]]
+    # 统一线段方向，使两个面以相反方向记录的同一条边得到相同的键
+    swap = (starts[:, 0] > ends[:, 0]) | ((starts[:, 0] == ends[:, 0]) & (starts[:, 1] > ends[:, 1]))
+    first = np.where(swap[:, None], ends, starts)
+    second = np.where(swap[:, None], starts, ends)
+    segments = np.hstack((first, second)) + 0.0
+    keep = (segments[:, :2] != segments[:, 2:]).any(axis=1)
+    segments, owners = segments[keep], owners[keep]
+    if segments.shape[0] == 0:
+        return np.empty((0, 4)), np.empty(0, dtype=np.int64)
+    keys = np.ascontiguousarray(segments).view(np.dtype((np.void, segments.dtype.itemsize * 4))).ravel()
+    _, index, counts = np.unique(keys, return_index=True, return_counts=True)
+    index = index[counts == 1]
+    return segments[index], owners[index].astype(np.int64)
+
+
+def free_edges(geometries) -> np.ndarray:
+    """
+    查找面边界中只属于一个面的线段
+    :param geometries: 面几何对象集合
+    :return: 线段几何对象数组
+    """
+    segments, _ = free_edge_segments(geometries)
+    return shapely.linestrings(segments.reshape(-1, 2, 2))
+
+
+def coverage_gaps(geometries, tree: shapely.STRtree = None, edges: np.ndarray = None,
+                  allow_holes: bool = False) -> tuple:
+    """
+    基于共享边分析查找面图层中的空隙（包括狭长的缝隙），不合并整个图层：
+    只属于一个面的边经打断后构面，不被任何面覆盖的面片即为空隙
+    :param geometries: 面几何对象集合
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :param edges: 预先计算的只属于一个面的线段几何对象数组（如分区并行计算的结果），为空时由free_edges计算
+    :param allow_holes: 是否允许面内存在孔洞，为True时面自身孔洞内未被其他面覆盖的部分不视为空隙
+    :return: (空隙面几何对象数组, n x 2 的位置数组，每行为(空隙位置, 相邻面位置))
+    """
+    geometries = as_geometry_array(geometries)
+    edges = free_edges(geometries) if edges is None else edges
+    empty = np.empty((0, 2), dtype=np.int64)
+    if edges.shape[0] == 0:
+        return np.empty(0, dtype=object), empty
+    faces = shapely.get_parts(shapely.polygonize(shapely.get_parts(shapely.union_all(edges))))
+    if faces.shape[0] == 0:
+        return faces, empty
+    if tree is None:
+        tree = shapely.STRtree(geometries)
+    # 构面的边都不在面片内部，面片要么整体被覆盖，要么整体未被覆盖，取面片内一点判断即可；
+    # 该点可能恰好落在相邻面的共享边上，因此按covered_by而不是within判断
+    covered, _ = tree.query(shapely.point_on_surface(faces), predicate='covered_by')
+    gaps = np.delete(faces, np.unique(covered))
+    if allow_holes and gaps.shape[0]:
+        # 不被任何面覆盖却位于某个面外环内的面片必然在该面的孔洞中
+        parts = shapely.get_parts(geometries)
+        shells = shapely.polygons(shapely.get_exterior_ring(parts[shapely.get_num_interior_rings(parts) > 0]))
+        inside, _ = shapely.STRtree(shells).query(shapely.point_on_surface(gaps), predicate='within')
+        gaps = np.delete(gaps, np.unique(inside))
+    if gaps.shape[0] == 0:
+        return gaps, empty
+    gap_positions, neighbours = tree.query(gaps, predicate='intersects')
+    return gaps, np.column_stack((gap_positions, neighbours)).astype(np.int64)
+
+
+def has_line_intersection(geometries, tree: shapely.STRtree = None) -> bool:
+    """
+    判断是否存在不必要相交的线，找到第一对后立即返回
+    :param geometries: 线几何对象集合
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return:
+    """
+    geometries = as_geometry_array(geometries)
+    for left, right in iter_candidate_pairs(geometries, tree, block_size=EARLY_EXIT_BLOCK_SIZE):
+        if unnecessary_intersections(geometries[left], geometries[right]).any():
+            return True
+    return False
+
+
+def has_polygon_overlap(geometries, tree: shapely.STRtree = None) -> bool:
+    """
+    判断是否存在内部相交的面，找到第一对后立即返回
+    :param geometries: 面几何对象集合
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return:
+    """
+    geometries = as_geometry_array(geometries)
+    for left, right in iter_candidate_pairs(geometries, tree, block_size=EARLY_EXIT_BLOCK_SIZE):
+        if interior_overlaps(geometries[left], geometries[right]).any():
+            return True
+    return False
+
+
+def dangling_nodes(geometries, tolerance: float = 0.0) -> tuple:
+    """
+    查找悬挂节点，即只被一条线使用的端点，端点按坐标哈希计数
+    :param geometries: 线几何对象集合
+    :param tolerance: 捕捉容差，大于0时端点先吸附到边长为tolerance的网格再计数，默认为 0.0 表示坐标完全相同才视为同一节点
+    :return: (悬挂节点坐标 n x 2 数组, 所属要素位置数组)
+    """
+    geometries = as_geometry_array(geometries)
+    coordinates, owners = shapely.get_coordinates(shapely.boundary(geometries), return_index=True)
+    if coordinates.shape[0] == 0:
+        return coordinates, owners
+    # 加0.0将-0.0统一为0.0，保证按字节比较时相同坐标的键相同
+    keys = np.round(coordinates / tolerance).astype(np.int64) if tolerance > 0 else coordinates + 0.0
+    # 将每个端点的两个坐标视为一个定长字节串进行哈希计数
+    keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.dtype.itemsize * 2))).ravel()
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    dangling = counts[inverse] == 1
+    return coordinates[dangling], owners[dangling]
+
+
+def nearest_lines(points, lines, max_distance: float = None, tree: shapely.STRtree = None) -> tuple:
+    """
+    基于空间索引的最近邻查询，查找每个点最近的线及距离
+    :param points: 点几何对象集合
+    :param lines: 线几何对象集合
+    :param max_distance: 最大搜索距离，大于0时只在该距离内搜索，超出距离的点视为没有最近线，默认为None表示不限制
+    :param tree: 基于lines构建的STRtree，为空时新建
+    :return: (最近线位置数组, 距离数组)，没有最近线的点位置为-1、距离为inf
+    """
+    points = as_geometry_array(points)
+    lines = as_geometry_array(lines)
+    positions = np.full(points.shape[0], -1, dtype=np.int64)
+    distances = np.full(points.shape[0], np.inf)
+    if points.shape[0] == 0 or lines.shape[0] == 0:
+        return positions, distances
+    if tree is None:
+        tree = shapely.STRtree(lines)
+    max_distance = max_distance if max_distance and max_distance > 0 else None
+    (point_positions, line_positions), found = tree.query_nearest(points, max_distance=max_distance,
+                                                                  return_distance=True, all_matches=False)
+    positions[point_positions] = line_positions
+    distances[point_positions] = found
+    return positions, distances
+
+
+def iter_neighbours(geometries: np.ndarray, positions: np.ndarray, tree: shapely.STRtree = None,
+                    predicate: str = 'intersects', block_size: int = QUERY_BLOCK_SIZE):
+    """
+    使用STRtree分批查询指定要素满足空间谓词的其他要素，不包含要素自身
+    :param geometries: shapely几何对象数组
+    :param positions: 被查询要素的位置数组
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :param predicate: STRtree支持的空间谓词
+    :param block_size: 每批查询的要素数量
+    :return: 生成器，每批产出(在positions中的序号数组, 其他要素位置数组)
+    """
+    if tree is None:
+        tree = shapely.STRtree(geometries)
+    for start in range(0, positions.shape[0], block_size):
+        query, other = tree.query(geometries[positions[start:start + block_size]], predicate=predicate)
+        query = query + start
+        keep = positions[query] != other
+        if keep.any():
+            yield query[keep], other[keep]
+
+
+def line_intersection_flags(geometries, positions, tree: shapely.STRtree = None) -> np.ndarray:
+    """
+    判断指定线是否与其他线存在不必要相交，交集不为空且不是单个点时视为不必要相交
+    :param geometries: 线几何对象集合
+    :param positions: 被检查线的位置数组
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return: 与positions等长的布尔数组
+    """
+    geometries = as_geometry_array(geometries)
+    positions = np.asarray(positions, dtype=np.int64)
+    flags = np.zeros(positions.shape[0], dtype=bool)
+    for query, other in iter_neighbours(geometries, positions, tree):
+        bad = unnecessary_intersections(geometries[positions[query]], geometries[other])
+        flags[query[bad]] = True
+    return flags
+
+
+def polygon_overlap_flags(geometries, positions, tree: shapely.STRtree = None) -> np.ndarray:
+    """
+    判断指定面是否与其他面内部相交
+    :param geometries: 面几何对象集合
+    :param positions: 被检查面的位置数组
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :return: 与positions等长的布尔数组
+    """
+    geometries = as_geometry_array(geometries)
+    positions = np.asarray(positions, dtype=np.int64)
+    flags = np.zeros(positions.shape[0], dtype=bool)
+    for query, other in iter_neighbours(geometries, positions, tree):
+        overlapping = interior_overlaps(geometries[positions[query]], geometries[other])
+        flags[query[overlapping]] = True
+    return flags
+
+
+def polygon_gap_flags(geometries, positions, tree: shapely.STRtree = None, allow_holes: bool = False,
+                      gaps: np.ndarray = None) -> np.ndarray:
+    """
+    判断指定面是否与空隙相邻，空隙与coverage_gaps的共享边分析结果一致，图层外边界不视为空隙；
+    空隙与图层外部的区分取决于整个图层，因此按整个图层查找空隙，再只查询与空隙相交的面
+    :param geometries: 面几何对象集合
+    :param positions: 被检查面的位置数组
+    :param tree: 基于geometries构建的STRtree，为空时新建
+    :param allow_holes: 是否允许面内存在孔洞，为True时面自身孔洞内未被其他面覆盖的部分不视为空隙
+    :param gaps: 预先由coverage_gaps计算的空隙面几何对象数组（如验证器缓存的结果），为空时重新计算
+    :return: 与positions等长的布尔数组
+    """
+    geometries = as_geometry_array(geometries)
+    positions = np.asarray(positions, dtype=np.int64)
+    if gaps is None:
+        gaps = coverage_gaps(geometries, tree, allow_holes=allow_holes)[0]
+    flags = np.zeros(positions.shape[0], dtype=bool)
+    if gaps.shape[0] and positions.shape[0]:
+        touching, _ = shapely.STRtree(gaps).query(geometries[positions], predicate='intersects')
+        flags[touching] = True
+    return flags
+
+
+def hole_flags(geometries) -> np.ndarray:
+    """
+    判断面（含多面）是否存在孔洞
+    :param geometries: 面几何对象集合
+    :return: 布尔数组
+    """
+    geometries = as_geometry_array(geometries)
+    parts, owners = shapely.get_parts(geometries, return_index=True)
+    holes = np.bincount(owners, weights=shapely.get_num_interior_rings(parts), minlength=geometries.shape[0])
+    return holes > 0
+
+
+def duplicate_flags(geometries) -> np.ndarray:
+    """
+    判断几何对象是否与其他几何对象重复，几何对象标准化后按WKB哈希计数
+    :param geometries: 几何对象集合
+    :return: 布尔数组，空几何对象（None）不视为重复
+    """
+    geometries = as_geometry_array(geometries)
+    flags = np.zeros(geometries.shape[0], dtype=bool)
+    present = ~shapely.is_missing(geometries)
+    if present.any():
+        keys = shapely.to_wkb(shapely.normalize(geometries[present]))
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        flags[present] = counts[inverse] > 1
+    return flags
@@ -1,5 +1,5 @@
 from data_verification.public.scc import SCC, SCCAsync
-from data_verification.public.time import Time, TimeAsync
+from data_verification.public.time import Time, TimeAsync, TimeRange
 from data_verification.public.empty import Empty, EmptyAsync
 from data_verification.public.email import Email, EmailAsync
 from data_verification.public.regex import Regex, RegexAsync
@@ -14,4 +14,8 @@ from data_verification.public.verify_type import VerifyType, VerifyTypeAsync
 from data_verification.public.coordinates import Coordinates, CoordinatesAsync
 from data_verification.public.phone_number import PhoneNumber, PhoneNumberAsync
 from data_verification.public.organization import Organization, OrganizationAsync
-from data_verification.public.admin_division import AdminDivision, AdminDivisionAsync
\ No newline at end of file
+from data_verification.public.admin_division import AdminDivision, AdminDivisionAsync
+from data_verification.public.schema import Schema
+from data_verification.public.stream import StreamValidator
+from data_verification.public.parallel import ParallelExecutor
+from data_verification.public.batch_async import BatchAsync
@@ -0,0 +1,77 @@
+import asyncio
+
+import numpy as np
+
+from data_verification.public.parallel import run_chunk, split_chunks
+
+
+class BatchAsync:
+    def __init__(self, *args, executor=None, max_concurrency: int = 4, chunksize: int = 10000, **kwargs):
+        """
+        异步批量校验，将数据分块交给执行器执行，避免阻塞事件循环
+        :param executor: 执行分块任务的执行器，默认为事件循环的默认线程池；CPU密集的校验建议传入ProcessPoolExecutor
+        :param max_concurrency: 同时执行的分块任务数上限，同一实例的所有批量调用共享该上限
+        :param chunksize: 每个分块任务处理的值数量
+        """
+        super().__init__(*args, **kwargs)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.chunksize = chunksize
+        self._semaphore = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """信号量在首次使用时创建，保证绑定到当前事件循环"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run_shard(self, method, start: int, shard, kwargs: dict) -> tuple:
+        """在执行器中执行一个分块任务"""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            mask = await loop.run_in_executor(self.executor, run_chunk, method, shard, kwargs)
+            return start, mask
+
+    async def iter_batch(self, method, values, **kwargs):
+        """
+        异步分块执行检验方法，分块完成后立即产出，同一时间最多max_concurrency个分块在执行
+        :param method: PublicDataVerification中的方法名，存在批量方法时每块整体执行；也可以是单值函数
+        :param values: 被验证值的列表、NumPy数组、pandas Series或其他可迭代对象
+        :param kwargs: 传递给检验方法的关键字参数
+        :return: 异步生成器，按完成顺序产出(分块起始位置, 分块布尔数组)
+        """
+        pending = set()
+        try:
+            for number, shard in enumerate(split_chunks(values, self.chunksize)):
+                # 限制已创建的任务数量，避免一次性为所有分块创建任务
+                while len(pending) >= self.max_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(self._run_shard(method, number * self.chunksize, shard, kwargs)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run_batch(self, method, values, **kwargs) -> np.ndarray:
+        """
+        异步分块执行检验方法并按输入顺序拼接结果
+        :param method: PublicDataVerification中的方法名，存在批量方法时每块整体执行；也可以是单值函数
+        :param values: 被验证值的列表、NumPy数组、pandas Series或其他可迭代对象
+        :param kwargs: 传递给检验方法的关键字参数
+        :return: 与输入等长的布尔数组
+        """
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        result = np.zeros(len(values), dtype=bool)
+        async for start, mask in self.iter_batch(method, values, **kwargs):
+            result[start:start + mask.shape[0]] = mask
+        return result
@@ -1,5 +1,10 @@
 import re
 
+import numpy as np
+
+# 匹配邮箱地址的正则表达式
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
 
 class Email:
     @staticmethod
@@ -9,13 +14,26 @@ class Email:
         :param email: 被验证邮箱
         :return:
         """
-        # 定义匹配邮箱地址的正则表达式
-        email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
+        return bool(EMAIL_PATTERN.match(email))
 
-        return bool(re.match(email_regex, email))
+    @staticmethod
+    def verify_email_format_batch(emails) -> np.ndarray:
+        """
+        批量验证邮箱是否符合规则，非字符串元素视为不合法
+        :param emails: 被验证邮箱列表、NumPy数组或pandas Series
+        :return: 与输入等长的布尔数组
+        """
+        match = EMAIL_PATTERN.match
+        emails = np.asarray(emails, dtype=object).ravel()
+        return np.fromiter((isinstance(email, str) and match(email) is not None for email in emails), dtype=bool,
+                           count=emails.shape[0])
 
 
 class EmailAsync(Email):
     @staticmethod
     async def verify_email_format(email: str) -> bool:
         return Email.verify_email_format(email)
+
+    @staticmethod
+    async def verify_email_format_batch(emails) -> np.ndarray:
+        return Email.verify_email_format_batch(emails)
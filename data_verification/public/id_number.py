@@ -1,3 +1,13 @@
+import numpy as np
+
+from data_verification.public.utils import as_str_array, char_matrix
+
+# 默认权重因子
+ID_NUMBER_FACTORS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+# 默认校验码映射表
+ID_NUMBER_CHECK_CODES = ('1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2')
+
+
 class IDNumber:
     @staticmethod
     def verify_id_number(id_number: str, factors: list = None, check_codes: list = None) -> bool:
@@ -14,12 +24,12 @@ class IDNumber:
             raise TypeError('factors must be a list')
         if type(check_codes) is not list and check_codes is not None:
             raise TypeError('check_codes must be a list')
-        # 初始化权重因子
-        if check_codes is None:
-            check_codes = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
         # 初始化校验码映射表
+        if check_codes is None:
+            check_codes = ID_NUMBER_CHECK_CODES
+        # 初始化权重因子
         if factors is None:
-            factors = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+            factors = ID_NUMBER_FACTORS
         # 确保输入长度为18，并且只有最后一位可能是 'X'
         if len(id_number) != 18 or not (id_number[:-1].isdigit() and id_number[-1] in "0123456789Xx"):
             return False
@@ -30,8 +40,50 @@ class IDNumber:
         # 比较计算出的校验码和实际提供的校验码
         return calculated_check_code.upper() == id_number[-1].upper()
 
+    @staticmethod
+    def verify_id_number_batch(id_numbers, factors: list = None, check_codes: list = None) -> np.ndarray:
+        """
+        批量对身份证号进行验证，规则与verify_id_number一致，非字符串元素视为不合法
+        :param id_numbers: 身份证号列表、NumPy数组或pandas Series
+        :param factors: 权重因子
+        :param check_codes: 校验码映射表
+        :return: 与输入等长的布尔数组
+        """
+        if type(factors) is not list and factors is not None:
+            raise TypeError('factors must be a list')
+        if type(check_codes) is not list and check_codes is not None:
+            raise TypeError('check_codes must be a list')
+        if check_codes is None:
+            check_codes = ID_NUMBER_CHECK_CODES
+        if factors is None:
+            factors = ID_NUMBER_FACTORS
+        values = as_str_array(id_numbers)
+        result = np.zeros(values.shape[0], dtype=bool)
+        # 只有长度为18的值需要计算校验码
+        candidates = np.flatnonzero(np.char.str_len(values) == 18)
+        if candidates.size == 0:
+            return result
+        # 将每个字符转为码位，得到 n x 18 的矩阵
+        chars = char_matrix(values[candidates], 18)
+        digits = chars[:, :17] - ord('0')
+        last = chars[:, 17]
+        # 前17位必须为数字，最后一位为数字或X
+        well_formed = ((digits >= 0) & (digits <= 9)).all(axis=1)
+        last = np.where(last == ord('x'), ord('X'), last)
+        well_formed &= ((last >= ord('0')) & (last <= ord('9'))) | (last == ord('X'))
+        # 一次矩阵乘法计算前17位数字的加权和
+        total = digits @ np.asarray(factors[:17], dtype=np.int64)
+        # 校验码转为大写码位，非单字符的校验码不会匹配任何值
+        code_points = np.array([ord(c.upper()) if len(c) == 1 else -1 for c in check_codes], dtype=np.int64)
+        result[candidates] = well_formed & (code_points[total % 11] == last)
+        return result
+
 
 class IDNumberAsync(IDNumber):
     @staticmethod
     async def verify_id_number(id_number: str, factors: list = None, check_codes: list = None) -> bool:
         return IDNumber.verify_id_number(id_number, factors, check_codes)
+
+    @staticmethod
+    async def verify_id_number_batch(id_numbers, factors: list = None, check_codes: list = None) -> np.ndarray:
+        return IDNumber.verify_id_number_batch(id_numbers, factors, check_codes)
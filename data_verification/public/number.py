@@ -1,5 +1,9 @@
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
+
+from data_verification.public.utils import as_float_array
+
 
 class Number:
     @staticmethod
@@ -23,6 +27,23 @@ class Number:
         elif pattern == 3:
             return min_value < value < max_value
 
+    @staticmethod
+    def number_range_batch(values, min_value: int or float, max_value: int or float, pattern: int = 0) -> np.ndarray:
+        """
+        批量验证数是否在某个区间，非数值元素视为不合法
+        :param values: 被验证数列表、NumPy数组或pandas Series
+        :param min_value: 区间小值
+        :param max_value: 区间大值
+        :param pattern: 区间判断类型，0：前闭后闭，1：前闭后开，2：前开后闭，3：前开后开
+        :return: 与输入等长的布尔数组
+        """
+        if pattern not in [0, 1, 2, 3]:
+            raise ValueError("pattern must be 0 or 1, 2 or 3")
+        values = as_float_array(values)
+        lower = values >= min_value if pattern in [0, 1] else values > min_value
+        upper = values <= max_value if pattern in [0, 2] else values < max_value
+        return lower & upper
+
     @staticmethod
     def check_precision(value, min_value=None, max_value=None, decimal_places=2):
         """
@@ -59,3 +80,8 @@ class NumberAsync(Number):
     @staticmethod
     async def check_precision(value, min_value=None, max_value=None, decimal_places=2):
         return Number.check_precision(value, min_value, max_value, decimal_places)
+
+    @staticmethod
+    async def number_range_batch(values, min_value: int or float, max_value: int or float,
+                                 pattern: int = 0) -> np.ndarray:
+        return Number.number_range_batch(values, min_value, max_value, pattern)
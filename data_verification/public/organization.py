@@ -1,3 +1,11 @@
+import numpy as np
+
+from data_verification.public.utils import as_str_array, char_matrix
+
+# 默认权重数组
+ORGANIZATION_CODE_WEIGHTS = (3, 7, 9, 10, 5, 8, 4, 2)
+
+
 class Organization:
     @staticmethod
     def verify_organization_code(code: str, weights=None) -> bool:
@@ -8,7 +16,7 @@ class Organization:
         :return:
         """
         if weights is None:
-            weights = [3, 7, 9, 10, 5, 8, 4, 2]
+            weights = ORGANIZATION_CODE_WEIGHTS
         if len(code) != 9 or not code[:8].isdigit() or (code[8] not in '0123456789X'):
             return False
         # 计算加权和
@@ -19,8 +27,40 @@ class Organization:
         # 比较实际校验码
         return expected_check_code.upper() == code[-1].upper()
 
+    @staticmethod
+    def verify_organization_code_batch(codes, weights=None) -> tuple:
+        """
+        批量验证组织机构代码，规则与verify_organization_code一致
+        :param codes: 组织机构代码列表、NumPy数组或pandas Series
+        :param weights: 权重数组
+        :return: (布尔数组, 失败原因数组)，失败原因为 'length'：长度错误，'char'：含非法字符，'check_code'：校验码错误，
+            校验通过时为空字符串
+        """
+        if weights is None:
+            weights = ORGANIZATION_CODE_WEIGHTS
+        values = as_str_array(codes)
+        reasons = np.full(values.shape[0], 'length', dtype='U10')
+        candidates = np.flatnonzero(np.char.str_len(values) == 9)
+        if candidates.size:
+            weights = np.asarray(weights[:8], dtype=np.int64)
+            chars = char_matrix(values[candidates], 9)
+            digits = chars[:, :8] - ord('0')
+            last = chars[:, 8]
+            # 前8位必须为数字，最后一位为数字或X
+            bad_char = ((digits < 0) | (digits > 9)).any(axis=1)
+            bad_char |= ~(((last >= ord('0')) & (last <= ord('9'))) | (last == ord('X')))
+            # 计算加权和并取模，10对应X
+            mod_result = (digits[:, :weights.shape[0]] @ weights) % 11
+            expected = np.where(mod_result == 10, ord('X'), mod_result + ord('0'))
+            reasons[candidates] = np.where(bad_char, 'char', np.where(expected == last, '', 'check_code'))
+        return reasons == '', reasons
+
 
 class OrganizationAsync(Organization):
     @staticmethod
     async def verify_organization_code(code: str, weights=None) -> bool:
         return Organization.verify_organization_code(code, weights)
+
+    @staticmethod
+    async def verify_organization_code_batch(codes, weights=None) -> tuple:
+        return Organization.verify_organization_code_batch(codes, weights)
@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_verification.public.schema import Schema, resolve_method
+
+
+def run_chunk(method, chunk, kwargs: dict) -> np.ndarray:
+    """在子进程中对一块数据执行检验方法"""
+    if callable(method):
+        scalar, batch, name = method, None, getattr(method, '__name__', 'rule')
+    else:
+        (scalar, batch), name = resolve_method(method), method
+    rule = {'method': name, 'scalar': scalar, 'batch': batch, 'kwargs': kwargs}
+    return Schema.run_rule(rule, chunk)
+
+
+def split_chunks(values, chunksize: int) -> list:
+    """
+    将输入按chunksize切分
+    :param values: 列表、NumPy数组、pandas Series或其他可迭代对象
+    :param chunksize: 每块的值数量
+    :return: object数组分块列表
+    """
+    if not hasattr(values, '__len__'):
+        values = list(values)
+    # 按object数组切分，元素保持原来的Python类型，避免混合类型列表被统一转为字符串、数值被转为NumPy标量
+    values = np.asarray(values, dtype=object).ravel()
+    return [values[start:start + chunksize] for start in range(0, values.shape[0], chunksize)]
+
+
+class ParallelExecutor:
+    def __init__(self, max_workers: int = None, chunksize: int = 100000):
+        """
+        多进程批量执行PublicDataVerification中的检验方法
+        :param max_workers: 最大进程数，默认为CPU核数
+        :param chunksize: 每个任务处理的值数量
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """进程池在首次使用时创建，之后重复使用，避免每次调用都启动进程"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shards(self, values) -> list:
+        """
+        将输入按chunksize切分
+        :param values: 列表、NumPy数组、pandas Series或其他可迭代对象
+        :return: object数组分块列表
+        """
+        return split_chunks(values, self.chunksize)
+
+    def map(self, method, values, **kwargs) -> np.ndarray:
+        """
+        并行对一组值执行检验方法，结果按输入顺序拼接
+        :param method: PublicDataVerification中的方法名，存在批量方法时每块整体执行；也可以是可被pickle的单值函数
+        :param values: 被验证值的列表、NumPy数组、pandas Series或其他可迭代对象
+        :param kwargs: 传递给检验方法的关键字参数
+        :return: 与输入等长的布尔数组
+        """
+        shards = self.shards(values)
+        if not shards:
+            return np.zeros(0, dtype=bool)
+        if len(shards) == 1 or self.max_workers == 1:
+            return np.concatenate([run_chunk(method, shard, kwargs) for shard in shards])
+        executor = self._get_executor()
+        futures = [executor.submit(run_chunk, method, shard, kwargs) for shard in shards]
+        return np.concatenate([future.result() for future in futures])
+
+    def validate(self, schema, df) -> tuple:
+        """
+        并行执行Schema中的全部规则，每条规则按列分块分发
+        :param schema: Schema对象，或用于构建Schema的规则映射
+        :param df: 被校验的DataFrame
+        :return: (结果表, 汇总表)，与Schema.validate一致
+        """
+        schema = schema if isinstance(schema, Schema) else Schema(schema)
+        missing = sorted({rule['column'] for rule in schema.rules} - set(df.columns))
+        if missing:
+            raise KeyError(f"Columns {missing} not found in DataFrame")
+        executor = self._get_executor()
+        futures = {}
+        for rule in schema.rules:
+            futures[rule['name']] = [executor.submit(run_chunk, rule['target'], shard, rule['kwargs'])
+                                     for shard in self.shards(df[rule['column']].to_numpy())]
+        results = pd.DataFrame(
+            {name: np.concatenate([f.result() for f in shard_futures]) if shard_futures else np.zeros(0, dtype=bool)
+             for name, shard_futures in futures.items()},
+            index=df.index, columns=[rule['name'] for rule in schema.rules], dtype=bool)
+        return results, schema.summarize(results)
+
+    def shutdown(self, wait: bool = True):
+        """
+        关闭进程池
+        :param wait: 是否等待正在执行的任务完成
+        :return:
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -1,4 +1,65 @@
 import re
+from types import MappingProxyType
+
+import numpy as np
+
+# 各地区邮政编码正则表达式
+POSTAL_CODE_PATTERNS = MappingProxyType({
+    'CN': r'^\d{6}$',
+    'US': r'^\d{5}(-\d{4})?$',
+    'GB': r'^(GIR 0AA|[A-PR-UWYZ][A-HK-Y]?[0-9][0-9]??[A-HJKPSTUW][ABD-HJLN-UW][A-IK-Y])$',
+    'DE': r'^\d{5}$',
+    'FR': r'^\d{5}$',
+    'AU': r'^\d{4}$',
+    'JP': r'^\d{3}-\d{4}$',
+    'IN': r'^\d{6}$',
+    'RU': r'^\d{6}$',
+    'IT': r'^\d{5}$',
+    'ES': r'^\d{5}$',
+    'NL': r'^\d{4}\s?[A-Z]{2}$',
+    'CH': r'^\d{4}$',
+    'BR': r'^\d{5}-\d{3}$',
+    'CA': r'^[ABCEGHJKLMNPRSTVXY]\d[ABCEGHJ-NPRSTV-Z] ?\d[ABCEGHJ-NPRSTV-Z]\d$',
+    'AR': r'^\d{4}|\d{4}-\d{3}$',
+    'AT': r'^\d{4}$',
+    'BE': r'^\d{4}$',
+    'CL': r'^\d{3}-\d{4}$',
+    'CO': r'^\d{6}$',
+    'DK': r'^\d{4}$',
+    'FI': r'^\d{5}$',
+    'GR': r'^\d{5}$',
+    'HU': r'^\d{4}$',
+    'ID': r'^\d{5}$',
+    'IE': r'^[AC-FHKNPRTVWXYZ]{3}\d{4}$',
+    'IL': r'^\d{5}$',
+    'KR': r'^\d{5}|\d{6}$',
+    'LU': r'^\d{4}$',
+    'MY': r'^\d{5}$',
+    'MX': r'^\d{5}$',
+    'NZ': r'^\d{4}$',
+    'NO': r'^\d{4}$',
+    'PL': r'^\d{2}-\d{3}$',
+    'PT': r'^\d{4}-\d{3}$',
+    'RO': r'^\d{6}$',
+    'SG': r'^\d{6}$',
+    'ZA': r'^\d{4}$',
+    'SE': r'^\d{3}\s?\d{2}$',
+    'TH': r'^\d{5}$',
+    'TR': r'^\d{5}$',
+    'UA': r'^\d{5}$',
+    'VN': r'^\d{6}$',
+})
+# 预编译的各地区邮政编码正则表达式，导入时构建一次
+COMPILED_POSTAL_CODE_PATTERNS = MappingProxyType(
+    {country: re.compile(pattern) for country, pattern in POSTAL_CODE_PATTERNS.items()})
+
+
+def _get_postal_pattern(country_code: str) -> re.Pattern:
+    """获取地区对应的预编译正则表达式，地区不支持时抛出ValueError"""
+    pattern = COMPILED_POSTAL_CODE_PATTERNS.get(country_code.upper())
+    if pattern is None:
+        raise ValueError(f"Unsupported country code '{country_code.upper()}'")
+    return pattern
 
 
 class Postal:
@@ -13,60 +74,39 @@ class Postal:
             PL-波兰，PT-葡萄牙，RO-罗马尼亚，SG-新加坡，ZA-南非，SE-瑞典，TH-泰国，TR-土耳其，UA-乌克兰，VN-越南
         :return:
         """
-        country_code = country_code.upper()
-        regex_patterns = {
-            'CN': r'^\d{6}$',
-            'US': r'^\d{5}(-\d{4})?$',
-            'GB': r'^(GIR 0AA|[A-PR-UWYZ][A-HK-Y]?[0-9][0-9]??[A-HJKPSTUW][ABD-HJLN-UW][A-IK-Y])$',
-            'DE': r'^\d{5}$',
-            'FR': r'^\d{5}$',
-            'AU': r'^\d{4}$',
-            'JP': r'^\d{3}-\d{4}$',
-            'IN': r'^\d{6}$',
-            'RU': r'^\d{6}$',
-            'IT': r'^\d{5}$',
-            'ES': r'^\d{5}$',
-            'NL': r'^\d{4}\s?[A-Z]{2}$',
-            'CH': r'^\d{4}$',
-            'BR': r'^\d{5}-\d{3}$',
-            'CA': r'^[ABCEGHJKLMNPRSTVXY]\d[ABCEGHJ-NPRSTV-Z] ?\d[ABCEGHJ-NPRSTV-Z]\d$',
-            'AR': r'^\d{4}|\d{4}-\d{3}$',
-            'AT': r'^\d{4}$',
-            'BE': r'^\d{4}$',
-            'CL': r'^\d{3}-\d{4}$',
-            'CO': r'^\d{6}$',
-            'DK': r'^\d{4}$',
-            'FI': r'^\d{5}$',
-            'GR': r'^\d{5}$',
-            'HU': r'^\d{4}$',
-            'ID': r'^\d{5}$',
-            'IE': r'^[AC-FHKNPRTVWXYZ]{3}\d{4}$',
-            'IL': r'^\d{5}$',
-            'KR': r'^\d{5}|\d{6}$',
-            'LU': r'^\d{4}$',
-            'MY': r'^\d{5}$',
-            'MX': r'^\d{5}$',
-            'NZ': r'^\d{4}$',
-            'NO': r'^\d{4}$',
-            'PL': r'^\d{2}-\d{3}$',
-            'PT': r'^\d{4}-\d{3}$',
-            'RO': r'^\d{6}$',
-            'SG': r'^\d{6}$',
-            'ZA': r'^\d{4}$',
-            'SE': r'^\d{3}\s?\d{2}$',
-            'TH': r'^\d{5}$',
-            'TR': r'^\d{5}$',
-            'UA': r'^\d{5}$',
-            'VN': r'^\d{6}$',
-        }
-        pattern = regex_patterns.get(country_code)
-        if not pattern:
-            raise ValueError(f"Unsupported country code '{country_code}'")
+        return bool(_get_postal_pattern(country_code).match(postal_code))
 
-        return bool(re.match(pattern, postal_code))
+    @staticmethod
+    def postal_code_batch(postal_codes, country_codes='CN') -> np.ndarray:
+        """
+        批量验证邮政编码是否正确，按地区分组后每组只解析一次正则表达式，非字符串编码视为不合法
+        :param postal_codes: 被验证编码列表、NumPy数组或pandas Series
+        :param country_codes: 地区，可以是单个地区或与postal_codes等长的地区序列，支持的地区同postal_code
+        :return: 与输入等长的布尔数组
+        """
+        postal_codes = np.asarray(postal_codes, dtype=object).ravel()
+        result = np.zeros(postal_codes.shape[0], dtype=bool)
+        if isinstance(country_codes, str):
+            groups = {country_codes: np.arange(postal_codes.shape[0])}
+        else:
+            country_codes = np.asarray(country_codes, dtype=object).ravel()
+            if country_codes.shape[0] != postal_codes.shape[0]:
+                raise ValueError("country_codes must have the same length as postal_codes")
+            countries, inverse = np.unique(country_codes.astype(str), return_inverse=True)
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.searchsorted(inverse[order], np.arange(countries.shape[0] + 1))
+            groups = {country: order[bounds[k]:bounds[k + 1]] for k, country in enumerate(countries)}
+        for country, rows in groups.items():
+            match = _get_postal_pattern(country).match
+            result[rows] = [isinstance(code, str) and match(code) is not None for code in postal_codes[rows]]
+        return result
 
 
 class PostalAsync(Postal):
     @staticmethod
     async def postal_code(postal_code, country_code='CN'):
         return Postal.postal_code(postal_code, country_code)
+
+    @staticmethod
+    async def postal_code_batch(postal_codes, country_codes='CN'):
+        return Postal.postal_code_batch(postal_codes, country_codes)
@@ -1,4 +1,88 @@
 import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PatternRegistry:
+    def __init__(self, maxsize: int = 512):
+        """
+        正则表达式编译缓存，按最近最少使用（LRU）淘汰
+        :param maxsize: 最多缓存的正则表达式数量
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._patterns = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pattern, flags: int = 0) -> re.Pattern:
+        """
+        获取编译后的正则表达式，未缓存时编译并加入缓存
+        :param pattern: 正则表达式字符串或已编译的正则表达式
+        :param flags: 正则标志
+        :return:
+        """
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._patterns.move_to_end(key)
+                return compiled
+            self.misses += 1
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            self._patterns.move_to_end(key)
+            self._evict()
+        return compiled
+
+    def resize(self, maxsize: int):
+        """
+        调整缓存容量，超出部分立即淘汰
+        :param maxsize: 最多缓存的正则表达式数量
+        :return:
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """清空缓存与统计信息"""
+        with self._lock:
+            self._patterns.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        获取缓存统计信息
+        :return: 包含hits、misses、evictions、size、maxsize的字典
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self._patterns), 'maxsize': self.maxsize}
+
+    def _evict(self):
+        """淘汰最久未使用的正则表达式，调用方需持有锁"""
+        while len(self._patterns) > self.maxsize:
+            self._patterns.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._patterns)
+
+
+# 全局正则表达式缓存
+PATTERN_REGISTRY = PatternRegistry()
 
 
 class Regex:
@@ -10,10 +94,28 @@ class Regex:
         :param pattern: 正则表达式
         :return:
         """
-        return bool(re.match(pattern, value))
+        return bool(PATTERN_REGISTRY.get(pattern).match(value))
+
+    @staticmethod
+    def regex_batch(values, pattern: str) -> np.ndarray:
+        """
+        使用同一个正则表达式批量验证值的内容，非字符串元素视为不匹配
+        :param values: 被验证值的可迭代对象、NumPy数组或pandas Series
+        :param pattern: 正则表达式
+        :return: 与输入等长的布尔数组
+        """
+        match = PATTERN_REGISTRY.get(pattern).match
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        return np.fromiter((isinstance(v, str) and match(v) is not None for v in values), dtype=bool,
+                           count=len(values))
 
 
 class RegexAsync(Regex):
     @staticmethod
     async def regex(value: str, pattern: str) -> bool:
         return Regex.regex(value, pattern)
+
+    @staticmethod
+    async def regex_batch(values, pattern: str) -> np.ndarray:
+        return Regex.regex_batch(values, pattern)
@@ -1,3 +1,17 @@
+import numpy as np
+
+from data_verification.public.utils import as_str_array, char_matrix
+
+# 默认权重数组
+USCC_WEIGHTS = (31, 29, 23, 19, 17, 13, 11, 7, 5, 3, 31, 29, 23, 19, 17, 13, 11)
+# 默认校验码映射表
+USCC_CHECK_CODE_MAP = "0ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# 字符码位到数值的查找表，数字对应0-9，大写字母对应10-35，其余为-1
+USCC_CHAR_VALUES = np.full(128, -1, dtype=np.int64)
+USCC_CHAR_VALUES[ord('0'):ord('9') + 1] = np.arange(10)
+USCC_CHAR_VALUES[ord('A'):ord('Z') + 1] = np.arange(10, 36)
+
+
 class SCC:
     @staticmethod
     def verify_uscc(code: str, weights: list = None, check_code_map: str = None) -> bool:
@@ -9,9 +23,9 @@ class SCC:
         :return:
         """
         if weights is None:
-            weights = [31, 29, 23, 19, 17, 13, 11, 7, 5, 3, 31, 29, 23, 19, 17, 13, 11]
+            weights = USCC_WEIGHTS
         if check_code_map is None:
-            check_code_map = "0ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            check_code_map = USCC_CHECK_CODE_MAP
         if len(code) != 18:
             return False
         # 计算加权和
@@ -34,6 +48,51 @@ class SCC:
         """
         return SCC.verify_uscc(code, weights, check_code_map)
 
+    @staticmethod
+    def verify_uscc_batch(codes, weights: list = None, check_code_map: str = None) -> tuple:
+        """
+        批量统一社会信用代码校验，规则与verify_uscc一致
+        :param codes: 统一社会信用代码列表、NumPy数组或pandas Series
+        :param weights: 权重数组
+        :param check_code_map: 校验码映射表
+        :return: (布尔数组, 失败原因数组)，失败原因为 'length'：长度错误，'char'：含非法字符，'check_code'：校验码错误，
+            校验通过时为空字符串
+        """
+        if weights is None:
+            weights = USCC_WEIGHTS
+        if check_code_map is None:
+            check_code_map = USCC_CHECK_CODE_MAP
+        values = as_str_array(codes)
+        reasons = np.full(values.shape[0], 'length', dtype='U10')
+        candidates = np.flatnonzero(np.char.str_len(values) == 18)
+        if candidates.size:
+            weights = np.asarray(weights[:17], dtype=np.int64)
+            chars = char_matrix(values[candidates], 18)
+            body = chars[:, :weights.shape[0]]
+            # 通过查找表把字符映射为数值，非ASCII字符同样视为非法
+            char_values = USCC_CHAR_VALUES[np.minimum(body, 127)]
+            char_values[body > 127] = -1
+            bad_char = (char_values < 0).any(axis=1)
+            # 计算加权和并取模
+            mod_result = (char_values @ weights) % 31
+            # 校验码映射表不足31位时，超出部分不匹配任何字符
+            code_points = np.full(31, -1, dtype=np.int64)
+            code_points[:min(len(check_code_map), 31)] = [ord(c) for c in check_code_map[:31]]
+            matched = code_points[mod_result] == chars[:, 17]
+            reasons[candidates] = np.where(bad_char, 'char', np.where(matched, '', 'check_code'))
+        return reasons == '', reasons
+
+    @staticmethod
+    def verify_cscc_batch(codes, weights: list = None, check_code_map: str = None) -> tuple:
+        """
+        批量企业社会信用代码校验
+        :param codes: 企业社会信用代码列表、NumPy数组或pandas Series
+        :param weights: 权重数组
+        :param check_code_map: 校验码映射表
+        :return: (布尔数组, 失败原因数组)
+        """
+        return SCC.verify_uscc_batch(codes, weights, check_code_map)
+
 
 class SCCAsync(SCC):
     @staticmethod
@@ -43,3 +102,11 @@ class SCCAsync(SCC):
     @staticmethod
     async def verify_cscc(code: str, weights: list = None, check_code_map: str = None) -> bool:
         return SCC.verify_uscc(code, weights, check_code_map)
+
+    @staticmethod
+    async def verify_uscc_batch(codes, weights: list = None, check_code_map: str = None) -> tuple:
+        return SCC.verify_uscc_batch(codes, weights, check_code_map)
+
+    @staticmethod
+    async def verify_cscc_batch(codes, weights: list = None, check_code_map: str = None) -> tuple:
+        return SCC.verify_uscc_batch(codes, weights, check_code_map)
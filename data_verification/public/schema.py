@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+from data_verification.public.scc import SCC
+from data_verification.public.time import Time
+from data_verification.public.empty import Empty
+from data_verification.public.email import Email
+from data_verification.public.regex import Regex
+from data_verification.public.unique import Unique
+from data_verification.public.postal import Postal
+from data_verification.public.decode import Decode
+from data_verification.public.number import Number
+from data_verification.public.compare import Compare
+from data_verification.public.id_number import IDNumber
+from data_verification.public.ip_address import IPAddress
+from data_verification.public.verify_type import VerifyType
+from data_verification.public.coordinates import Coordinates
+from data_verification.public.phone_number import PhoneNumber
+from data_verification.public.organization import Organization
+from data_verification.public.admin_division import AdminDivision
+
+# 可在规则中引用的检验基类，与PublicDataVerification的基类一致
+VERIFICATION_CLASSES = (Regex, SCC, Number, Email, IDNumber, Organization, Compare, VerifyType, Coordinates, Time,
+                        IPAddress, PhoneNumber, AdminDivision, Decode, Postal, Empty, Unique)
+# 批量方法与单值方法参数名不一致时的映射
+BATCH_ARGUMENT_NAMES = {
+    'postal_code': {'country_code': 'country_codes'},
+}
+
+
+def resolve_method(method: str):
+    """
+    根据方法名查找检验方法及其批量方法
+    :param method: PublicDataVerification中的方法名
+    :return: (单值方法, 批量方法)，没有批量方法时批量方法为None
+    """
+    for cls in VERIFICATION_CLASSES:
+        scalar = getattr(cls, method, None)
+        if scalar is not None:
+            return scalar, getattr(cls, f'{method}_batch', None)
+    raise AttributeError(f"Method {method} not found in PublicDataVerification")
+
+
+class Schema:
+    def __init__(self, rules: dict = None):
+        """
+        DataFrame声明式校验规则，按列整体执行PublicDataVerification中的检验方法
+        :param rules: 列名到规则列表的映射，规则可以是方法名、(方法名, 参数字典)或(规则名, 方法名, 参数字典)，
+            方法名也可以替换为接收单个值并返回布尔值的函数
+        """
+        self.rules = []
+        for column, column_rules in (rules or {}).items():
+            if isinstance(column_rules, (str, tuple)) or callable(column_rules):
+                column_rules = [column_rules]
+            for rule in column_rules:
+                if isinstance(rule, str) or callable(rule):
+                    self.add_rule(column, rule)
+                elif len(rule) == 2:
+                    self.add_rule(column, rule[0], **rule[1])
+                elif len(rule) == 3:
+                    self.add_rule(column, rule[1], name=rule[0], **rule[2])
+                else:
+                    raise ValueError(f"Invalid rule {rule!r} for column '{column}'")
+
+    def add_rule(self, column: str, method, name: str = None, **kwargs):
+        """
+        添加一条校验规则
+        :param column: 被校验的列名
+        :param method: PublicDataVerification中的方法名，或接收单个值并返回布尔值的函数
+        :param name: 规则名，默认为 '列名:方法名'
+        :param kwargs: 传递给检验方法的关键字参数
+        :return: Schema本身，便于链式调用
+        """
+        if callable(method):
+            scalar, batch = method, None
+            method_name = getattr(method, '__name__', 'rule')
+        else:
+            scalar, batch = resolve_method(method)
+            method_name = method
+        name = name or f'{column}:{method_name}'
+        if any(rule['name'] == name for rule in self.rules):
+            raise ValueError(f"Duplicate rule name '{name}'")
+        self.rules.append({'name': name, 'column': column, 'method': method_name, 'target': method,
+                           'scalar': scalar, 'batch': batch, 'kwargs': kwargs})
+        return self
+
+    @staticmethod
+    def run_rule(rule: dict, values) -> np.ndarray:
+        """
+        对一列数据执行一条规则，有批量方法时整列执行，否则逐值调用单值方法
+        :param rule: add_rule生成的规则
+        :param values: 被校验的列
+        :return: 与输入等长的布尔数组
+        """
+        if rule['batch'] is not None:
+            renames = BATCH_ARGUMENT_NAMES.get(rule['method'], {})
+            kwargs = {renames.get(key, key): value for key, value in rule['kwargs'].items()}
+            mask = rule['batch'](values, **kwargs)
+            # 部分批量方法返回(布尔数组, 失败原因数组)
+            if isinstance(mask, tuple):
+                mask = mask[0]
+            return np.asarray(mask, dtype=bool)
+        scalar, kwargs = rule['scalar'], rule['kwargs']
+        mask = np.zeros(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            # 单值方法按Python类型判断（如isinstance(value, int)），NumPy标量先转为对应的Python值
+            if isinstance(value, np.generic):
+                value = value.item()
+            try:
+                result = scalar(value, **kwargs)
+            except (TypeError, ValueError, AttributeError):
+                continue
+            mask[i] = result is True or isinstance(result, np.bool_) and bool(result)
+        return mask
+
+    def validate(self, df: pd.DataFrame) -> tuple:
+        """
+        对DataFrame执行全部规则
+        :param df: 被校验的DataFrame
+        :return: (结果表, 汇总表)，结果表每行对应df的一行、每列对应一条规则，汇总表包含每条规则的通过数、失败数和通过率
+        """
+        missing = sorted({rule['column'] for rule in self.rules} - set(df.columns))
+        if missing:
+            raise KeyError(f"Columns {missing} not found in DataFrame")
+        results = pd.DataFrame(
+            {rule['name']: self.run_rule(rule, df[rule['column']].to_numpy()) for rule in self.rules},
+            index=df.index, columns=[rule['name'] for rule in self.rules], dtype=bool)
+        return results, self.summarize(results)
+
+    def summarize(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        汇总规则执行结果
+        :param results: validate返回的结果表
+        :return: 以规则名为索引，包含column、method、passed、failed、pass_rate列的汇总表
+        """
+        passed = results.sum(axis=0).astype(int)
+        total = len(results)
+        return pd.DataFrame({
+            'column': [rule['column'] for rule in self.rules],
+            'method': [rule['method'] for rule in self.rules],
+            'passed': passed.to_numpy(),
+            'failed': total - passed.to_numpy(),
+            'pass_rate': passed.to_numpy() / total if total else np.ones(len(self.rules)),
+        }, index=results.columns)
+
+    def __len__(self):
+        return len(self.rules)
@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_verification.public.schema import Schema
+
+# 需要数值输入的方法，CSV中对应的列保持pandas自动推断类型，其余列按字符串读取以保留前导零
+NUMERIC_METHODS = {'number_range', 'check_precision', 'timestamp_range', 'verify_latitude', 'verify_longitude',
+                   'verify_china_latitude', 'verify_china_longitude', 'verify_global_latitude', 'verify_global_longitude'}
+
+
+class StreamValidator:
+    def __init__(self, schema, chunksize: int = 100000):
+        """
+        CSV与JSON Lines文件流式校验，按块读取文件并执行校验规则，内存占用只与块大小有关
+        :param schema: Schema对象，或用于构建Schema的规则映射
+        :param chunksize: 每块读取的行数
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        self.schema = schema if isinstance(schema, Schema) else Schema(schema)
+        self.chunksize = chunksize
+
+    def _columns(self) -> list:
+        """规则涉及的列，按首次出现顺序"""
+        return list(dict.fromkeys(rule['column'] for rule in self.schema.rules))
+
+    def read_csv(self, file_path: str, **kwargs):
+        """
+        按块读取CSV文件，只读取规则涉及的列
+        :param file_path: CSV文件路径
+        :param kwargs: 传递给pandas.read_csv的关键字参数
+        :return: DataFrame块生成器
+        """
+        if 'dtype' not in kwargs:
+            numeric = {rule['column'] for rule in self.schema.rules if rule['method'] in NUMERIC_METHODS}
+            kwargs['dtype'] = {column: str for column in self._columns() if column not in numeric}
+        kwargs.setdefault('usecols', self._columns())
+        with pd.read_csv(file_path, chunksize=self.chunksize, **kwargs) as reader:
+            yield from reader
+
+    def read_jsonl(self, file_path: str, **kwargs):
+        """
+        按块读取JSON Lines文件
+        :param file_path: JSON Lines文件路径
+        :param kwargs: 传递给pandas.read_json的关键字参数
+        :return: DataFrame块生成器
+        """
+        kwargs.setdefault('dtype', False)
+        columns = self._columns()
+        with pd.read_json(file_path, lines=True, chunksize=self.chunksize, **kwargs) as reader:
+            for chunk in reader:
+                # 缺少的列按空值处理，保证每块列一致
+                yield chunk.reindex(columns=columns)
+
+    def read_file(self, file_path: str, **kwargs):
+        """
+        根据扩展名按块读取CSV（.csv、.tsv、.txt）或JSON Lines（.jsonl、.ndjson、.json）文件
+        :param file_path: 文件路径
+        :param kwargs: 传递给pandas读取函数的关键字参数
+        :return: DataFrame块生成器
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in ('.jsonl', '.ndjson', '.json'):
+            return self.read_jsonl(file_path, **kwargs)
+        if extension in ('.csv', '.tsv', '.txt'):
+            if extension == '.tsv':
+                kwargs.setdefault('sep', '\t')
+            return self.read_csv(file_path, **kwargs)
+        raise ValueError(f"Unsupported file type '{extension}'")
+
+    def iter_validate(self, chunks):
+        """
+        逐块执行校验规则
+        :param chunks: DataFrame块的可迭代对象
+        :return: 生成器，每块产出一个字典，包含chunk：块序号，start：块首行的行号，rows：块行数，results：块结果表，
+            summary：块汇总表，totals：截至当前块的累计汇总表
+        """
+        passed = np.zeros(len(self.schema), dtype=np.int64)
+        rows = 0
+        for number, chunk in enumerate(chunks):
+            chunk = chunk.reset_index(drop=True)
+            chunk.index += rows
+            results, summary = self.schema.validate(chunk)
+            passed += summary['passed'].to_numpy()
+            start, rows = rows, rows + len(chunk)
+            totals = summary[['column', 'method']].copy()
+            totals['passed'] = passed
+            totals['failed'] = rows - passed
+            totals['pass_rate'] = passed / rows if rows else 1.0
+            yield {'chunk': number, 'start': start, 'rows': len(chunk), 'results': results, 'summary': summary,
+                   'totals': totals}
+
+    def iter_file(self, file_path: str, **kwargs):
+        """
+        按块校验CSV或JSON Lines文件
+        :param file_path: 文件路径
+        :param kwargs: 传递给pandas读取函数的关键字参数
+        :return: 生成器，产出内容同iter_validate
+        """
+        return self.iter_validate(self.read_file(file_path, **kwargs))
+
+    def validate_file(self, file_path: str, max_failures: int = 0, **kwargs) -> tuple:
+        """
+        校验整个文件，只保留累计汇总与有限数量的失败行号
+        :param file_path: 文件路径
+        :param max_failures: 每条规则最多记录的失败行号数量，默认为 0 表示不记录
+        :param kwargs: 传递给pandas读取函数的关键字参数
+        :return: (累计汇总表, 规则名到失败行号列表的字典)
+        """
+        totals = None
+        failures = {rule['name']: [] for rule in self.schema.rules}
+        for chunk in self.iter_file(file_path, **kwargs):
+            totals = chunk['totals']
+            if max_failures:
+                for name, mask in chunk['results'].items():
+                    remaining = max_failures - len(failures[name])
+                    if remaining > 0:
+                        failures[name].extend(mask.index[~mask.to_numpy()][:remaining].tolist())
+        if totals is None:
+            totals = self.schema.summarize(pd.DataFrame(columns=[rule['name'] for rule in self.schema.rules],
+                                                        dtype=bool))
+        return totals, failures
@@ -1,5 +1,47 @@
+import re
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
+from data_verification.public.utils import as_str_array, char_matrix
+
+# 定宽格式中各指令的宽度，格式只包含这些指令和普通字符时可以按位置直接切片解析
+FIXED_WIDTH_DIRECTIVES = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2}
+# 表示ISO-8601格式的time_format取值
+ISO_FORMAT = 'ISO8601'
+# pandas的ISO-8601解析比datetime.fromisoformat宽松，只采信符合该形式的值
+ISO_PATTERN = r'[0-9]{4}-[0-9]{2}-[0-9]{2}(?:[T ][0-9]{2}(?::[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?)?)?'
+
+
+def parse_strict(values: np.ndarray, time_format: str) -> np.ndarray:
+    """
+    使用pandas整列解析时间，只保留与单值解析（strptime或fromisoformat）结果一致的值。
+    pandas的解析比strptime宽松（如接受负数年份、值为60的秒、超过6位的%f），
+    解析结果按原格式格式化后须与原值相同；ISO-8601格式的原值须为 'YYYY-MM-DD[THH[:MM[:SS[.fff[fff]]]]]'
+    （日期与时间之间也可以是空格），未通过复核的值需交给单值方法处理
+    :param values: 时间字符串的object数组，非字符串元素为None
+    :param time_format: 时间格式，为 'ISO8601' 时按ISO-8601解析
+    :return: datetime64[us]数组，无法解析或未通过复核的值为NaT
+    """
+    nat = np.full(values.shape[0], np.datetime64('NaT', 'us'))
+    series = pd.Series(values, dtype=object)
+    try:
+        parsed = pd.to_datetime(series, format=time_format, errors='coerce')
+    except (ValueError, TypeError):
+        return nat
+    if not pd.api.types.is_datetime64_dtype(parsed.dtype):
+        # 带时区等pandas无法统一表示的结果交给单值方法处理
+        return nat
+    if time_format == ISO_FORMAT:
+        trusted = series.str.fullmatch(ISO_PATTERN)
+    else:
+        # strftime的%Y对1000年以前的年份输出不足4位，这些年份同样交给单值方法处理
+        year = parsed.dt.year
+        trusted = (parsed.dt.strftime(time_format) == series) & (year >= 1000) & (year <= 9999)
+    trusted = trusted.fillna(False).to_numpy(dtype=bool)
+    return np.where(trusted, parsed.to_numpy().astype('M8[us]'), nat)
+
 
 class Time:
     @staticmethod
@@ -53,6 +95,20 @@ class Time:
             print("Invalid date format")
             return False
 
+    @staticmethod
+    def datetime_range_batch(times, start_time: str, end_time: str, time_format: str = "%Y-%m-%d %H:%M",
+                             pattern: int = 0) -> np.ndarray:
+        """
+        批量验证带有格式的时间是否在某个区间，起止时间只解析一次
+        :param times: 被验证时间列表、NumPy数组或pandas Series
+        :param start_time: 起始时间
+        :param end_time: 结束时间
+        :param time_format: 时间格式，为 'ISO8601' 时按ISO-8601解析
+        :param pattern: 区间判断类型，0：前闭后闭，1：前闭后开，2：前开后闭，3：前开后开
+        :return: 与输入等长的布尔数组
+        """
+        return TimeRange(start_time, end_time, time_format, pattern).contains_batch(times)
+
     @staticmethod
     def timestamp_range(timestamp: int, start_timestamp: int, end_timestamp: int, pattern: int = 0) -> bool:
         """
@@ -91,6 +147,22 @@ class Time:
         except ValueError:
             return False
 
+    @staticmethod
+    def verify_date_batch(date_strings, date_format: str = "%Y-%m-%d") -> np.ndarray:
+        """
+        批量对日期进行验证，先整列解析，解析失败或与strptime规则不一致的值再按verify_date逐个复核，
+        非字符串元素视为不合法
+        :param date_strings: 被验证的日期列表、NumPy数组或pandas Series
+        :param date_format: 日期格式化规则
+        :return: 与输入等长的布尔数组
+        """
+        values = np.asarray(date_strings, dtype=object).ravel()
+        is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=values.shape[0])
+        result = ~np.isnat(parse_strict(np.where(is_str, values, None), date_format)) & is_str
+        for i in np.flatnonzero(is_str & ~result):
+            result[i] = Time.verify_date(values[i], date_format)
+        return result
+
     @staticmethod
     def verify_timestamp(timestamp: str) -> bool:
         """
@@ -132,6 +204,138 @@ class Time:
         return time_diff <= threshold
 
 
+def _fixed_width_layout(time_format: str):
+    """
+    解析定宽格式
+    :param time_format: 时间格式
+    :return: (总宽度, {指令: 起始位置}, [(位置, 普通字符)])，不是定宽格式时返回None
+    """
+    fields, literals, position = {}, [], 0
+    for token in re.findall(r'%.|[^%]', time_format, flags=re.S):
+        if token == '%%':
+            literals.append((position, '%'))
+            position += 1
+        elif token.startswith('%'):
+            directive = token[1]
+            if directive not in FIXED_WIDTH_DIRECTIVES or directive in fields:
+                return None
+            fields[directive] = position
+            position += FIXED_WIDTH_DIRECTIVES[directive]
+        elif token.isspace():
+            # strptime中的空白可以匹配任意数量的空白，无法按定宽处理
+            return None
+        else:
+            literals.append((position, token))
+            position += 1
+    return position, fields, literals
+
+
+class TimeRange:
+    def __init__(self, start_time: str, end_time: str, time_format: str = "%Y-%m-%d %H:%M", pattern: int = 0):
+        """
+        预先解析好起止时间的时间区间，用于对整列时间重复判断
+        :param start_time: 起始时间
+        :param end_time: 结束时间
+        :param time_format: 时间格式，为 'ISO8601' 时按ISO-8601解析
+        :param pattern: 区间判断类型，0：前闭后闭，1：前闭后开，2：前开后闭，3：前开后开
+        """
+        if pattern not in [0, 1, 2, 3]:
+            raise ValueError("pattern must be 0 or 1, 2 or 3")
+        self.time_format = time_format
+        self.pattern = pattern
+        self.start = self.parse(start_time)
+        self.end = self.parse(end_time)
+        self._start64 = np.datetime64(self.start, 'us')
+        self._end64 = np.datetime64(self.end, 'us')
+        self._layout = None if time_format == ISO_FORMAT else _fixed_width_layout(time_format)
+
+    def parse(self, time: str) -> datetime:
+        """
+        按区间的时间格式解析单个时间
+        :param time: 被解析时间
+        :return:
+        """
+        if self.time_format == ISO_FORMAT:
+            return datetime.fromisoformat(time)
+        return datetime.strptime(time, self.time_format)
+
+    def contains(self, time: str) -> bool:
+        """
+        判断单个时间是否在区间内
+        :param time: 被验证时间
+        :return:
+        """
+        try:
+            dt = self.parse(time)
+            if self.pattern == 0:
+                return self.start <= dt <= self.end
+            elif self.pattern == 1:
+                return self.start <= dt < self.end
+            elif self.pattern == 2:
+                return self.start < dt <= self.end
+            return self.start < dt < self.end
+        except (ValueError, TypeError):
+            return False
+
+    def contains_batch(self, times) -> np.ndarray:
+        """
+        批量判断时间是否在区间内，定宽格式按位置切片解析，ISO-8601与其他格式整列解析，
+        无法解析或与单值解析规则不一致的值逐个复核，非字符串元素视为不在区间内
+        :param times: 被验证时间列表、NumPy数组或pandas Series
+        :return: 与输入等长的布尔数组
+        """
+        values = as_str_array(times)
+        raw = np.asarray(times, dtype=object).ravel()
+        is_str = np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=raw.shape[0])
+        if self._layout is not None:
+            # 定宽解析的值与strptime一致，宽度或字段不合法的值（如未补零的值）直接交给单值方法
+            parsed = self._parse_fixed_width(values)
+        else:
+            parsed = parse_strict(np.where(is_str, raw, None), self.time_format)
+        result = self._compare(parsed) & is_str
+        for i in np.flatnonzero(is_str & np.isnat(parsed)):
+            result[i] = self.contains(values[i])
+        return result
+
+    def _parse_fixed_width(self, values: np.ndarray) -> np.ndarray:
+        """按位置切片解析定宽格式的时间，不合法的值返回NaT"""
+        width, fields, literals = self._layout
+        parsed = np.full(values.shape[0], np.datetime64('NaT', 'us'))
+        candidates = np.flatnonzero(np.char.str_len(values) == width)
+        if candidates.size == 0 or width == 0:
+            return parsed
+        chars = char_matrix(values[candidates], width)
+        valid = np.ones(candidates.shape[0], dtype=bool)
+        for position, literal in literals:
+            valid &= chars[:, position] == ord(literal)
+        parts = {}
+        for directive, position in fields.items():
+            digits = chars[:, position:position + FIXED_WIDTH_DIRECTIVES[directive]] - ord('0')
+            valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+            parts[directive] = digits @ (10 ** np.arange(digits.shape[1] - 1, -1, -1))
+        # strptime缺省的年为1900，月、日为1，时、分、秒为0
+        year = parts.get('Y', np.full(candidates.shape[0], 1900))
+        month = parts.get('m', np.ones(candidates.shape[0], dtype=np.int64))
+        day = parts.get('d', np.ones(candidates.shape[0], dtype=np.int64))
+        hour = parts.get('H', np.zeros(candidates.shape[0], dtype=np.int64))
+        minute = parts.get('M', np.zeros(candidates.shape[0], dtype=np.int64))
+        second = parts.get('S', np.zeros(candidates.shape[0], dtype=np.int64))
+        valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (hour <= 23) & (minute <= 59) & (
+                second <= 59)
+        month_start = ((np.where(valid, year, 1970) - 1970) * 12 + np.where(valid, month, 1) - 1).astype('M8[M]')
+        days_in_month = ((month_start + 1).astype('M8[D]') - month_start.astype('M8[D]')).astype(np.int64)
+        valid &= day <= days_in_month
+        stamp = (month_start.astype('M8[us]') + ((day - 1) * 86400 + hour * 3600 + minute * 60 + second) * 1000000)
+        parsed[candidates[valid]] = stamp[valid]
+        return parsed
+
+    def _compare(self, parsed: np.ndarray) -> np.ndarray:
+        """按区间类型比较已解析的时间，NaT不在区间内"""
+        lower = parsed >= self._start64 if self.pattern in [0, 1] else parsed > self._start64
+        upper = parsed <= self._end64 if self.pattern in [0, 2] else parsed < self._end64
+        return lower & upper & ~np.isnat(parsed)
+
+
 class TimeAsync(Time):
     @staticmethod
     async def time_range(time: str, start_time: str, end_time: str, time_format: str = None, pattern: int = 0) -> bool:
@@ -141,6 +345,10 @@ class TimeAsync(Time):
     async def verify_date(date_string: str, date_format: str = "%Y-%m-%d") -> bool:
         return Time.verify_date(date_string, date_format)
 
+    @staticmethod
+    async def verify_date_batch(date_strings, date_format: str = "%Y-%m-%d") -> np.ndarray:
+        return Time.verify_date_batch(date_strings, date_format)
+
     @staticmethod
     async def verify_timestamp(timestamp: str) -> bool:
         return Time.verify_timestamp(timestamp)
@@ -150,6 +358,11 @@ class TimeAsync(Time):
                              pattern: int = 0) -> bool:
         return Time.datetime_range(time, start_time, end_time, time_format, pattern)
 
+    @staticmethod
+    async def datetime_range_batch(times, start_time: str, end_time: str, time_format: str = "%Y-%m-%d %H:%M",
+                                   pattern: int = 0) -> np.ndarray:
+        return Time.datetime_range_batch(times, start_time, end_time, time_format, pattern)
+
     @staticmethod
     async def timestamp_range(timestamp: int, start_timestamp: int, end_timestamp: int, pattern: int = 0) -> bool:
         return Time.timestamp_range(timestamp, start_timestamp, end_timestamp, pattern)
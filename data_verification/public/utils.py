@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def as_str_array(values) -> np.ndarray:
+    """
+    将列表、NumPy数组或pandas Series转为一维unicode数组，非字符串元素替换为空字符串
+    :param values: 被转换的值
+    :return:
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'U':
+        return values.ravel()
+    # 先转为object数组再判断类型，避免np.asarray将混合类型的列表统一转为字符串
+    array = np.asarray(values, dtype=object).ravel()
+    is_str = np.fromiter((isinstance(v, str) for v in array), dtype=bool, count=array.shape[0])
+    return np.where(is_str, array, '').astype(str)
+
+
+def char_matrix(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    将定长unicode数组转为字符码位矩阵
+    :param values: 长度均为width的unicode数组
+    :param width: 字符串长度
+    :return: n x width 的int64矩阵
+    """
+    return values.astype(f'U{width}').view(np.uint32).reshape(-1, width).astype(np.int64)
+
+
+def as_float_array(values) -> np.ndarray:
+    """
+    将列表、NumPy数组或pandas Series转为一维float64数组，非数值元素替换为NaN
+    :param values: 被转换的值
+    :return:
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in 'biuf':
+        return array.astype(np.float64).ravel()
+    array = array.astype(object).ravel()
+    return np.fromiter((v if isinstance(v, (int, float)) else np.nan for v in array), dtype=np.float64,
+                       count=array.shape[0])
@@ -20,5 +20,5 @@ setuptools.setup(
         "Operating System :: POSIX :: Linux",
     ],
     python_requires='>=3.5',  # 对python的最低版本要求
-    install_requires=["hashlib", "types", "re", "asyncio", "geopandas", "shapely", "decimal", "datetime"]  # 项目依赖的其他库
+    install_requires=["hashlib", "types", "re", "asyncio", "geopandas", "shapely>=2.0", "numpy", "pandas", "decimal", "datetime"]  # 项目依赖的其他库
 )
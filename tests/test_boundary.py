@@ -0,0 +1,48 @@
+import os
+
+import geopandas as gpd
+import pytest
+import shapely
+
+from data_verification.geo.boundary import BoundaryIndex
+
+
+def write_boundary(path, size):
+    gpd.GeoDataFrame(geometry=[shapely.box(0, 0, size, size)]).to_file(path)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    BoundaryIndex.clear_cache()
+    yield
+    BoundaryIndex.clear_cache()
+
+
+def test_cached_per_file(tmp_path):
+    path = write_boundary(tmp_path / 'boundary.shp', 1)
+    index = BoundaryIndex.from_file(path)
+    assert BoundaryIndex.from_file(path) is index
+    assert index.all_within([shapely.Point(0.5, 0.5)])
+
+
+def test_modified_file_replaces_old_index(tmp_path):
+    path = write_boundary(tmp_path / 'boundary.shp', 1)
+    old = BoundaryIndex.from_file(path)
+    write_boundary(path, 2)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    new = BoundaryIndex.from_file(path)
+    assert new is not old
+    assert new.all_within([shapely.Point(1.5, 1.5)])
+    assert len(BoundaryIndex._cache) == 1
+
+
+def test_cache_size_bound(tmp_path, monkeypatch):
+    monkeypatch.setattr(BoundaryIndex, 'cache_size', 2)
+    paths = [write_boundary(tmp_path / f'boundary{number}.shp', 1) for number in range(3)]
+    first = BoundaryIndex.from_file(paths[0])
+    BoundaryIndex.from_file(paths[1])
+    BoundaryIndex.from_file(paths[2])
+    assert len(BoundaryIndex._cache) == 2
+    assert BoundaryIndex.from_file(paths[0]) is not first
@@ -0,0 +1,43 @@
+import pytest
+
+from data_verification.geo.checks import ValidityChecks
+
+
+class CountingChecks(ValidityChecks):
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    def _validity_checks(self, **options) -> list:
+        return [(name, self._passed(name, passed), lambda passed=passed: 0 if passed else 1)
+                for name, passed in self.results]
+
+    def _passed(self, name, passed):
+        def run():
+            self.calls.append(name)
+            return passed
+        return run
+
+
+def test_missing_validity_checks_fails_at_construction():
+    class Incomplete(ValidityChecks):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_fail_fast_stops_at_first_failure():
+    checks = CountingChecks([('a', True), ('b', False), ('c', True)])
+    assert checks._run_validity_checks(fail_fast=True) is False
+    assert checks.calls == ['a', 'b']
+    checks.calls.clear()
+    assert checks._run_validity_checks(fail_fast=False) is False
+    assert checks.calls == ['a', 'b', 'c']
+
+
+def test_validity_report():
+    report = CountingChecks([('a', True), ('b', False)]).validity_report()
+    assert report.index.tolist() == ['a', 'b']
+    assert report['violations'].tolist() == [0, 1]
+    assert report['passed'].tolist() == [True, False]
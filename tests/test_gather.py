@@ -0,0 +1,20 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+import shapely
+
+from data_verification.gather import GeoDataValidatorAsync
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_create_with_executor(executor_class):
+    polygons = [shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1)]
+    boundary = [shapely.box(-1, -1, 3, 2)]
+
+    async def run():
+        with executor_class(max_workers=1) as executor:
+            validator = await GeoDataValidatorAsync.create(polygons, 'polygon_topology', boundary, executor=executor)
+        return await validator.check_validity()
+
+    assert asyncio.run(run()) is True
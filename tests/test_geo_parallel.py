@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import shapely
+
+from data_verification.geo.parallel import GeoParallelExecutor
+from data_verification.geo.topology import coverage_gaps
+
+
+def grid(size=3, skip=()):
+    return np.array([shapely.box(x, y, x + 1, y + 1) for x in range(size) for y in range(size) if (x, y) not in skip])
+
+
+@pytest.fixture(params=[(1, 1), (1, 9), (2, 9)], ids=['single', 'partitions', 'processes'])
+def executor(request):
+    max_workers, partitions = request.param
+    with GeoParallelExecutor(max_workers=max_workers, partitions=partitions) as executor:
+        yield executor
+
+
+def test_full_grid_has_no_gaps(executor):
+    assert executor.run('gaps', grid()).tolist() == []
+
+
+def test_t_junction_has_no_gaps(executor):
+    polygons = [shapely.box(0, 0, 2, 1), shapely.box(0, 1, 1, 2), shapely.box(1, 1, 2, 2)]
+    assert executor.run('gaps', polygons).tolist() == []
+
+
+def test_missing_centre_is_gap(executor):
+    polygons = grid(skip={(1, 1)})
+    assert executor.run('gaps', polygons).tolist() == list(range(8))
+
+
+def test_gaps_match_coverage_gaps(executor):
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 50, (400, 2))
+    polygons = shapely.box(corners[:, 0], corners[:, 1], corners[:, 0] + 3, corners[:, 1] + 3)
+    _, pairs = coverage_gaps(polygons)
+    assert executor.run('gaps', polygons).tolist() == np.unique(pairs[:, 1]).tolist()
+
+
+def test_single_polygon(executor):
+    assert executor.run('gaps', [shapely.box(0, 0, 1, 1)]).tolist() == []
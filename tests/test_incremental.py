@@ -0,0 +1,133 @@
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
+
+from data_verification.geo.incremental import IncrementalValidator
+
+pytest.importorskip('pyogrio')
+
+# 增量运行与全量运行应一致的检查结果
+RESULTS = ('features', 'invalid_geometry', 'outside_boundaries', 'line_intersections', 'dangling_nodes',
+           'dangling_node_ids', 'overlaps', 'holes', 'gaps', 'duplicates', 'valid')
+
+
+def lines():
+    # 0和1部分重合，2和3在端点相接，4孤立
+    return gpd.GeoDataFrame({'key': [10, 11, 12, 13, 14]}, geometry=[
+        shapely.LineString([(0, 0), (4, 4)]), shapely.LineString([(2, 2), (6, 6)]),
+        shapely.LineString([(10, 0), (12, 0)]), shapely.LineString([(12, 0), (14, 0)]),
+        shapely.LineString([(20, 0), (20, 5)])])
+
+
+def polygons():
+    # 0和1重叠，其余相邻
+    return gpd.GeoDataFrame({'key': [10, 11, 12, 13]}, geometry=[
+        shapely.box(0, 0, 2, 2), shapely.box(1, 0, 3, 2), shapely.box(3, 0, 5, 2), shapely.box(5, 0, 7, 2)])
+
+
+def full_run(path, tmp_path, id_column=None, **kwargs):
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'full.npz'), id_column=id_column)
+    validator.clear_state()
+    return validator.validate(**kwargs)
+
+
+def assert_same(incremental, full):
+    for key in RESULTS:
+        if key in full:
+            assert np.array_equal(np.asarray(incremental[key]), np.asarray(full[key])), key
+
+
+def test_state_round_trip(tmp_path):
+    path = str(tmp_path / 'lines.shp')
+    lines().to_file(path)
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'state.npz'), id_column='key')
+    first = validator.validate(tolerance=0.5)
+    assert first['added'].tolist() == [10, 11, 12, 13, 14]
+    assert first['line_intersections'].tolist() == [[10, 11]]
+    assert_same(first, full_run(path, tmp_path, id_column='key', tolerance=0.5))
+
+    state = validator.load_state()
+    assert state['ids'].tolist() == [10, 11, 12, 13, 14]
+    assert state['meta']['kind'] == 'line'
+
+    # 没有变化时沿用全部结果
+    again = validator.validate(tolerance=0.5)
+    assert again['added'].tolist() == again['changed'].tolist() == again['deleted'].tolist() == []
+    assert again['rechecked'] == 0
+    assert_same(again, first)
+
+    # 修改11使其不再与10重合，删除12使13的端点悬挂，新增15与14部分重合
+    data = lines()
+    data.loc[1, 'geometry'] = shapely.LineString([(5, 4), (9, 0)])
+    data = data.drop(index=2)
+    data.loc[5] = [15, shapely.LineString([(20, 3), (20, 8)])]
+    data.to_file(path)
+    report = validator.validate(tolerance=0.5)
+    assert report['added'].tolist() == [15]
+    assert report['changed'].tolist() == [11]
+    assert report['deleted'].tolist() == [12]
+    assert report['line_intersections'].tolist() == [[14, 15]]
+    assert_same(report, full_run(path, tmp_path, id_column='key', tolerance=0.5))
+
+
+def test_polygon_round_trip(tmp_path):
+    path = str(tmp_path / 'polygons.gpkg')
+    polygons().to_file(path)
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'state.npz'), id_column='key')
+    assert validator.validate()['overlaps'].tolist() == [[10, 11]]
+
+    # 修改11消除重叠，删除13，新增与12重叠的14
+    data = polygons()
+    data.loc[1, 'geometry'] = shapely.box(2, 0, 2.5, 2)
+    data = data.drop(index=3)
+    data.loc[4] = [14, shapely.box(4, 0, 6, 2)]
+    data.to_file(path)
+    report = validator.validate()
+    assert report['overlaps'].tolist() == [[12, 14]]
+    assert_same(report, full_run(path, tmp_path, id_column='key'))
+
+
+def test_changed_tolerance_rechecks_everything(tmp_path):
+    path = str(tmp_path / 'lines.shp')
+    lines().to_file(path)
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'state.npz'), id_column='key')
+    validator.validate(tolerance=0.5)
+    report = validator.validate(tolerance=1.0)
+    assert report['rechecked'] == 5
+    assert_same(report, full_run(path, tmp_path, id_column='key', tolerance=1.0))
+
+
+def test_fid_path_with_stable_fids(tmp_path):
+    path = str(tmp_path / 'lines.shp')
+    lines().to_file(path)
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'state.npz'))
+    first = validator.validate(tolerance=0.5)
+    assert first['line_intersections'].tolist() == [[0, 1]]
+
+    # 不删除要素时FID保持不变，只有修改和追加的要素被识别为变化
+    data = lines()
+    data.loc[3, 'geometry'] = shapely.LineString([(12, 0), (14, 3)])
+    data.loc[5] = [15, shapely.LineString([(20, 3), (20, 8)])]
+    data.to_file(path)
+    report = validator.validate(tolerance=0.5)
+    assert report['added'].tolist() == [5]
+    assert report['changed'].tolist() == [3]
+    assert report['deleted'].tolist() == []
+    assert report['line_intersections'].tolist() == [[0, 1], [4, 5]]
+    assert_same(report, full_run(path, tmp_path, tolerance=0.5))
+
+
+def test_fid_path_after_repacked_shapefile(tmp_path):
+    path = str(tmp_path / 'lines.shp')
+    lines().to_file(path)
+    validator = IncrementalValidator(path, state_path=str(tmp_path / 'state.npz'))
+    validator.validate(tolerance=0.5)
+
+    # 删除第一个要素后重新写入的shp中其后要素的FID前移，被识别为修改，但检查结果仍与全量检查一致
+    lines().drop(index=0).to_file(path)
+    report = validator.validate(tolerance=0.5)
+    assert report['deleted'].tolist() == [4]
+    assert report['changed'].tolist() == [0, 1, 2, 3]
+    assert report['line_intersections'].tolist() == []
+    assert_same(report, full_run(path, tmp_path, tolerance=0.5))
@@ -0,0 +1,56 @@
+import zipfile
+
+import geopandas as gpd
+import pytest
+import shapely
+
+from data_verification.geo.boundary import BoundaryIndex
+from data_verification.geo.geo import PolygonTopologyValidator
+from data_verification.geo.layer import LayerCache, as_layer
+
+pytest.importorskip('pyogrio')
+
+
+@pytest.fixture
+def shapefile(tmp_path):
+    path = tmp_path / 'polygons.shp'
+    gpd.GeoDataFrame({'name': ['a', 'b']}, geometry=[shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1)]).to_file(path)
+    return path
+
+
+@pytest.fixture
+def zipped(shapefile, tmp_path):
+    archive = tmp_path / 'polygons.zip'
+    with zipfile.ZipFile(archive, 'w') as file:
+        for part in shapefile.parent.glob('polygons.*'):
+            file.write(part, part.name)
+    return f'/vsizip/{archive}/polygons.shp'
+
+
+def test_validator_keeps_attribute_columns(shapefile):
+    validator = PolygonTopologyValidator(str(shapefile), boundary_file_path=str(shapefile))
+    assert validator.polygons['name'].tolist() == ['a', 'b']
+    assert 'name' in validator.boundary_polygons.columns
+
+
+def test_geometry_only_is_opt_in(shapefile):
+    assert list(as_layer(shapefile).columns) == ['name', 'geometry']
+    assert list(as_layer(shapefile, geometry_only=True).columns) == ['geometry']
+
+
+def test_local_files_are_cached(shapefile):
+    cache = LayerCache()
+    assert cache.get(str(shapefile)) is cache.get(str(shapefile))
+    assert cache.stats()['size'] == 1
+
+
+def test_virtual_paths_are_read_without_caching(zipped):
+    cache = LayerCache()
+    layer = cache.get(zipped)
+    assert layer['name'].tolist() == ['a', 'b']
+    assert cache.stats()['size'] == 0
+
+
+def test_boundary_from_virtual_path(zipped):
+    index = BoundaryIndex.from_source(zipped)
+    assert index.within([shapely.Point(0.5, 0.5), shapely.Point(5, 5)]).tolist() == [True, False]
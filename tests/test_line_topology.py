@@ -0,0 +1,27 @@
+import numpy as np
+import shapely
+
+from data_verification.geo.geo import LineTopologyValidator
+from data_verification.geo.topology import dangling_nodes
+
+
+def test_connected_lines_are_not_dangling():
+    # 闭合的三角形路网，每个端点都被两条线使用
+    lines = shapely.linestrings([[[0, 0], [1, 0]], [[1, 0], [0, 1]], [[0, 1], [0, 0]], [[5, 5], [6, 6]]])
+    result = LineTopologyValidator(lines).check_specific_line_batch([0, 1, 2, 3])
+    assert result['has_dangling_nodes'].tolist() == [False, False, False, True]
+    assert LineTopologyValidator(lines).check_specific_line(0)
+
+
+def test_specific_dangling_nodes_match_whole_layer():
+    rng = np.random.default_rng(0)
+    points = np.round(rng.uniform(0, 20, (300, 2)))
+    ends = rng.integers(0, 300, (400, 2))
+    lines = shapely.linestrings(np.stack([points[ends[:, 0]], points[ends[:, 1]]], axis=1))
+    lines = lines[shapely.length(lines) > 0]
+    expected = np.zeros(lines.shape[0], dtype=bool)
+    expected[dangling_nodes(lines)[1]] = True
+    validator = LineTopologyValidator(lines)
+    positions = rng.permutation(lines.shape[0])[:100]
+    result = validator.check_specific_line_batch(positions)
+    assert result['has_dangling_nodes'].tolist() == expected[positions].tolist()
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_verification.public.parallel import ParallelExecutor, split_chunks
+from data_verification.public.schema import resolve_method
+
+# (方法名, 参数, 被验证值)，值中混合数值、字符串和空值
+CASES = [
+    ('verify_timestamp', {}, [1700000000, 5, '1700000000', 'abc', 1.5, None]),
+    ('timestamp_range', {'start_timestamp': 0, 'end_timestamp': 10}, [5, 50, 0, 10.0, -1]),
+    ('number_range', {'min_value': 0, 'max_value': 10}, [5, '5', 50, 2.5, None]),
+    ('verify_global_latitude', {}, [30, 100, -90.0, 45.5]),
+    ('check_precision', {'decimal_places': 1}, [1.5, 1.25, '2.5', 3]),
+    ('verify_email_format', {}, ['a@b.com', 123, 'abc', None]),
+    ('regex', {'pattern': r'\d+'}, ['123', 123, 'abc']),
+]
+
+
+def scalar_results(method, kwargs, values):
+    scalar, _ = resolve_method(method)
+    results = []
+    for value in values:
+        try:
+            results.append(scalar(value, **kwargs) is True)
+        except (TypeError, ValueError, AttributeError):
+            results.append(False)
+    return results
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ParallelExecutor(max_workers=2, chunksize=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize('method, kwargs, values', CASES)
+def test_map_matches_scalar(executor, method, kwargs, values):
+    expected = scalar_results(method, kwargs, values)
+    assert executor.map(method, values, **kwargs).tolist() == expected
+    assert ParallelExecutor(max_workers=1).map(method, values, **kwargs).tolist() == expected
+
+
+@pytest.mark.parametrize('dtype', ['int64', 'float64'])
+def test_map_numeric_array_matches_scalar(executor, dtype):
+    values = np.array([5, 50, 0, 10], dtype=dtype)
+    kwargs = {'start_timestamp': 0, 'end_timestamp': 10}
+    expected = scalar_results('timestamp_range', kwargs, values.tolist())
+    assert executor.map('timestamp_range', values, **kwargs).tolist() == expected
+    assert executor.map('timestamp_range', pd.Series(values), **kwargs).tolist() == expected
+
+
+def test_validate_numeric_columns(executor):
+    df = pd.DataFrame({'ts': [1700000000, 5, -1], 'lat': [30.0, 100.0, 45.0]})
+    results, summary = executor.validate({'ts': ['verify_timestamp'], 'lat': ['verify_global_latitude']}, df)
+    assert results['ts:verify_timestamp'].tolist() == scalar_results('verify_timestamp', {}, df['ts'].tolist())
+    assert results['lat:verify_global_latitude'].tolist() == [True, False, True]
+    assert summary['passed'].tolist() == [int(results['ts:verify_timestamp'].sum()), 2]
+
+
+def test_split_chunks_keeps_python_types():
+    shards = split_chunks([1, 'a', 2.5], 2)
+    assert [value for shard in shards for value in shard] == [1, 'a', 2.5]
+    assert [type(value) for shard in shards for value in shard] == [int, str, float]
+    assert type(split_chunks(np.arange(3), 10)[0][0]) is int
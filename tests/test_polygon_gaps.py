@@ -0,0 +1,66 @@
+import numpy as np
+import shapely
+
+from data_verification.geo.geo import PolygonTopologyValidator
+from data_verification.geo.topology import coverage_gaps, polygon_gap_flags
+
+
+def grid(size=4, skip=()):
+    return np.array([shapely.box(x, y, x + 1, y + 1) for x in range(size) for y in range(size) if (x, y) not in skip])
+
+
+def holed():
+    return shapely.box(0, 0, 3, 3).difference(shapely.box(1, 1, 2, 2))
+
+
+def test_edge_polygons_of_full_grid_have_no_gaps():
+    polygons = grid()
+    assert polygon_gap_flags(polygons, np.arange(len(polygons))).tolist() == [False] * len(polygons)
+    result = PolygonTopologyValidator(polygons).check_specific_polygon_batch(range(len(polygons)))
+    assert not result['has_gaps'].any()
+    assert result['valid'].all()
+
+
+def test_flags_match_coverage_gaps():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 30, (200, 2))
+    polygons = shapely.box(corners[:, 0], corners[:, 1], corners[:, 0] + 3, corners[:, 1] + 3)
+    _, pairs = coverage_gaps(polygons)
+    expected = np.zeros(len(polygons), dtype=bool)
+    expected[pairs[:, 1]] = True
+    assert np.array_equal(polygon_gap_flags(polygons, np.arange(len(polygons))), expected)
+    subset = np.arange(0, len(polygons), 7)
+    assert np.array_equal(polygon_gap_flags(polygons, subset), expected[subset])
+    validator = PolygonTopologyValidator(polygons)
+    single = [bool(validator.check_specific_polygon_batch([i])['has_gaps'].iloc[0]) for i in subset]
+    assert single == expected[subset].tolist()
+
+
+def test_polygons_around_missing_cell_have_gaps():
+    polygons = grid(skip={(1, 1)})
+    flags = polygon_gap_flags(polygons, np.arange(len(polygons)))
+    _, pairs = coverage_gaps(polygons)
+    assert np.flatnonzero(flags).tolist() == np.unique(pairs[:, 1]).tolist()
+
+
+def test_own_hole_is_gap_unless_holes_are_allowed():
+    polygons = [holed(), shapely.box(3, 0, 4, 3)]
+    assert polygon_gap_flags(polygons, [0, 1]).tolist() == [True, False]
+    assert polygon_gap_flags(polygons, [0, 1], allow_holes=True).tolist() == [False, False]
+    assert len(coverage_gaps(polygons)[0]) == 1
+    assert len(coverage_gaps(polygons, allow_holes=True)[0]) == 0
+
+
+def test_allow_holes_in_layer_checks():
+    validator = PolygonTopologyValidator([holed(), shapely.box(3, 0, 4, 3)])
+    assert not validator.check_polygon_topology_validity(fail_fast=False)
+    assert validator.check_polygon_topology_validity(allow_holes=True, fail_fast=False)
+    assert validator.check_specific_polygon(0, allow_holes=True)
+    assert not validator.check_specific_polygon(0)
+
+
+def test_gap_between_polygons_inside_hole_is_still_gap_without_allow_holes():
+    # 孔洞被另一多边形部分填充，剩余部分属于孔洞
+    polygons = [holed(), shapely.box(1, 1, 1.5, 2)]
+    assert len(coverage_gaps(polygons)[0]) == 1
+    assert len(coverage_gaps(polygons, allow_holes=True)[0]) == 0
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_verification.public.schema import Schema, resolve_method
+
+# 需要数值输入的方法：(方法名, 参数, 合法值, 不合法值)
+NUMERIC_RULES = [
+    ('number_range', {'min_value': 0, 'max_value': 10}, 5, 50),
+    ('check_precision', {'min_value': 0, 'max_value': 10}, 5, 50),
+    ('timestamp_range', {'start_timestamp': 0, 'end_timestamp': 10}, 5, 50),
+    ('verify_latitude', {'start_latitude_scope': 0, 'end_latitude_scope': 10}, 5, 50),
+    ('verify_longitude', {'start_longitude_scope': 0, 'end_longitude_scope': 10}, 5, 50),
+    ('verify_china_latitude', {}, 30, 60),
+    ('verify_china_longitude', {}, 100, 150),
+    ('verify_global_latitude', {}, 30, 100),
+    ('verify_global_longitude', {}, 100, 200),
+]
+
+
+@pytest.mark.parametrize('dtype', ['int64', 'float64'])
+@pytest.mark.parametrize('method, kwargs, valid, invalid', NUMERIC_RULES)
+def test_numeric_column(method, kwargs, valid, invalid, dtype):
+    df = pd.DataFrame({'value': np.array([valid, invalid], dtype=dtype)})
+    results, summary = Schema({'value': [(method, kwargs)]}).validate(df)
+    assert results.iloc[:, 0].tolist() == [True, False]
+    assert summary['passed'].tolist() == [1]
+
+
+@pytest.mark.parametrize('method, kwargs, valid, invalid', NUMERIC_RULES)
+def test_numeric_column_matches_scalar(method, kwargs, valid, invalid):
+    scalar, _ = resolve_method(method)
+    values = [valid, invalid, float(valid), float(invalid)]
+    results, _ = Schema({'value': [(method, kwargs)]}).validate(pd.DataFrame({'value': values}))
+    assert results.iloc[:, 0].tolist() == [scalar(value, **kwargs) is True for value in values]
+
+
+def test_integer_column_scalar_fallback():
+    # verify_timestamp没有批量方法，单值方法要求Python int
+    df = pd.DataFrame({'ts': [1700000000, 5]})
+    results, _ = Schema({'ts': ['verify_timestamp']}).validate(df)
+    assert results['ts:verify_timestamp'].tolist() == [True, True]
+
+
+def test_numpy_bool_result():
+    df = pd.DataFrame({'value': [1.0, -1.0]})
+    results, _ = Schema({'value': [lambda value: np.float64(value) > 0]}).validate(df)
+    assert results.iloc[:, 0].tolist() == [True, False]
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from data_verification.public.stream import StreamValidator
+
+RULES = {
+    'ts': [('timestamp_range', {'start_timestamp': 0, 'end_timestamp': 10})],
+    'lat': ['verify_global_latitude', ('verify_latitude', {'start_latitude_scope': 0, 'end_latitude_scope': 10})],
+    'amount': [('number_range', {'min_value': 0, 'max_value': 10})],
+    'code': [('regex', {'pattern': r'0\d+'})],
+}
+ROWS = [
+    {'ts': 5, 'lat': 5.5, 'amount': 1, 'code': '012'},
+    {'ts': 50, 'lat': 95.0, 'amount': 20, 'code': '012'},
+    {'ts': 7, 'lat': 20.25, 'amount': 3.5, 'code': 'x'},
+]
+PASSED = {'ts:timestamp_range': 2, 'lat:verify_global_latitude': 2, 'lat:verify_latitude': 1,
+          'amount:number_range': 2, 'code:regex': 2}
+
+
+@pytest.fixture(params=['csv', 'jsonl'])
+def stream_file(request, tmp_path):
+    path = tmp_path / f'data.{request.param}'
+    if request.param == 'csv':
+        lines = ['ts,lat,amount,code'] + [f"{row['ts']},{row['lat']},{row['amount']},{row['code']}" for row in ROWS]
+    else:
+        lines = [json.dumps(row) for row in ROWS]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 10])
+def test_numeric_columns(stream_file, chunksize):
+    totals, failures = StreamValidator(RULES, chunksize=chunksize).validate_file(stream_file, max_failures=5)
+    assert totals['passed'].to_dict() == PASSED
+    assert failures['ts:timestamp_range'] == [1]
+    assert failures['lat:verify_latitude'] == [1, 2]
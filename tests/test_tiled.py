@@ -0,0 +1,67 @@
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
+
+from data_verification.geo import layer
+from data_verification.geo.tiled import TiledValidator
+
+pytest.importorskip('pyarrow')
+pytest.importorskip('pyogrio')
+
+BBOX = (4.8, 0, 7.2, 1)
+
+
+def frame():
+    # 10个宽0.5的方块，第2个与第3个方块重叠（行号从0开始）
+    boxes = [shapely.box(i, 0, i + 0.5, 1) for i in range(10)]
+    boxes[3] = shapely.box(2.3, 0, 3.5, 1)
+    return gpd.GeoDataFrame({'value': range(10)}, geometry=boxes)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    data = frame()
+    paths = {'covering': tmp_path / 'covering.parquet', 'plain': tmp_path / 'plain.parquet',
+             'feather': tmp_path / 'layer.feather', 'shp': tmp_path / 'layer.shp'}
+    data.to_parquet(paths['covering'], write_covering_bbox=True)
+    data.to_parquet(paths['plain'])
+    data.to_feather(paths['feather'])
+    data.to_file(paths['shp'])
+    return {name: str(path) for name, path in paths.items()}
+
+
+@pytest.mark.parametrize('name', ['covering', 'plain', 'feather'])
+def test_bbox_read_keeps_row_numbers(paths, name):
+    data = layer.read_columnar_layer(paths[name], columns=['value'], bbox=BBOX)
+    assert data.index.tolist() == [5, 6, 7]
+    assert data['value'].tolist() == [5, 6, 7]
+
+
+def test_bbox_read_matches_gdal(paths):
+    columnar = layer.read_columnar_layer(paths['covering'], columns=[], bbox=BBOX)
+    gdal = layer.read_layer(paths['shp'], columns=[], fid_as_index=True, bbox=BBOX)
+    assert columnar.index.tolist() == gdal.index.tolist()
+
+
+@pytest.mark.parametrize('name', ['covering', 'plain', 'feather'])
+def test_columnar_layer_info(paths, name):
+    info = layer.columnar_layer_info(paths[name])
+    assert info['features'] == 10
+    assert info['total_bounds'] == (0.0, 0.0, 9.5, 1.0)
+    assert info['geometry_types'] == ['Polygon']
+    assert info['bbox_filter'] == (name == 'covering')
+
+
+def test_tiled_parquet_matches_shapefile(paths):
+    columnar = TiledValidator(paths['covering'], tile_size=3).validate()
+    gdal = TiledValidator(paths['shp'], tile_size=3).validate()
+    assert columnar['features'] == gdal['features'] == 10
+    assert np.array_equal(columnar['overlaps'], gdal['overlaps'])
+    assert columnar['overlaps'].tolist() == [[2, 3]]
+
+
+@pytest.mark.parametrize('name', ['plain', 'feather'])
+def test_tiled_rejects_columnar_without_covering(paths, name):
+    with pytest.raises(ValueError, match='write_covering_bbox'):
+        TiledValidator(paths[name])
@@ -0,0 +1,70 @@
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from data_verification.public.time import Time, TimeRange
+
+FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%d/%m/%Y %H:%M']
+# pandas接受而strptime拒绝的值，以及非补零等只有strptime接受的值
+EDGE_CASES = ['-2019-09-2', '-2019-09-02', '2036-10-19 05:02:60', '2036-10-19 05:02:61',
+              '2024-01-01 00:00:00.1234567', '2024-01-01 00:00:00.123456789', '2024-01-01 00:00:00.5', '2019-9-2',
+              '2019-09-02 1:2:3', '0999-01-01',
+              '2024-02-30', '2024-02-29', '2024-02-29 23:59:59.999999', '02/03/2024 10:60', '2/3/2024 9:05',
+              ' 2024-01-01', '2024-01-01 ', '20240101', '', None, 20240101]
+
+
+def fuzz(time_format, count=2000, seed=0):
+    """由合法时间随机替换或删除一个字符得到的值"""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        text = (datetime(2000, 1, 1) + timedelta(seconds=rng.randint(0, 10 ** 9),
+                                                 microseconds=rng.randint(0, 999999))).strftime(time_format)
+        position = rng.randrange(len(text))
+        if rng.random() < 0.7:
+            values.append(text[:position] + rng.choice('0123456789-:/. ') + text[position + 1:])
+        else:
+            values.append(text[:position] + text[position + 1:])
+    return values
+
+
+@pytest.mark.parametrize('time_format', FORMATS)
+def test_verify_date_batch_matches_scalar_on_edge_cases(time_format):
+    expected = [Time.verify_date(value, time_format) if isinstance(value, str) else False for value in EDGE_CASES]
+    assert Time.verify_date_batch(EDGE_CASES, time_format).tolist() == expected
+
+
+@pytest.mark.parametrize('time_format', FORMATS)
+def test_verify_date_batch_matches_scalar_on_fuzzed_values(time_format):
+    values = fuzz(time_format)
+    expected = np.array([Time.verify_date(value, time_format) for value in values])
+    assert np.array_equal(Time.verify_date_batch(values, time_format), expected)
+
+
+@pytest.mark.parametrize('time_format', FORMATS[1:] + ['ISO8601'])
+@pytest.mark.parametrize('pattern', [0, 3])
+def test_contains_batch_matches_scalar(time_format, pattern):
+    if time_format == 'ISO8601':
+        start, end = '2000-01-01', '2031-12-31T23:59:59'
+    else:
+        start, end = (datetime(2000, 1, 1).strftime(time_format), datetime(2031, 12, 31).strftime(time_format))
+    time_range = TimeRange(start, end, time_format, pattern)
+    values = EDGE_CASES + ['2024-05-05 10:00:60', '2024-05-05T10:00:00.1234567', '2024-5-5', '2024-05-05T10:00',
+                           '2024-05-05 10:00:00+08:00'] + fuzz(FORMATS[2] if time_format == 'ISO8601' else time_format)
+    expected = [time_range.contains(value) for value in values]
+    assert time_range.contains_batch(values).tolist() == expected
+
+
+def test_contains_batch_rejects_leap_second():
+    time_range = TimeRange('2024-01-01 00:00:00', '2024-12-31 00:00:00', '%Y-%m-%d %H:%M:%S')
+    values = ['2024-05-05 10:00:60', '2024-5-5 10:00:00']
+    assert time_range.contains_batch(values).tolist() == [False, True]
+    assert [Time.datetime_range(value, '2024-01-01 00:00:00', '2024-12-31 00:00:00', '%Y-%m-%d %H:%M:%S')
+            for value in values] == [False, True]
+
+
+def test_contains_batch_rejects_long_fraction():
+    time_range = TimeRange('2024-01-01 00:00:00.0', '2024-12-31 00:00:00.0', '%Y-%m-%d %H:%M:%S.%f')
+    assert time_range.contains_batch(['2024-05-05 10:00:00.1234567', '2024-05-05 10:00:00.5']).tolist() == [False, True]
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from data_verification.public.utils import as_str_array
+from data_verification.public.id_number import IDNumber
+
+
+def test_as_str_array_masks_non_strings():
+    assert as_str_array([123, 'abc', None, 1.5]).tolist() == ['', 'abc', '', '']
+    assert as_str_array(pd.Series(['a', 1])).tolist() == ['a', '']
+    assert as_str_array(np.array(['a', 'b'])).tolist() == ['a', 'b']
+    assert as_str_array([]).shape == (0,)
+
+
+def test_batch_rejects_integer_id_number():
+    # 与单值方法一致，非字符串元素视为不合法
+    id_number = '110105194912310011'
+    assert IDNumber.verify_id_number(id_number) is True
+    assert IDNumber.verify_id_number_batch([int(id_number), id_number]).tolist() == [False, True]
+
+
+def test_as_str_array_keeps_str_subclasses():
+    # 与USCC、组织机构代码等单值方法一致，str的子类（如object数组中的numpy.str_）视为字符串
+    class Code(str):
+        pass
+
+    values = np.array([np.str_('abc'), Code('def'), b'ghi'], dtype=object)
+    assert as_str_array(values).tolist() == ['abc', 'def', '']